@@ -283,11 +283,18 @@ async def entrypoint(ctx: JobContext):
                 
                 # 1. 통계 수집
                 stats = memory.get_session_stats()
+                # 클라이언트가 보낸 전경 창 체류 시간 (집중/딴짓 시간, 상위 앱)
+                dwell = packet.data.get("dwell") or {}
+                if dwell:
+                    stats["focused_seconds"] = dwell.get("focused_seconds", 0.0)
+                    stats["distracted_seconds"] = dwell.get("distracted_seconds", 0.0)
+                    stats["top_apps"] = dwell.get("top_apps", [])
                 
                 # 2. LLM 회고/한줄평 생성
                 review_system_prompt = f"""
                 You are {current_persona}. The user has finished their work session.
-                Review their performance based on the violation stats.
+                Review their performance based on the violation stats
+                (and the focused vs distracted screen time in seconds, if present).
                 
                 Stats:
                 {stats}
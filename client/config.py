@@ -17,7 +17,84 @@ class Config:
     # Room 설정
     ROOM_NAME = os.getenv('LIVEKIT_ROOM_NAME', 'procrastihator-room')
     PARTICIPANT_NAME = os.getenv('LIVEKIT_PARTICIPANT_NAME', 'client')
-    
+
+    # Vision 설정
+    # 캡처 + 추론을 별도 프로세스에서 실행 (UI/오디오와 GIL 경쟁 방지, 결과만 Pipe로 전달)
+    VISION_ISOLATED = os.getenv('VISION_ISOLATED', 'false').lower() in ('1', 'true', 'yes')
+    # 프레임 소스: 웹캠 인덱스(0) 또는 동영상 파일/이미지 폴더 경로 (오프라인 재생)
+    VISION_SOURCE = os.getenv('VISION_SOURCE', '0')
+    # 웹캠 캡처 설정 (0 또는 빈 값이면 드라이버 기본값): 해상도, FOURCC (예: MJPG), 드라이버 버퍼 프레임 수
+    CAMERA_WIDTH = int(os.getenv('CAMERA_WIDTH', '0'))
+    CAMERA_HEIGHT = int(os.getenv('CAMERA_HEIGHT', '0'))
+    CAMERA_FOURCC = os.getenv('CAMERA_FOURCC', '')
+    CAMERA_BUFFER_SIZE = int(os.getenv('CAMERA_BUFFER_SIZE', '0'))
+    # 웹캠 장애 복구: 연속 읽기 실패 N회 후 재연결, 재연결 시도 간격은 지수 백오프 (최대 MAX_BACKOFF초)
+    CAMERA_FAILURE_THRESHOLD = int(os.getenv('CAMERA_FAILURE_THRESHOLD', '5'))
+    CAMERA_MAX_BACKOFF = float(os.getenv('CAMERA_MAX_BACKOFF', '10.0'))
+    # FaceLandmarker 실행 모드: IMAGE (매 프레임 전체 검출) | VIDEO (추적 재사용) | LIVE_STREAM (비동기 콜백)
+    VISION_RUNNING_MODE = os.getenv('VISION_RUNNING_MODE', 'VIDEO').upper()
+    # 적응형 추론 주기: 안정 상태에서는 MIN_FPS, 감지 조건이 쌓이면 MAX_FPS
+    VISION_MIN_FPS = float(os.getenv('VISION_MIN_FPS', '3'))
+    VISION_MAX_FPS = float(os.getenv('VISION_MAX_FPS', '30'))
+    # 움직임 게이트: 축소 흑백 프레임의 변화 픽셀 비율이 CHANGED_RATIO 이하이면 랜드마크 추론 생략
+    # (PIXEL_DIFF: 변화로 볼 밝기 차이, REFRESH_SECONDS: 변화가 없어도 강제 추론하는 주기)
+    MOTION_GATE_ENABLED = os.getenv('MOTION_GATE_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    MOTION_GATE_CHANGED_RATIO = float(os.getenv('MOTION_GATE_CHANGED_RATIO', '0.01'))
+    MOTION_GATE_PIXEL_DIFF = int(os.getenv('MOTION_GATE_PIXEL_DIFF', '15'))
+    MOTION_GATE_REFRESH_SECONDS = float(os.getenv('MOTION_GATE_REFRESH_SECONDS', '1.0'))
+    # 두 눈 주변 영역도 따로 비교 (전체 축소 프레임에서는 몇 픽셀뿐인 눈 깜빡임을 놓치지 않도록)
+    MOTION_GATE_EYE_REGION = os.getenv('MOTION_GATE_EYE_REGION', 'true').lower() in ('1', 'true', 'yes')
+    # 얼굴 ROI: 마지막 얼굴 주변만 잘라 랜드마크 추론 (MARGIN: 얼굴 크기 대비 여백), 놓치면 전체 프레임 검출
+    VISION_ROI_ENABLED = os.getenv('VISION_ROI_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    VISION_ROI_MARGIN = float(os.getenv('VISION_ROI_MARGIN', '0.5'))
+    # 추론 입력 해상도 단계 (최대 너비 px, 쉼표 구분, 빈 값이면 축소 안 함)
+    # 추론 시간 중앙값이 BUDGET_MS를 넘으면 한 단계 낮추고 여유가 생기면 다시 올림
+    VISION_INPUT_WIDTHS = [int(w) for w in os.getenv('VISION_INPUT_WIDTHS', '1280,640,320').split(',') if w.strip()]
+    VISION_INFERENCE_BUDGET_MS = float(os.getenv('VISION_INFERENCE_BUDGET_MS', '25'))
+    # 얼굴 방향(시선 벗어남) 계산: heuristic (코-눈 오프셋 + 볼 z-depth) | matrix (FaceLandmarker 변환 행렬의 yaw/pitch/roll)
+    VISION_POSE_BACKEND = os.getenv('VISION_POSE_BACKEND', 'heuristic').lower()
+    # 졸음 지표: 최근 WINDOW초의 PERCLOS(눈 감은 시간 비율)가 DROWSY / VERY_DROWSY 기준 이상이면 졸음 단계 상승
+    DROWSINESS_WINDOW_SECONDS = float(os.getenv('DROWSINESS_WINDOW_SECONDS', '60'))
+    DROWSINESS_PERCLOS_DROWSY = float(os.getenv('DROWSINESS_PERCLOS_DROWSY', '0.15'))
+    DROWSINESS_PERCLOS_VERY_DROWSY = float(os.getenv('DROWSINESS_PERCLOS_VERY_DROWSY', '0.3'))
+    # 사용자별 임계값 보정: 세션 초반 얼굴이 보인 SECONDS초 동안 EAR/볼 z-depth 분포를 모아 임계값 계산
+    # 결과는 PROFILE_PATH에 저장되어 다음 실행부터 바로 적용 (파일을 지우면 다시 보정)
+    VISION_CALIBRATION_ENABLED = os.getenv('VISION_CALIBRATION_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    VISION_CALIBRATION_SECONDS = float(os.getenv('VISION_CALIBRATION_SECONDS', '60'))
+    VISION_PROFILE_PATH = os.getenv('VISION_PROFILE_PATH', str(Path.home() / '.procrastihator' / 'vision_profile.json'))
+    # 감지기 플러그인 스케줄링: 감지기별 최소 실행 간격 (초, "gaze=0.2,phone=0.5" 형식, 생략하면 매 프레임)
+    # 1회 실행 비용 중앙값이 BUDGET_MS를 넘으면 경고 (기본은 기록만)
+    # ENFORCE=true면 핵심 감지기(졸음/자리비움/시선/휴대폰)를 제외한 감지기를 끄고 REPROBE_SECONDS 뒤 재측정
+    VISION_DETECTOR_INTERVALS = {
+        name.strip(): float(value)
+        for name, value in (item.split('=', 1) for item in os.getenv('VISION_DETECTOR_INTERVALS', '').split(',') if '=' in item)
+    }
+    VISION_DETECTOR_BUDGET_MS = float(os.getenv('VISION_DETECTOR_BUDGET_MS', '2.0'))
+    VISION_DETECTOR_BUDGET_ENFORCE = os.getenv('VISION_DETECTOR_BUDGET_ENFORCE', 'false').lower() in ('1', 'true', 'yes')
+    VISION_DETECTOR_REPROBE_SECONDS = float(os.getenv('VISION_DETECTOR_REPROBE_SECONDS', '30'))
+    # 휴대폰 감지: 검사 주기(초)와 시간 투표 (WINDOW초 안에 HITS회 감지되면 PHONE_DETECTED)
+    PHONE_DETECT_INTERVAL = float(os.getenv('PHONE_DETECT_INTERVAL', '1.0'))
+    PHONE_VOTE_HITS = int(os.getenv('PHONE_VOTE_HITS', '2'))
+    PHONE_VOTE_WINDOW = float(os.getenv('PHONE_VOTE_WINDOW', '3.0'))
+    # 디버그 영상 스트림 (디버그 창이 보일 때만 생성): 최대 FPS와 축소 너비(px)
+    DEBUG_STREAM_FPS = float(os.getenv('DEBUG_STREAM_FPS', '10'))
+    DEBUG_STREAM_WIDTH = int(os.getenv('DEBUG_STREAM_WIDTH', '640'))
+
+    # Screen 설정
+    # 플랫폼 백엔드: auto (windows -> x11) | windows | x11
+    SCREEN_BACKEND = os.getenv('SCREEN_BACKEND', 'auto').lower()
+    # 활성 창 감지: 이벤트 훅 우선 (포커스/제목 변경 이벤트), 훅 모드에서는 POLL_INTERVAL초마다 안전망 폴링
+    # 훅을 쓸 수 없으면 FALLBACK_POLL_INTERVAL초마다 폴링
+    SCREEN_EVENT_HOOK = os.getenv('SCREEN_EVENT_HOOK', 'true').lower() in ('1', 'true', 'yes')
+    SCREEN_POLL_INTERVAL = float(os.getenv('SCREEN_POLL_INTERVAL', '1.0'))
+    SCREEN_FALLBACK_POLL_INTERVAL = float(os.getenv('SCREEN_FALLBACK_POLL_INTERVAL', '0.05'))
+    # 제목 변화 묶기: 배지/재생 시간/터미널 명령 등 같은 창 안의 제목 변화는 WINDOW_CHANGE로 보내지 않음
+    # 정규화된 (제목, 프로세스)가 바뀌고 SETTLE_SECONDS 동안 유지되면 발송 (0이면 즉시)
+    SCREEN_TITLE_COALESCE = os.getenv('SCREEN_TITLE_COALESCE', 'true').lower() in ('1', 'true', 'yes')
+    SCREEN_TITLE_SETTLE_SECONDS = float(os.getenv('SCREEN_TITLE_SETTLE_SECONDS', '0.3'))
+    # 프로세스 메타데이터 캐시 크기 ((pid, create_time) 키 LRU)
+    SCREEN_PROCESS_CACHE_SIZE = int(os.getenv('SCREEN_PROCESS_CACHE_SIZE', '64'))
+
     @classmethod
     def validate(cls):
         """필수 설정값 검증"""
@@ -0,0 +1,190 @@
+"""
+Headless Sensor Daemon
+----------------------
+Runs the Vision/Screen sensors without Qt and streams every detection Packet as one JSON line
+(Packet.to_json) to stdout or to clients of a UNIX socket.
+
+    python client/headless.py                          # JSONL on stdout, logs on stderr
+    python client/headless.py --socket /tmp/procrastihator.sock
+    python client/headless.py --no-screen --source recording.mp4 --duration 60
+    python client/headless.py --no-vision --screen-timeline titles.json   # replay window titles (no desktop needed)
+
+When streaming to stdout, all log output (print) is redirected to stderr so stdout stays pure JSONL.
+On exit the vision pipeline stats are written to stderr (useful for profiling without the GUI).
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+
+# 프로젝트 루트 경로를 sys.path에 추가하여 모듈 import가 가능하게 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+
+class StdoutSink:
+    """JSONL -> stdout (one line per packet, flushed immediately)"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def write(self, line):
+        with self._lock:
+            try:
+                self.stream.write(line + "\n")
+                self.stream.flush()
+            except (BrokenPipeError, ValueError):
+                # 읽는 쪽이 닫힘 (예: head로 파이프) - 이후 패킷은 버림
+                pass
+
+    def close(self):
+        pass
+
+
+class UnixSocketSink:
+    """JSONL -> UNIX socket server (every connected client receives every packet)"""
+
+    SEND_TIMEOUT = 1.0  # 느린 클라이언트가 센서 스레드를 오래 막지 않도록 (초과하면 연결 끊음)
+
+    def __init__(self, path):
+        if not hasattr(socket, "AF_UNIX"):
+            raise RuntimeError("UNIX socket is not supported on this platform")
+        self.path = path
+        if os.path.exists(path):
+            os.remove(path)  # 이전 실행이 남긴 소켓 파일
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(path)
+        self._server.listen()
+        self._server.settimeout(0.5)
+        self._clients = []
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._accept_thread = threading.Thread(target=self._accept_loop, name="JsonlAccept", daemon=True)
+        self._accept_thread.start()
+        print(f"[OK] Streaming packets to UNIX socket: {path}")
+
+    def _accept_loop(self):
+        while not self._closed.is_set():
+            try:
+                client, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            client.settimeout(self.SEND_TIMEOUT)
+            with self._lock:
+                self._clients.append(client)
+            print(f"[OK] JSONL client connected ({len(self._clients)} total)")
+
+    def write(self, line):
+        data = (line + "\n").encode("utf-8")
+        with self._lock:
+            for client in list(self._clients):
+                try:
+                    client.sendall(data)
+                except OSError:
+                    self._clients.remove(client)
+                    client.close()
+                    print(f"[WARNING] JSONL client disconnected ({len(self._clients)} left)")
+
+    def close(self):
+        self._closed.set()
+        self._server.close()
+        self._accept_thread.join(timeout=1.0)
+        with self._lock:
+            for client in self._clients:
+                client.close()
+            self._clients.clear()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ProcrastiHator headless sensor daemon (JSONL)")
+    parser.add_argument("--socket", dest="socket_path", default=None,
+                        help="Serve JSONL on this UNIX socket path instead of stdout")
+    parser.add_argument("--no-vision", action="store_true", help="Do not run the vision sensor")
+    parser.add_argument("--no-screen", action="store_true", help="Do not run the screen sensor")
+    parser.add_argument("--source", default=None,
+                        help="Vision frame source: webcam index or video file/image folder (default: Config.VISION_SOURCE)")
+    parser.add_argument("--screen-timeline", default=None,
+                        help="Replay window titles from this JSON timeline instead of the desktop ([[seconds, title], ...])")
+    parser.add_argument("--duration", type=float, default=None, help="Stop after this many seconds")
+    args = parser.parse_args()
+
+    if args.socket_path:
+        sink = UnixSocketSink(args.socket_path)
+    else:
+        # stdout is reserved for JSONL - route every log print() to stderr
+        sink = StdoutSink(sys.stdout)
+        sys.stdout = sys.stderr
+
+    # Sensors are imported after the stdout redirect so their import-time logs stay off the JSONL stream
+    from client.services.vision import VisionSensor
+    from client.services.screen import ScreenSensor
+
+    def publish(packet):
+        sink.write(packet.to_json())
+
+    sensors = []
+    if not args.no_vision:
+        vision_sensor = VisionSensor(source=args.source)
+        vision_sensor.alert_signal.connect(publish)
+        vision_sensor.camera_status_signal.connect(
+            lambda status, message: print(f"[VISION] Camera {status}: {message}"))
+        sensors.append(vision_sensor)
+    if not args.no_screen:
+        backend = None
+        if args.screen_timeline:
+            from client.services.screen_backends import FakeScreenBackend
+            backend = FakeScreenBackend.from_file(args.screen_timeline)
+        screen_sensor = ScreenSensor(backend=backend)
+        screen_sensor.alert_signal.connect(publish)
+        sensors.append(screen_sensor)
+    if not sensors:
+        print("[ERROR] No sensors enabled")
+        return 1
+
+    stop_event = threading.Event()
+
+    def request_stop(signum, frame):
+        print(f"\n[OK] Signal {signum} received, stopping sensors...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    for sensor in sensors:
+        sensor.start()
+    print(f"[OK] Headless sensors running: {', '.join(sensor.name for sensor in sensors)}")
+
+    started = time.monotonic()
+    try:
+        while not stop_event.wait(0.2):
+            if args.duration is not None and time.monotonic() - started >= args.duration:
+                break
+            if not any(sensor.isRunning() for sensor in sensors):
+                # 녹화본 재생이 끝났거나 모든 센서가 종료됨
+                break
+    finally:
+        for sensor in sensors:
+            sensor.stop()
+        sink.close()
+        if not args.no_vision:
+            stats = vision_sensor.get_pipeline_stats()
+            print(f"[VISION] Final pipeline stats: {json.dumps(stats, ensure_ascii=False, default=str)}")
+            vision_sensor.close()
+        print("[OK] Headless sensors stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,12 +14,15 @@ project_root = os.path.dirname(current_dir)
 if project_root not in sys.path:
     sys.path.append(project_root)
 
+# 시작 시간 계측 (무거운 import보다 먼저)
+from client.services.startup import startup_timer
+
 from client.ui.main_window import MainWindow
 from client.ui.debug_window import DebugWindow
 from client.ui.floating_widget import FloatingWidget
-from client.services.vision import VisionWorker
+from client.services.qt_workers import VisionWorker, ScreenWorker  # Qt adapters around the headless sensors
+from client.services.vision_process import VisionProcessWorker
 from client.services.livekit_client import LiveKitClient
-from client.services.screen import ScreenWorker # Import ScreenWorker
 from client.services.stats import SessionStats
 from client.config import Config
 #from shared.context import * # Assuming... wait, better be explicit
@@ -28,7 +31,9 @@ from shared.constants import SystemEvents, PacketCategory, VisionEvents, ScreenE
 from dotenv import load_dotenv
 import keyboard
 import time
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+
+startup_timer.mark("imports")
 
 class GlobalKeyManager(QObject):
     """
@@ -94,12 +99,19 @@ def main():
     # 3. 서비스 인스턴스 생성 (아직 시작하지 않음)
     try:
         livekit_client = LiveKitClient()
-        # show_debug_window=True: VisionWorker가 처리한 프레임을 시그널로 방출하게 함
         # 세션 통계 매니저 생성
         session_stats = SessionStats()
-        vision_worker = VisionWorker(show_debug_window=True)
+        # 디버그 프레임은 디버그 창이 보일 때만 생성 (아래 visibility_changed 연결)
+        # VisionWorker는 모델을 백그라운드에서 로딩/워밍업하므로 창 표시를 막지 않음 (세션 시작 시 완료 대기)
+        # VISION_ISOLATED: 캡처/추론을 별도 프로세스에서 실행 (같은 시그널 인터페이스)
+        if Config.VISION_ISOLATED:
+            vision_worker = VisionProcessWorker(show_debug_window=False)
+        else:
+            vision_worker = VisionWorker(show_debug_window=False)
         # 스크린 워커 생성
         screen_worker = ScreenWorker()
+        # Foreground dwell time (focused vs distracted seconds) comes from the screen sensor
+        session_stats.attach_dwell(screen_worker.dwell)
     except Exception as e:
         print(f"❌ Service Initialization Error: {e}")
         return
@@ -167,8 +179,12 @@ def main():
     screen_worker.alert_signal.connect(lambda p: print(f"🖥️ Screen Event: {p.event} - {p.data.get('window_title','Unknown')}"))
     screen_worker.alert_signal.connect(update_floating_mood)
     
-    # (2) VisionWorker 프레임 -> DebugWindow (화면 표시)
-    vision_worker.debug_frame_signal.connect(debug_window.update_image)
+    # (2) VisionWorker 프레임 -> DebugWindow (최신 프레임 슬롯을 창의 타이머로 폴링)
+    debug_window.set_frame_source(vision_worker.debug_frames)
+    # 디버그 창이 보일 때만 VisionWorker가 디버그 프레임을 그리고 송출
+    debug_window.visibility_changed.connect(vision_worker.set_debug_enabled)
+    # 카메라 연결/끊김 상태 -> DebugWindow 안내 문구 (재연결은 VisionWorker가 자동으로 시도)
+    vision_worker.camera_status_signal.connect(debug_window.set_camera_status)
 
     # (3) LiveKit 상태 -> 로그 출력
     livekit_client.connected_signal.connect(lambda: print("✅ LiveKit Connected!"))
@@ -245,9 +261,10 @@ def main():
         
         # 1. 종료 패킷 전송 (Agent가 통계 정리하고 리뷰 생성하도록 요청)
         if livekit_client.is_connected():
+            # Dwell totals are running sums, so this is cheap even for long sessions
             end_packet = Packet(
                 event=SystemEvents.SESSION_END,
-                data={},
+                data={"dwell": session_stats.get_dwell_summary()},
                 meta=PacketMeta(category=PacketCategory.SYSTEM)
             )
             livekit_client.send_packet(end_packet)
@@ -298,7 +315,8 @@ def main():
             "duration_seconds": current_duration,
             "counts": stats.get("violation_counts", {}), # Agent가 보낸 위반 횟수 딕셔너리
             "review": review,
-            "total_violations": stats.get("total_violations", 0)
+            "total_violations": stats.get("total_violations", 0),
+            "dwell": session_stats.get_dwell_summary()
         }
         
         # 3. 통계 UI 표시
@@ -380,6 +398,8 @@ def main():
     # 7. 초기 화면 표시
     print("✨ Client Ready. Press 'Alt+A' to start/stop session, 'Alt+B' to toggle debug view, 'Alt+P' to pause/resume, 'Alt+S' to talk.")
     main_window.show()
+    # 이벤트 루프가 첫 창을 실제로 그린 뒤 기록
+    QTimer.singleShot(0, lambda: startup_timer.mark("first_window_shown"))
 
     # 8. 메인 루프 실행
     exit_code = app.exec()
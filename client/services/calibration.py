@@ -0,0 +1,285 @@
+# client/services/calibration.py
+"""
+사용자별 Vision 임계값 보정 (Calibration)
+
+EAR_THRESHOLD(0.25)와 볼 z-depth/거리 비율 임계값은 평균적인 얼굴과 정면 카메라 기준이라
+눈이 가는 사용자는 SLEEPING, 카메라가 옆에 달린 환경은 GAZE_AWAY가 계속 발생한다.
+세션 초반 얼굴이 보이는 동안(기본 60초) 특징 분포를 스트리밍 분위수 추정기(P², 분위수당 마커 5개)로
+고정 메모리에 모으고, 분포에서 사용자별 임계값을 계산해 로컬 JSON 프로필로 저장한다.
+다음 실행부터는 저장된 프로필을 불러와 바로 적용한다 (다시 보정하려면 recalibrate() 또는 프로필 삭제).
+
+[임계값 계산] (오탐을 줄이는 방향으로만 조정 - 기본값보다 엄격해지지 않음, 상한으로 클램프)
+    EAR_THRESHOLD                = EAR 중앙값 x EAR_RATIO           (눈을 뜬 평소 EAR 기준)
+    CHEEK_Z_DIFF_PASS_THRESHOLD  = 볼 z 차이 중앙값 + PASS_MARGIN     (평소 자세는 무조건 통과)
+    CHEEK_Z_DEPTH_THRESHOLD      = 볼 z 차이 p95 + DEPTH_MARGIN
+    CHEEK_POSITION_THRESHOLD     = 코-볼 거리 비대칭 p95 + POSITION_MARGIN
+    CHEEK_NOSE_Z_THRESHOLD       = 볼-코 z 차이(큰 쪽) p95 + NOSE_Z_MARGIN
+    GAZE_PITCH_BASELINE / GAZE_YAW_BASELINE = pitch / yaw 중앙값 (matrix 백엔드의 평소 자세, 범위로 클램프)
+보정 중 잠깐 다른 곳을 본 프레임은 p95와 여유값, 상한이 흡수한다.
+yaw/pitch 값의 의미는 pose 백엔드마다 다르므로 프로필에 백엔드를 기록하고, 다르면 다시 보정한다.
+"""
+
+import json
+import os
+import time
+
+# 보정 대상 특징 -> 추정할 분위수
+CALIBRATION_QUANTILES = {
+    "ear": (0.5,),
+    "cheek_z_diff": (0.5, 0.95),
+    "cheek_distance_ratio": (0.95,),
+    "cheek_nose_z": (0.95,),
+    "pitch": (0.5,),
+    "yaw": (0.5,),
+}
+
+EAR_RATIO = 0.75
+PASS_MARGIN = 0.01
+DEPTH_MARGIN = 0.04
+POSITION_MARGIN = 0.1
+NOSE_Z_MARGIN = 0.04
+
+# 임계값 이름 -> (최소, 최대) 허용 범위
+THRESHOLD_LIMITS = {
+    "EAR_THRESHOLD": (0.12, 0.35),
+    "CHEEK_Z_DIFF_PASS_THRESHOLD": (0.0, 0.08),
+    "CHEEK_Z_DEPTH_THRESHOLD": (0.0, 0.2),
+    "CHEEK_POSITION_THRESHOLD": (0.0, 0.5),
+    "CHEEK_NOSE_Z_THRESHOLD": (0.0, 0.25),
+    "GAZE_PITCH_BASELINE": (-30.0, 30.0),
+    "GAZE_YAW_BASELINE": (-30.0, 30.0),
+}
+
+PROFILE_VERSION = 2
+
+
+class P2Quantile:
+    """
+    P² 스트리밍 분위수 추정 (Jain & Chlamtac, 1985)
+    샘플을 저장하지 않고 마커 5개(최소, q/2, q, (1+q)/2, 최대)의 높이/위치만 갱신한다.
+    """
+
+    def __init__(self, q):
+        if not 0.0 < q < 1.0:
+            raise ValueError(f"분위수는 0과 1 사이여야 합니다: {q}")
+        self.q = q
+        self.count = 0
+        self._heights = []  # 마커 높이 (처음 5개는 샘플 그대로)
+        self._positions = [0, 1, 2, 3, 4]  # 실제 마커 위치
+        self._desired = [0.0, 2 * q, 4 * q, 2 + 2 * q, 4.0]  # 이상적인 마커 위치
+        self._increments = [0.0, q / 2, q, (1 + q) / 2, 1.0]
+
+    def add(self, x):
+        self.count += 1
+        h = self._heights
+        if len(h) < 5:
+            h.append(x)
+            h.sort()
+            return
+
+        # x가 들어갈 구간 찾기 (양 끝 마커는 최소/최대로 갱신)
+        if x < h[0]:
+            h[0] = x
+            k = 0
+        elif x >= h[4]:
+            h[4] = x
+            k = 3
+        else:
+            k = 0
+            while k < 3 and x >= h[k + 1]:
+                k += 1
+        n = self._positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # 가운데 마커 3개를 이상적인 위치 쪽으로 한 칸씩 이동 (포물선 보간, 어긋나면 선형)
+        for i in (1, 2, 3):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = h[i] + step / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not h[i - 1] < candidate < h[i + 1]:
+                    candidate = h[i] + step * (h[i + step] - h[i]) / (n[i + step] - n[i])
+                h[i] = candidate
+                n[i] += step
+
+    @property
+    def value(self):
+        """현재 분위수 추정값 (샘플이 없으면 None)"""
+        if not self._heights:
+            return None
+        if self.count <= 5:
+            index = min(len(self._heights) - 1, int(round(self.q * (len(self._heights) - 1))))
+            return self._heights[index]
+        return self._heights[2]
+
+
+def derive_thresholds(quantiles, defaults):
+    """
+    분위수 -> 사용자별 임계값 (기본값보다 엄격해지지 않음)
+    :param quantiles: {"ear": {0.5: ...}, "cheek_z_diff": {0.5: ..., 0.95: ...}, ...}
+    :param defaults: 임계값 이름 -> 기본값 (VisionWorker 속성값)
+    """
+    derived = {
+        "EAR_THRESHOLD": min(defaults["EAR_THRESHOLD"], quantiles["ear"][0.5] * EAR_RATIO),
+        "CHEEK_Z_DIFF_PASS_THRESHOLD": max(defaults["CHEEK_Z_DIFF_PASS_THRESHOLD"],
+                                           quantiles["cheek_z_diff"][0.5] + PASS_MARGIN),
+        "CHEEK_Z_DEPTH_THRESHOLD": max(defaults["CHEEK_Z_DEPTH_THRESHOLD"],
+                                       quantiles["cheek_z_diff"][0.95] + DEPTH_MARGIN),
+        "CHEEK_POSITION_THRESHOLD": max(defaults["CHEEK_POSITION_THRESHOLD"],
+                                        quantiles["cheek_distance_ratio"][0.95] + POSITION_MARGIN),
+        "CHEEK_NOSE_Z_THRESHOLD": max(defaults["CHEEK_NOSE_Z_THRESHOLD"],
+                                      quantiles["cheek_nose_z"][0.95] + NOSE_Z_MARGIN),
+        "GAZE_PITCH_BASELINE": quantiles["pitch"][0.5],
+        "GAZE_YAW_BASELINE": quantiles["yaw"][0.5],
+    }
+    for name, value in derived.items():
+        low, high = THRESHOLD_LIMITS[name]
+        # 범위가 기본값을 벗어나지 않도록 (기본값은 항상 허용)
+        low, high = min(low, defaults[name]), max(high, defaults[name])
+        derived[name] = round(min(max(value, low), high), 4)
+    return derived
+
+
+class VisionCalibrator:
+    """세션 초반 특징 분포 수집 -> 임계값 계산 -> 프로필 저장/불러오기"""
+
+    def __init__(self, profile_path, duration_seconds=60.0, min_samples=100, max_gap=1.0, pose_backend="heuristic"):
+        """
+        :param profile_path: 프로필 JSON 경로 (None이면 저장하지 않음)
+        :param pose_backend: yaw/pitch를 계산한 pose 백엔드 (프로필에 기록, 다르면 불러오지 않음)
+        :param duration_seconds: 얼굴이 보인 시간 기준 보정 기간 (초)
+        :param min_samples: 보정 완료에 필요한 최소 샘플 수
+        :param max_gap: 샘플 간격 상한 (초) - 얼굴을 놓친 구간은 보정 시간에 넣지 않음
+        """
+        self.profile_path = profile_path
+        self.duration_seconds = duration_seconds
+        self.min_samples = min_samples
+        self.max_gap = max_gap
+        self.pose_backend = pose_backend
+        self.thresholds = None  # 보정 완료(또는 불러온) 임계값 - None이면 보정 중
+        self.reset()
+
+    @property
+    def calibrated(self):
+        return self.thresholds is not None
+
+    @property
+    def progress(self):
+        """보정 진행률 (0~1)"""
+        if self.calibrated:
+            return 1.0
+        return min(self._observed / self.duration_seconds, self.samples / self.min_samples, 1.0)
+
+    @property
+    def samples(self):
+        return self._estimators["ear"][0.5].count
+
+    def reset(self):
+        """보정 다시 시작 (분포 초기화, 적용 중인 임계값은 유지)"""
+        self._estimators = {
+            name: {q: P2Quantile(q) for q in qs} for name, qs in CALIBRATION_QUANTILES.items()
+        }
+        self._observed = 0.0
+        self._last_ts = None
+
+    def pause(self):
+        """얼굴을 놓침 - 다음 샘플까지의 간격은 보정 시간에 넣지 않음"""
+        self._last_ts = None
+
+    def update(self, features, timestamp, defaults):
+        """
+        얼굴 특징 1개 반영 (보정 중일 때만)
+        :param defaults: 임계값 기본값 (보정 완료 시 계산에 사용)
+        :return: 이번 샘플로 보정이 끝났으면 임계값 dict, 아니면 None
+        """
+        if self.calibrated:
+            return None
+        if self._last_ts is not None:
+            self._observed += min(max(0.0, timestamp - self._last_ts), self.max_gap)
+        self._last_ts = timestamp
+
+        values = {
+            "ear": features.avg_ear,
+            "cheek_z_diff": features.cheek_z_diff,
+            "cheek_distance_ratio": features.cheek_distance_ratio if features.cheek_distance_valid else 0.0,
+            "cheek_nose_z": max(features.left_cheek_nose_z, features.right_cheek_nose_z),
+            "pitch": features.pitch,
+            "yaw": features.yaw,
+        }
+        for name, estimators in self._estimators.items():
+            for estimator in estimators.values():
+                estimator.add(values[name])
+
+        if self._observed < self.duration_seconds or self.samples < self.min_samples:
+            return None
+        self.thresholds = derive_thresholds(self.quantiles(), defaults)
+        self.save()
+        return self.thresholds
+
+    def quantiles(self):
+        """현재 분위수 추정값 {특징: {분위수: 값}}"""
+        return {
+            name: {q: estimator.value for q, estimator in estimators.items()}
+            for name, estimators in self._estimators.items()
+        }
+
+    def save(self):
+        if not self.profile_path or not self.calibrated:
+            return
+        profile = {
+            "version": PROFILE_VERSION,
+            "pose_backend": self.pose_backend,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "samples": self.samples,
+            "observed_seconds": round(self._observed, 1),
+            "quantiles": {
+                name: {str(q): round(value, 5) for q, value in values.items()}
+                for name, values in self.quantiles().items()
+            },
+            "thresholds": self.thresholds,
+        }
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.profile_path)), exist_ok=True)
+            tmp_path = f"{self.profile_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(profile, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.profile_path)
+            print(f"[OK] Vision 보정 프로필 저장: {self.profile_path}")
+        except OSError as e:
+            print(f"[WARNING] Vision 보정 프로필 저장 실패: {e}")
+
+    def load(self):
+        """저장된 프로필 불러오기 - 성공하면 임계값 dict, 없거나 잘못되었으면 None"""
+        if not self.profile_path or not os.path.exists(self.profile_path):
+            return None
+        try:
+            with open(self.profile_path, "r", encoding="utf-8") as f:
+                profile = json.load(f)
+            if profile.get("version") != PROFILE_VERSION:
+                print("[WARNING] Vision 보정 프로필 버전이 달라 다시 보정합니다.")
+                return None
+            if profile.get("pose_backend") != self.pose_backend:
+                print(f"[WARNING] Vision 보정 프로필의 pose 백엔드({profile.get('pose_backend')})가 달라 다시 보정합니다.")
+                return None
+            thresholds = {name: float(profile["thresholds"][name]) for name in THRESHOLD_LIMITS}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"[WARNING] Vision 보정 프로필을 읽을 수 없어 다시 보정합니다: {e}")
+            return None
+        self.thresholds = thresholds
+        return thresholds
+
+    def recalibrate(self):
+        """저장된 프로필을 버리고 보정 다시 시작"""
+        self.thresholds = None
+        self.reset()
+        if self.profile_path and os.path.exists(self.profile_path):
+            try:
+                os.remove(self.profile_path)
+            except OSError as e:
+                print(f"[WARNING] Vision 보정 프로필 삭제 실패: {e}")
@@ -0,0 +1,125 @@
+# client/services/camera_supervisor.py
+"""
+웹캠 감독자 (Camera Supervisor)
+
+카메라가 분리되거나 다른 앱이 점유해 cap.read()가 계속 실패할 때,
+실패 직후 다시 읽으며 CPU를 100% 쓰는 대신 장치를 해제하고 지수 백오프로 다시 연결을 시도한다.
+상태가 바뀔 때마다 on_status(status, message) 콜백으로 알린다 (VisionWorker -> UI 시그널).
+
+상태 전이:
+    CONNECTING -> AVAILABLE (열기 성공)
+    AVAILABLE -> UNAVAILABLE (연속 failure_threshold회 읽기 실패)
+    UNAVAILABLE -> AVAILABLE (백오프 후 다시 열기 성공)
+"""
+
+import threading
+
+from client.services.frame_source import list_cameras
+
+
+class CameraStatus:
+    CONNECTING = "connecting"
+    AVAILABLE = "available"
+    UNAVAILABLE = "unavailable"
+
+
+class CameraSupervisor:
+    """CameraSource 읽기 실패 감시 및 재연결 (읽기는 캡처 스레드 하나에서만 호출)"""
+
+    READ_RETRY_DELAY = 0.05  # 일시적 읽기 실패 후 재시도 대기 (초)
+
+    def __init__(self, source, on_status=None, failure_threshold=5, initial_backoff=0.5, max_backoff=10.0):
+        """
+        :param source: 실시간 FrameSource (CameraSource)
+        :param on_status: 상태 변경 콜백 (status, message) - 캡처 스레드에서 호출됨
+        :param failure_threshold: 장치를 다시 열기 전 허용하는 연속 읽기 실패 횟수
+        """
+        self.source = source
+        self.on_status = on_status
+        self.failure_threshold = failure_threshold
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+        self.status = CameraStatus.CONNECTING
+        self.reconnects = 0  # 재연결 성공 횟수
+        self._failures = 0
+        self._backoff = initial_backoff
+        self._stop_event = threading.Event()
+
+    @property
+    def available(self):
+        return self.status == CameraStatus.AVAILABLE
+
+    def _set_status(self, status, message):
+        if status == self.status:
+            return
+        self.status = status
+        print(f"[VISION] Camera {status}: {message}")
+        if self.on_status is not None:
+            try:
+                self.on_status(status, message)
+            except Exception as e:
+                print(f"[WARNING] 카메라 상태 콜백 오류: {e}")
+
+    def open(self):
+        """장치 열기 1회 시도 (실패해도 read()가 백오프로 계속 재시도)"""
+        if self.source.open():
+            self._failures = 0
+            self._backoff = self.initial_backoff
+            self._set_status(CameraStatus.AVAILABLE, self.source.description)
+            return True
+        self._set_status(
+            CameraStatus.UNAVAILABLE,
+            f"웹캠을 열 수 없습니다 ({self.source.description}). 웹캠이 연결되어 있는지 확인하세요."
+        )
+        return False
+
+    def _reconnect(self):
+        """백오프 대기 후 다시 열기 (종료 요청 시 즉시 중단)"""
+        while not self._stop_event.is_set():
+            if self._stop_event.wait(self._backoff):
+                return False
+            if self.source.open():
+                self.reconnects += 1
+                self._failures = 0
+                self._backoff = self.initial_backoff
+                self._set_status(CameraStatus.AVAILABLE, f"{self.source.description} 재연결")
+                return True
+            previous = self._backoff
+            self._backoff = min(self._backoff * 2, self.max_backoff)
+            if self._backoff == self.max_backoff and previous != self.max_backoff:
+                # 최대 백오프에 처음 도달했을 때만 장치 목록 출력 (장치를 여는 비용이 있음)
+                print(f"[VISION] 사용 가능한 카메라 인덱스: {list_cameras() or '없음'}")
+        return False
+
+    def read(self, out=None):
+        """
+        (ok, frame, timestamp) 반환 - 실패 시 항상 대기 후 반환하므로 호출 측이 바로 다시 호출해도 바쁜 대기가 없다.
+        카메라가 없는 동안은 재연결될 때까지(또는 stop()까지) 블록된다.
+        """
+        if self.status != CameraStatus.AVAILABLE and not self._reconnect():
+            return False, None, None
+
+        ok, frame, timestamp = self.source.read(out)
+        if ok:
+            self._failures = 0
+            return ok, frame, timestamp
+
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self.source.release()
+            self._set_status(
+                CameraStatus.UNAVAILABLE,
+                f"{self.source.description} 읽기 {self._failures}회 연속 실패 - 재연결 대기 중"
+            )
+        else:
+            self._stop_event.wait(self.READ_RETRY_DELAY)
+        return False, None, None
+
+    def stop(self):
+        """대기 중인 재연결 중단"""
+        self._stop_event.set()
+
+    def release(self):
+        self.stop()
+        self.source.release()
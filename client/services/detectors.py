@@ -0,0 +1,404 @@
+# client/services/detectors.py
+"""
+Vision 감지기 플러그인 (Detector) 및 레지스트리 (DetectorRegistry)
+
+VisionSensor는 프레임마다 얼굴 특징(FaceFeatures)을 계산한 뒤 FrameObservation 하나로 묶어
+레지스트리에 넘기기만 한다. 졸음/자리비움/시선/휴대폰 판단과 알림 쿨다운은 각 감지기 안에 있다.
+
+[감지기 인터페이스]
+    입력: update(FrameObservation) - 프레임 타임스탬프, 얼굴 특징(없으면 None), 새 추론 여부
+    출력: 상태 전이로 보낼 Packet 목록 (없으면 빈 목록)
+    상태: active (감지 중 - 디버그 표시), building (조건이 쌓이는 중 - 스케줄러가 최대 FPS로 올림)
+
+[레지스트리 스케줄링]
+    - interval: 감지기별 최소 실행 간격 (프레임 타임스탬프 기준 초, 0이면 매 프레임)
+    - budget_ms: 1회 실행 비용 예산 - 최근 실행 비용 중앙값이 예산을 넘으면 경고
+      (한 번의 GC 멈춤으로 판단하지 않도록 min_runs회마다 중앙값으로 판단)
+      enforce_budget=True면 예산을 넘은 감지기를 끄고, reprobe_seconds 뒤 다시 켜서 재측정
+      (예산 안이면 그대로 유지, 여전히 넘으면 다시 끔)
+    - 핵심 감지기 (core=True: 졸음/자리비움/시선/휴대폰)는 예산을 넘어도 끄지 않고 경고만 함
+    - 실행 비용은 감지기별로 기록되어 get_pipeline_stats()["detectors"]로 확인
+
+[새 감지기 추가] (캡처/추론 루프는 수정하지 않음)
+    class YawnDetector(Detector):
+        name = "yawn"
+        def update(self, observation):
+            ...
+            # VisionEvents.YAWNING은 예시 - shared/constants.py에 새 이벤트를 먼저 추가해야 함
+            return [self.make_packet(VisionEvents.YAWNING, {...})] if ... else []
+    vision_sensor.register_detector(YawnDetector(), interval=0.2)
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from shared.protocol import Packet, PacketMeta
+from shared.constants import VisionEvents, PacketCategory
+from client.services.face_features import FaceFeatures
+from client.services.drowsiness import DrowsinessLevel
+from client.services.perf import StageStats
+
+
+@dataclass
+class FrameObservation:
+    """감지기 입력 (프레임 1장)"""
+    timestamp: float  # 프레임 캡처 시각 (초) - 상태 지속 시간 계산의 기준 시계
+    features: Optional[FaceFeatures]  # 얼굴 특징 (얼굴이 없으면 None)
+    # 이번 프레임에서 랜드마크를 새로 추론했는지 (움직임 게이트가 재사용했으면 False)
+    # False면 features는 마지막 추론 결과 그대로 - 졸음 지표는 샘플로 쓰지 않고, 시선은 마지막 판단을 유지
+    fresh: bool = True
+
+
+class Detector:
+    """감지기 플러그인 기반 클래스 (update를 오버라이드)"""
+    name = "detector"
+    category = PacketCategory.VISION
+    core = False  # 핵심 감지기는 비용 예산을 넘어도 끄지 않음 (경고만)
+
+    def __init__(self, interval=0.0, budget_ms=None):
+        """
+        :param interval: 최소 실행 간격 (초, 0이면 매 프레임)
+        :param budget_ms: 1회 실행 비용 예산 (None이면 레지스트리 기본값)
+        """
+        self.interval = interval
+        self.budget_ms = budget_ms
+        self.enabled = True
+        self.disabled_reason = None
+        self.disabled_at = None  # 예산 초과로 꺼진 프레임 타임스탬프 (재측정 시점 계산)
+        self.over_budget = False  # 최근 판단에서 예산을 넘었는지 (핵심 감지기는 켜진 채로 표시만)
+        self.last_run = None  # 마지막 실행 프레임 타임스탬프
+        self.runs = 0  # 실행 횟수 (예산 판단 주기)
+        self.active = False
+        self.building = False
+        self._last_alert = {}
+
+    def update(self, observation):
+        """프레임 1장 반영 -> 보낼 Packet 목록"""
+        raise NotImplementedError
+
+    def reset(self):
+        """감지 상태 초기화 (감지기를 끌 때 호출)"""
+        self.active = False
+        self.building = False
+
+    def should_alert(self, event_type, cooldown_seconds, now):
+        """이벤트별 중복 알림 방지 (프레임 타임스탬프 기준 쿨다운)"""
+        last_time = self._last_alert.get(event_type)
+        if last_time is not None and now - last_time < cooldown_seconds:
+            return False
+        self._last_alert[event_type] = now
+        return True
+
+    def make_packet(self, event, data):
+        return Packet(event=event, data=data, meta=PacketMeta(category=self.category))
+
+
+class DetectorRegistry:
+    """감지기 등록 + 감지기별 실행 주기/비용 예산 관리"""
+
+    def __init__(self, default_budget_ms=2.0, enforce_budget=False, min_runs=30, window=120, reprobe_seconds=30.0):
+        """
+        :param default_budget_ms: budget_ms를 지정하지 않은 감지기의 1회 실행 비용 예산
+        :param enforce_budget: 예산을 넘은 감지기(핵심 감지기 제외)를 끌지 여부 (False면 기록/경고만)
+        :param min_runs: 예산 판단 주기 (실행 횟수)
+        :param window: 감지기별 비용 샘플 수
+        :param reprobe_seconds: 예산 초과로 꺼진 감지기를 다시 켜서 재측정하기까지의 시간 (프레임 시계 기준 초)
+        """
+        self.default_budget_ms = default_budget_ms
+        self.enforce_budget = enforce_budget
+        self.min_runs = min_runs
+        self.reprobe_seconds = reprobe_seconds
+        self.stats = StageStats(window=window)
+        self._detectors = {}
+
+    def register(self, detector, interval=None, budget_ms=None):
+        """감지기 등록 (interval/budget_ms를 주면 감지기 기본값 대신 사용)"""
+        if detector.name in self._detectors:
+            raise ValueError(f"이미 등록된 감지기입니다: {detector.name}")
+        if interval is not None:
+            detector.interval = interval
+        if budget_ms is not None:
+            detector.budget_ms = budget_ms
+        elif detector.budget_ms is None:
+            detector.budget_ms = self.default_budget_ms
+        self._detectors[detector.name] = detector
+        return detector
+
+    def get(self, name):
+        return self._detectors.get(name)
+
+    def __iter__(self):
+        return iter(self._detectors.values())
+
+    def is_active(self, name):
+        detector = self._detectors.get(name)
+        return detector is not None and detector.enabled and detector.active
+
+    @property
+    def building(self):
+        """조건이 쌓이는 중인 감지기가 있는지 (적응형 추론 주기 입력)"""
+        return any(detector.enabled and detector.building for detector in self._detectors.values())
+
+    def enable(self, name):
+        detector = self._detectors[name]
+        detector.enabled = True
+        detector.disabled_reason = None
+        detector.disabled_at = None
+        detector.last_run = None
+
+    def disable(self, name, reason="manual", now=None):
+        """
+        감지기 끄기 (now를 주면 예산 초과로 본다 -> reprobe_seconds 뒤 자동 재측정)
+        """
+        detector = self._detectors[name]
+        detector.enabled = False
+        detector.disabled_reason = reason
+        detector.disabled_at = now
+        detector.reset()
+
+    def run(self, observation):
+        """실행할 차례인 감지기를 순서대로 실행 -> 모든 감지기가 보낼 Packet 목록"""
+        packets = []
+        for detector in self._detectors.values():
+            if not detector.enabled:
+                if not self._should_reprobe(detector, observation.timestamp):
+                    continue
+                self._reprobe(detector)
+            if detector.last_run is not None and observation.timestamp - detector.last_run < detector.interval:
+                continue
+            detector.last_run = observation.timestamp
+            t0 = time.perf_counter()
+            try:
+                packets.extend(detector.update(observation) or ())
+            except Exception as e:
+                print(f"[ERROR] 감지기 '{detector.name}' 실행 중 오류: {e}")
+                self.stats.incr(f"{detector.name}_errors")
+            self.stats.record(detector.name, time.perf_counter() - t0)
+            detector.runs += 1
+            self._check_budget(detector, observation.timestamp)
+        return packets
+
+    def _should_reprobe(self, detector, now):
+        """예산 초과로 꺼진 감지기만 재측정 (수동으로 끈 감지기는 그대로)"""
+        return detector.disabled_at is not None and now - detector.disabled_at >= self.reprobe_seconds
+
+    def _reprobe(self, detector):
+        """다시 켜고 비용 샘플을 비워서 새로 측정 (min_runs회 뒤 _check_budget에서 판단)"""
+        self.enable(detector.name)
+        self.stats.clear_stage(detector.name)
+        detector.runs = 0
+        print(f"[VISION] 감지기 '{detector.name}' 재측정: 다시 켜고 실행 비용을 확인합니다.")
+
+    def _check_budget(self, detector, now):
+        if detector.runs % self.min_runs:
+            return
+        p50_ms = self.stats.stage_summary(detector.name)["p50_ms"]
+        was_over = detector.over_budget
+        detector.over_budget = p50_ms > detector.budget_ms
+        if not detector.over_budget:
+            if was_over:
+                print(f"[OK] 감지기 '{detector.name}' 실행 비용이 예산 안으로 돌아왔습니다 ({p50_ms:.2f}ms).")
+            return
+        if self.enforce_budget and not detector.core:
+            self.disable(detector.name, reason=f"over budget ({p50_ms:.2f} > {detector.budget_ms:.2f} ms)", now=now)
+            print(f"⚠️ 감지기 '{detector.name}' 비활성화: 실행 비용 중앙값 {p50_ms:.2f}ms가 "
+                  f"예산 {detector.budget_ms:.2f}ms를 넘었습니다. ({self.reprobe_seconds:.0f}초 뒤 재측정)")
+        elif not was_over:
+            # 핵심 감지기 또는 기록 모드 - 끄지 않고 경고만 (상태가 바뀔 때 한 번)
+            print(f"⚠️ 감지기 '{detector.name}' 실행 비용 중앙값 {p50_ms:.2f}ms가 "
+                  f"예산 {detector.budget_ms:.2f}ms를 넘었습니다. (계속 실행)")
+
+    def snapshot(self):
+        """감지기별 상태/실행 비용 (파이프라인 통계용)"""
+        report = {}
+        for name, detector in self._detectors.items():
+            summary = self.stats.stage_summary(name)
+            report[name] = {
+                "enabled": detector.enabled,
+                "disabled_reason": detector.disabled_reason,
+                "over_budget": detector.over_budget,
+                "core": detector.core,
+                "interval": detector.interval,
+                "budget_ms": detector.budget_ms,
+                "runs": summary["count"],
+                "p50_ms": round(summary["p50_ms"], 4),
+                "p95_ms": round(summary["p95_ms"], 4),
+                "active": detector.active,
+            }
+        return report
+
+
+class SleepDetector(Detector):
+    """
+    졸음 (SLEEPING): 연속 눈 감음(ASLEEP) 또는 최근 구간 PERCLOS(VERY_DROWSY)
+    단계가 오르면 즉시, 같은 단계가 유지되면 DROWSY_REPEAT_SECONDS마다 전송
+    임계값/졸음 지표는 VisionSensor 것을 사용 (사용자 보정 임계값이 바로 반영됨)
+    """
+    name = "sleep"
+    core = True
+
+    def __init__(self, sensor, **kwargs):
+        super().__init__(**kwargs)
+        self.sensor = sensor
+        self._last_alert_level = DrowsinessLevel.AWAKE  # 마지막으로 SLEEPING을 보낸 단계
+
+    def reset(self):
+        super().reset()
+        self._last_alert_level = DrowsinessLevel.AWAKE
+
+    def update(self, observation):
+        sensor = self.sensor
+        monitor = sensor.drowsiness
+        features = observation.features
+        if features is None:
+            # 얼굴이 없으면 눈 상태를 알 수 없으므로 졸음 지표는 일시 정지
+            monitor.pause()
+            level = monitor.level
+            self.active = False
+        else:
+            if observation.fresh:
+                # 졸음 지표 갱신 (연속 눈 감음은 잠깐 뜬 프레임 하나로 끊기지 않음)
+                level = monitor.update(features.avg_ear < sensor.EAR_THRESHOLD, observation.timestamp)
+            else:
+                # 움직임 게이트가 재사용한 랜드마크는 새 샘플이 아님 - 다음 새 샘플까지는 빈 구간 (max_gap으로 제한)
+                level = monitor.level
+            self.active = level >= sensor.DROWSY_ALERT_LEVEL
+        # 눈 감음 진행 중이거나 DROWSY 단계 (눈 깜빡임은 높은 FPS에서만 잡힘)
+        self.building = level < sensor.DROWSY_ALERT_LEVEL and (
+            monitor.closure_active or level >= DrowsinessLevel.DROWSY)
+
+        if level < self._last_alert_level:
+            self._last_alert_level = level
+        if not self.active:
+            return []
+        if level > self._last_alert_level:
+            self._last_alert[VisionEvents.SLEEPING] = observation.timestamp
+        elif not self.should_alert(VisionEvents.SLEEPING, sensor.DROWSY_REPEAT_SECONDS, observation.timestamp):
+            return []
+        self._last_alert_level = level
+        return [self.make_packet(VisionEvents.SLEEPING, {
+            "confidence": 0.9 if level == DrowsinessLevel.ASLEEP else 0.8,
+            "ear": features.avg_ear,
+            "duration": round(monitor.closure_duration, 1),  # 연속 눈 감음 (초 단위)
+            **monitor.snapshot(),  # level, perclos, blink_rate, mean_blink_duration
+        })]
+
+
+class AbsenceDetector(Detector):
+    """
+    자리비움 (ABSENT) / 복귀 (USER_RETURNED)
+    얼굴이 NO_FACE_SECONDS 이상 안 보이면 자리비움 모드 진입 (ABSENT는 ABSENT_REPEAT_SECONDS마다 리마인드)
+    자리비움 모드에서 얼굴이 다시 보이면 USER_RETURNED 1회 (쿨다운 없음)
+    """
+    name = "absence"
+    core = True
+    ABSENT_REPEAT_SECONDS = 20.0  # 계속 자리 비움 시 리마인드 간격 (Agent가 기억으로 중복 잔소리를 거름)
+
+    def __init__(self, sensor, **kwargs):
+        super().__init__(**kwargs)
+        self.sensor = sensor
+        self.absent_since = None  # 자리비움 모드 시작 시각 (얼굴이 사라진 시점, 모드가 아니면 None)
+
+    def reset(self):
+        super().reset()
+        self.absent_since = None
+
+    def update(self, observation):
+        timer = self.sensor.no_face_timer
+        if observation.features is not None:
+            timer.reset()
+            self.active = self.building = False
+            if self.absent_since is None:
+                return []
+            absent_duration = observation.timestamp - self.absent_since
+            self.absent_since = None
+            print(f"[VISION] User Returned! Absent duration: {absent_duration:.1f}s")
+            return [self.make_packet(VisionEvents.USER_RETURNED, {
+                "confidence": 1.0,
+                "duration": round(absent_duration, 1),  # 초 단위
+            })]
+
+        timer.update(True, observation.timestamp)
+        self.active = timer.triggered
+        self.building = timer.active and not timer.triggered
+        if not self.active:
+            return []
+        if self.absent_since is None:
+            self.absent_since = timer.since  # 얼굴이 사라진 시점부터 계산
+            print("[VISION] User Absent Mode Started")
+        if not self.should_alert(VisionEvents.ABSENT, self.ABSENT_REPEAT_SECONDS, observation.timestamp):
+            return []
+        return [self.make_packet(VisionEvents.ABSENT, {
+            "confidence": 0.9,
+            "duration": round(timer.duration, 1),  # 초 단위
+        })]
+
+
+class GazeDetector(Detector):
+    """
+    시선 벗어남 (GAZE_AWAY): 화면을 보지 않는 상태(볼 가시성 또는 각도 기준)가 GAZE_AWAY_SECONDS 이상 유지
+    화면을 보는지는 새로 추론한 프레임에서만 판단하고, 움직임 게이트가 재사용한 프레임은 마지막 판단을 유지
+    (화면 변화가 없다는 뜻이므로 지속 시간은 계속 늘어남)
+    판단 결과는 features.cheeks_visible에 기록 (디버그 표시에서 재사용)
+    """
+    name = "gaze"
+    core = True
+    ALERT_COOLDOWN_SECONDS = 5.0
+
+    def __init__(self, sensor, **kwargs):
+        super().__init__(**kwargs)
+        self.sensor = sensor
+        self._facing = None  # 마지막으로 새로 추론한 프레임의 판단 (없으면 None)
+
+    def reset(self):
+        super().reset()
+        self._facing = None
+
+    def update(self, observation):
+        timer = self.sensor.gaze_away_timer
+        features = observation.features
+        if features is None:
+            timer.reset()
+            self._facing = None
+            self.active = self.building = False
+            return []
+        if observation.fresh or self._facing is None:
+            self._facing = self.sensor.is_facing_screen(features)
+        features.cheeks_visible = self._facing
+        timer.update(not self._facing, observation.timestamp)
+        self.active = timer.triggered
+        self.building = timer.active and not timer.triggered
+        if not self.active or not self.should_alert(
+                VisionEvents.GAZE_AWAY, self.ALERT_COOLDOWN_SECONDS, observation.timestamp):
+            return []
+        return [self.make_packet(VisionEvents.GAZE_AWAY, {
+            "confidence": 0.9,
+            "reason": "cheek_not_visible",
+            "duration": round(timer.duration, 1),  # 초 단위
+        })]
+
+
+class PhoneVoteDetector(Detector):
+    """휴대폰 (PHONE_DETECTED): PhoneDetector 스레드의 시간 투표 결과를 읽어 전송 (검출 자체는 별도 주기)"""
+    name = "phone"
+    core = True
+    ALERT_COOLDOWN_SECONDS = 5.0
+
+    def __init__(self, sensor, **kwargs):
+        super().__init__(**kwargs)
+        self.sensor = sensor
+
+    def update(self, observation):
+        phone = self.sensor.phone_detector
+        is_detected, candidate, _ = phone.get_state()
+        self.active = is_detected
+        self.building = candidate  # 후보가 보이면 최대 속도로 확인
+        if not is_detected or not self.should_alert(
+                VisionEvents.PHONE_DETECTED, self.ALERT_COOLDOWN_SECONDS, observation.timestamp):
+            return []
+        return [self.make_packet(VisionEvents.PHONE_DETECTED, {
+            "confidence": 0.9,
+            "detected": True,
+            "hits": phone.vote.hit_count,
+        })]
@@ -0,0 +1,190 @@
+# client/services/drowsiness.py
+"""
+졸음 지표 (PERCLOS / 눈 깜빡임)
+
+프레임마다 눈 감음 여부(EAR < 임계값)를 받아 최근 window_seconds 동안의 지표를 유지한다.
+- PERCLOS: 눈을 감고 있던 시간 비율 (샘플 간격으로 가중 - 추론 FPS가 바뀌어도 같은 의미)
+- 눈 깜빡임 빈도(회/분)와 평균 깜빡임 시간: blink_max_seconds 이하로 감았다 뜬 경우
+- 연속 눈 감음 시간: open_tolerance 이하로 잠깐 뜬 프레임(노이즈)은 무시하고 이어서 계산
+  (눈 감음 종료와 깜빡임 집계는 open_tolerance만큼 늦게 확정됨)
+
+샘플은 (타임스탬프, 구간 길이, 감음 여부)로 링 버퍼(deque)에 쌓고 구간 합계를 누적 유지하므로
+update는 창 밖으로 밀려난 샘플만 빼면 되어 분할 상환 O(1)이다.
+
+눈 깜빡임(100~400ms)은 추론 FPS가 10 이상일 때만 의미 있게 잡힌다 (적응형 주기의 idle 3FPS에서는 대부분 놓침).
+PERCLOS와 연속 눈 감음 시간은 낮은 FPS에서도 유효하다.
+
+[졸음 단계]
+    AWAKE        : 기준 미만
+    DROWSY       : PERCLOS >= perclos_drowsy 또는 평균 깜빡임 시간 >= slow_blink_seconds
+    VERY_DROWSY  : PERCLOS >= perclos_very_drowsy
+    ASLEEP       : 연속 눈 감음 >= asleep_seconds
+"""
+
+from collections import deque
+
+
+class DrowsinessLevel:
+    """졸음 단계 (값이 클수록 심함)"""
+    AWAKE = 0
+    DROWSY = 1
+    VERY_DROWSY = 2
+    ASLEEP = 3
+
+    NAMES = {AWAKE: "AWAKE", DROWSY: "DROWSY", VERY_DROWSY: "VERY_DROWSY", ASLEEP: "ASLEEP"}
+
+
+class DrowsinessMonitor:
+    """슬라이딩 윈도 PERCLOS / 눈 깜빡임 지표 및 졸음 단계"""
+
+    def __init__(self, window_seconds=60.0, asleep_seconds=10.0, perclos_drowsy=0.15, perclos_very_drowsy=0.3,
+                 blink_max_seconds=0.5, slow_blink_seconds=0.4, open_tolerance=0.3, max_gap=1.0,
+                 min_coverage=0.25):
+        """
+        :param window_seconds: 지표를 계산할 최근 구간 (초)
+        :param asleep_seconds: ASLEEP으로 볼 연속 눈 감음 시간 (초)
+        :param blink_max_seconds: 이보다 짧게 감았다 뜨면 눈 깜빡임으로 집계
+        :param open_tolerance: 연속 눈 감음 중 이보다 짧게 뜬 것은 노이즈로 무시 (초)
+        :param max_gap: 샘플 간격 상한 (초) - 얼굴을 놓쳤다 다시 찾은 구간이 한쪽 상태로 몰리지 않게
+        :param min_coverage: 관측 시간이 window의 이 비율 미만이면 PERCLOS 단계를 판단하지 않음
+        """
+        self.window_seconds = window_seconds
+        self.asleep_seconds = asleep_seconds
+        self.perclos_drowsy = perclos_drowsy
+        self.perclos_very_drowsy = perclos_very_drowsy
+        self.blink_max_seconds = blink_max_seconds
+        self.slow_blink_seconds = slow_blink_seconds
+        self.open_tolerance = open_tolerance
+        self.max_gap = max_gap
+        self.min_coverage = min_coverage
+        self.reset()
+
+    def reset(self):
+        self._samples = deque()  # (타임스탬프, 구간 길이, 감음 여부) - 구간은 이전 샘플 상태 유지로 간주
+        self._observed = 0.0  # 창 안의 관측 시간 합 (초)
+        self._closed = 0.0  # 창 안의 눈 감음 시간 합 (초)
+        self._blinks = deque()  # (깜빡임 끝 타임스탬프, 깜빡임 시간)
+        self._blink_time = 0.0  # 창 안의 깜빡임 시간 합
+        self.pause()
+
+    def pause(self):
+        """얼굴을 놓침 - 눈 상태를 알 수 없으므로 다음 샘플부터 새로 이어감 (창 안의 기록은 유지)"""
+        self._last_ts = None
+        self._last_closed = False
+        self._closure_start = None  # 진행 중인 눈 감음 시작 시각
+        self._opened_at = None  # 눈 감음 중 눈을 뜬 시각 (open_tolerance 확인 전)
+
+    @property
+    def closure_active(self):
+        """눈 감음이 진행 중인지 (잠깐 뜬 노이즈 구간 포함)"""
+        return self._closure_start is not None
+
+    @property
+    def closure_duration(self):
+        """진행 중인 연속 눈 감음 시간 (초)"""
+        if self._closure_start is None or self._last_ts is None:
+            return 0.0
+        end = self._opened_at if self._opened_at is not None else self._last_ts
+        return max(0.0, end - self._closure_start)
+
+    @property
+    def perclos(self):
+        """최근 창의 눈 감음 시간 비율 (0~1)"""
+        return self._closed / self._observed if self._observed > 0 else 0.0
+
+    @property
+    def observed_seconds(self):
+        return self._observed
+
+    @property
+    def blink_rate(self):
+        """최근 창의 분당 눈 깜빡임 횟수"""
+        span = min(self.window_seconds, self._observed)
+        return len(self._blinks) * 60.0 / span if span > 0 else 0.0
+
+    @property
+    def mean_blink_duration(self):
+        """최근 창의 평균 눈 깜빡임 시간 (초)"""
+        return self._blink_time / len(self._blinks) if self._blinks else 0.0
+
+    @property
+    def level(self):
+        """현재 졸음 단계 (DrowsinessLevel)"""
+        if self.closure_duration >= self.asleep_seconds:
+            return DrowsinessLevel.ASLEEP
+        if self._observed < self.window_seconds * self.min_coverage:
+            return DrowsinessLevel.AWAKE
+        perclos = self.perclos
+        if perclos >= self.perclos_very_drowsy:
+            return DrowsinessLevel.VERY_DROWSY
+        if perclos >= self.perclos_drowsy or (
+                len(self._blinks) >= 3 and self.mean_blink_duration >= self.slow_blink_seconds):
+            return DrowsinessLevel.DROWSY
+        return DrowsinessLevel.AWAKE
+
+    def update(self, eye_closed, timestamp):
+        """
+        프레임 1장의 눈 감음 여부 반영
+        :param timestamp: 프레임 타임스탬프 (초, 단조 증가)
+        :return: 현재 졸음 단계
+        """
+        if self._last_ts is not None:
+            dt = min(max(0.0, timestamp - self._last_ts), self.max_gap)
+            if dt > 0:
+                self._samples.append((timestamp, dt, self._last_closed))
+                self._observed += dt
+                if self._last_closed:
+                    self._closed += dt
+
+        self._update_closure(eye_closed, timestamp)
+        self._last_ts = timestamp
+        self._last_closed = eye_closed
+        self._evict(timestamp)
+        return self.level
+
+    def _update_closure(self, eye_closed, timestamp):
+        """연속 눈 감음 구간 추적 (짧게 뜬 노이즈는 무시) 및 눈 깜빡임 집계"""
+        if eye_closed:
+            if self._closure_start is None:
+                self._closure_start = timestamp
+            self._opened_at = None  # 잠깐 떴다가 다시 감음 -> 같은 구간으로 이어감
+            return
+        if self._closure_start is None:
+            return
+        if self._opened_at is None:
+            self._opened_at = timestamp
+        if timestamp - self._opened_at >= self.open_tolerance:
+            # open_tolerance 동안 계속 떠 있으면 눈 감음 종료 (짧았으면 눈 깜빡임으로 집계)
+            duration = self._opened_at - self._closure_start
+            if duration <= self.blink_max_seconds:
+                self._blinks.append((self._opened_at, duration))
+                self._blink_time += duration
+            self._closure_start = None
+            self._opened_at = None
+
+    def _evict(self, timestamp):
+        """창 밖으로 밀려난 샘플/깜빡임을 합계에서 제외"""
+        cutoff = timestamp - self.window_seconds
+        while self._samples and self._samples[0][0] <= cutoff:
+            _, dt, closed = self._samples.popleft()
+            self._observed -= dt
+            if closed:
+                self._closed -= dt
+        while self._blinks and self._blinks[0][0] <= cutoff:
+            self._blink_time -= self._blinks.popleft()[1]
+        if not self._samples:
+            # 부동소수점 누적 오차 제거
+            self._observed = 0.0
+            self._closed = 0.0
+        if not self._blinks:
+            self._blink_time = 0.0
+
+    def snapshot(self):
+        """패킷/디버그 표시용 지표"""
+        return {
+            "level": DrowsinessLevel.NAMES[self.level],
+            "perclos": round(self.perclos, 3),
+            "blink_rate": round(self.blink_rate, 1),
+            "mean_blink_duration": round(self.mean_blink_duration, 3),
+            "closure_duration": round(self.closure_duration, 1),
+        }
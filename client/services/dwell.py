@@ -0,0 +1,129 @@
+# client/services/dwell.py
+"""
+전경 창 체류 시간 집계 (Dwell-time accounting)
+
+WINDOW_CHANGE는 창이 바뀐 순간만 알려주므로, 딴짓 앱에 실제로 얼마나 머물렀는지는 알 수 없다.
+ScreenSensor가 창 정체성(프로세스, 정규화된 제목)이 바뀔 때마다 switch()를 호출하면
+- 구간 타임라인 (시작, 끝, 프로세스, 정규화된 제목, 분류)을 추가 전용 배열에 기록하고
+  (시각은 array('d'), 창 정보는 중복 없는 표의 인덱스 array('I')로 저장 -> 구간당 20바이트)
+- 앱별 / 분류별 누적 시간을 구간이 닫힐 때마다 더해 둔다
+세션 종료 시 집중/딴짓 시간은 누적값 + 열린 구간 하나로 바로 계산한다 (원본 이벤트 재탐색 없음).
+
+[사용 예시]
+    dwell = DwellTracker()
+    dwell.switch("chrome.exe", "youtube", "distracting", time.time())
+    dwell.summary(time.time())  # {"focused_seconds", "distracted_seconds", ...}
+"""
+
+import threading
+from array import array
+from collections import defaultdict
+
+DISTRACTING = "distracting"
+
+
+class DwellTracker:
+    """전경 창 구간 타임라인 + 앱별/분류별 누적 시간 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._starts = array("d")
+            self._ends = array("d")
+            self._keys = array("I")  # 구간별 창 정보 인덱스 (_key_table)
+            self._key_table = []  # [(process, title, category)]
+            self._key_index = {}  # (process, title, category) -> 인덱스
+            self._open = None  # (key 인덱스, 시작 시각) - 현재 전경 창
+            self._by_app = defaultdict(float)  # 닫힌 구간 누적 (초)
+            self._by_category = defaultdict(float)
+            self._tracked = 0.0  # 닫힌 구간 전체 합
+
+    def __len__(self):
+        """닫힌 구간 수"""
+        return len(self._starts)
+
+    def switch(self, process, title, category, now):
+        """전경 창이 (process, title, category)로 바뀜 - 같은 창이면 무시"""
+        entry = (process or "unknown", title or "", category or "unknown")
+        with self._lock:
+            key = self._key_index.get(entry)
+            if key is None:
+                key = len(self._key_table)
+                self._key_table.append(entry)
+                self._key_index[entry] = key
+            if self._open is not None:
+                if self._open[0] == key:
+                    return
+                self._close_locked(now)
+            self._open = (key, now)
+
+    def close(self, now):
+        """현재 구간 닫기 (센서 종료/일시정지 시)"""
+        with self._lock:
+            if self._open is not None:
+                self._close_locked(now)
+
+    def _close_locked(self, now):
+        key, start = self._open
+        self._open = None
+        duration = max(0.0, now - start)
+        process, _, category = self._key_table[key]
+        self._starts.append(start)
+        self._ends.append(now)
+        self._keys.append(key)
+        self._by_app[process] += duration
+        self._by_category[category] += duration
+        self._tracked += duration
+
+    def totals(self, now):
+        """(앱별, 분류별, 전체) 누적 시간 - 열린 구간은 now까지 포함"""
+        with self._lock:
+            by_app = dict(self._by_app)
+            by_category = dict(self._by_category)
+            tracked = self._tracked
+            if self._open is not None:
+                key, start = self._open
+                process, _, category = self._key_table[key]
+                duration = max(0.0, now - start)
+                by_app[process] = by_app.get(process, 0.0) + duration
+                by_category[category] = by_category.get(category, 0.0) + duration
+                tracked += duration
+        return by_app, by_category, tracked
+
+    def summary(self, now, top_apps=5):
+        """
+        세션 요약: 집중/딴짓 시간(초), 분류별 시간, 상위 앱
+        집중/딴짓 시간은 누적값 + 열린 구간으로 계산 (상위 앱 정렬만 앱 수에 비례)
+        """
+        with self._lock:
+            distracted = self._by_category.get(DISTRACTING, 0.0)
+            tracked = self._tracked
+            open_interval = self._open
+            if open_interval is not None:
+                key, start = open_interval
+                duration = max(0.0, now - start)
+                tracked += duration
+                if self._key_table[key][2] == DISTRACTING:
+                    distracted += duration
+            intervals = len(self._starts) + (1 if open_interval is not None else 0)
+        by_app, by_category, _ = self.totals(now)
+        top = sorted(by_app.items(), key=lambda item: item[1], reverse=True)[:top_apps]
+        return {
+            "tracked_seconds": round(tracked, 1),
+            "focused_seconds": round(tracked - distracted, 1),
+            "distracted_seconds": round(distracted, 1),
+            "by_category": {category: round(seconds, 1) for category, seconds in by_category.items()},
+            "top_apps": [{"process": process, "seconds": round(seconds, 1)} for process, seconds in top],
+            "intervals": intervals,
+        }
+
+    def intervals(self):
+        """닫힌 구간 타임라인 [(start, end, process, title, category)] (기록 순서)"""
+        with self._lock:
+            return [
+                (start, end) + self._key_table[key]
+                for start, end, key in zip(self._starts, self._ends, self._keys)
+            ]
@@ -0,0 +1,168 @@
+# client/services/face_features.py
+"""
+얼굴 특징 추출 (Face Feature Extraction)
+
+프레임마다 478개 랜드마크를 미리 할당된 (N, 3) float32 배열로 한 번만 변환한 뒤,
+EAR(양쪽 눈), 얼굴 방향(pitch/yaw), 볼 z-depth 차이 및 거리 비율을
+numpy 일괄 인덱싱으로 계산해 FaceFeatures 구조체에 담는다.
+감지 로직과 디버그 표시가 같은 FaceFeatures를 읽으므로 같은 계산을 두 번 하지 않는다.
+
+[얼굴 방향(pose) 백엔드]
+    heuristic : 코가 두 눈 중심선에서 벗어난 2D 오프셋 x ORIENTATION_SCALE (추가 비용 없음, roll 없음)
+                얼굴이 화면 안에서 기울면(roll) yaw가 함께 흔들린다.
+    matrix    : FaceLandmarker의 facial transformation matrix(4x4, 회전 + 이동)에서
+                yaw/pitch/roll을 한 번에 계산 (output_facial_transformation_matrixes=True 필요)
+                부호는 heuristic과 같게 맞춤: yaw 양수 = 화면 오른쪽, pitch 양수 = 고개 숙임, roll 양수 = 반시계
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+NUM_LANDMARKS = 478  # Face Landmarker 출력 랜드마크 수 (홍채 포함)
+
+# 눈 랜드마크 인덱스 (EAR 계산용): [바깥/안쪽 끝, 위1, 위2, 안쪽/바깥 끝, 아래2, 아래1]
+LEFT_EYE_EAR = [33, 160, 158, 133, 153, 144]
+RIGHT_EYE_EAR = [362, 385, 387, 263, 390, 374]
+
+# 얼굴 방향 계산용 랜드마크
+NOSE_TIP = 1
+CHIN = 175
+FOREHEAD = 10
+LEFT_EYE_INNER = 133
+LEFT_EYE_OUTER = 33
+RIGHT_EYE_INNER = 362
+RIGHT_EYE_OUTER = 263
+
+# 볼 랜드마크 (GAZE_AWAY 감지용) - 안쪽 볼 영역 사용
+LEFT_CHEEK = 118   # 왼쪽 볼 안쪽 (face oval, 116보다 안쪽)
+RIGHT_CHEEK = 347  # 오른쪽 볼 안쪽 (face oval, 345보다 안쪽)
+
+EAR_INDICES = np.array([LEFT_EYE_EAR, RIGHT_EYE_EAR], dtype=np.intp)  # (2, 6)
+EYE_CORNER_INDICES = np.array(
+    [LEFT_EYE_INNER, LEFT_EYE_OUTER, RIGHT_EYE_INNER, RIGHT_EYE_OUTER], dtype=np.intp
+)
+CHEEK_INDICES = np.array([LEFT_CHEEK, RIGHT_CHEEK], dtype=np.intp)
+REQUIRED_LANDMARKS = int(max(EAR_INDICES.max(), CHEEK_INDICES.max(), CHIN, FOREHEAD, NOSE_TIP)) + 1
+
+# 정면 기준 코의 정상 위치 (눈 중심선보다 약간 아래, 정규화 좌표)
+NORMAL_NOSE_OFFSET = 0.05
+# 정규화 오프셋 -> 각도 변환 스케일 (대략: 오프셋 ±0.5 ≈ ±30도)
+ORIENTATION_SCALE = 60.0
+
+
+@dataclass
+class FaceFeatures:
+    """프레임 1장의 얼굴 특징 (감지와 디버그 표시가 공유)"""
+    points: np.ndarray  # (N, 3) 정규화 좌표 (x, y, z) - 다음 프레임에서 덮어쓰이는 공유 버퍼
+    left_ear: float
+    right_ear: float
+    avg_ear: float
+    pitch: float  # 위/아래 (도, 양수 = 고개 숙임)
+    yaw: float  # 좌/우 (도)
+    cheek_z_diff: float  # 양쪽 볼 z-depth 차이
+    left_cheek_nose_z: float  # 왼쪽 볼과 코의 z 차이
+    right_cheek_nose_z: float  # 오른쪽 볼과 코의 z 차이
+    nose_z: float
+    cheek_distance_ratio: float  # 코-볼 거리 비대칭 비율 (거리가 너무 작으면 0)
+    cheek_distance_valid: bool  # 거리 비율 계산 가능 여부
+    cheeks_visible: bool = True  # 화면을 보고 있는지 판단 결과 (VisionWorker가 임계값 적용 후 기록)
+    roll: float = 0.0  # 화면 안 기울기 (도, matrix 백엔드에서만 계산)
+    pose_backend: str = "heuristic"  # yaw/pitch/roll을 계산한 방법
+
+
+def pose_from_matrix(matrix):
+    """
+    facial transformation matrix (4x4) -> (yaw, pitch, roll) 도 단위
+    회전 부분의 얼굴 정면 방향 벡터(3번째 열)와 x축 성분을 한 번의 arctan2로 변환
+    (카메라 좌표계: x 오른쪽, y 위, z 화면 밖 - OpenGL 관례)
+    """
+    rotation = np.asarray(matrix, dtype=np.float64)[:3, :3]
+    fx, fy, fz = rotation[:, 2]
+    yaw, pitch, roll = np.degrees(np.arctan2(
+        (fx, -fy, rotation[1, 0]),
+        (fz, np.hypot(fx, fz), rotation[0, 0]),
+    ))
+    return float(yaw), float(pitch), float(roll)
+
+
+class FaceFeatureExtractor:
+    """랜드마크 -> FaceFeatures 변환기 (랜드마크 배열은 미리 할당해 재사용)"""
+
+    def __init__(self, num_landmarks=NUM_LANDMARKS):
+        self.points = np.zeros((num_landmarks, 3), dtype=np.float32)
+
+    def load_landmarks(self, landmarks):
+        """MediaPipe 랜드마크 리스트를 미리 할당된 (N, 3) 배열에 복사 후 사용 구간 뷰 반환"""
+        n = min(len(landmarks), len(self.points))
+        self.points[:n] = [(lm.x, lm.y, lm.z) for lm in landmarks[:n]]
+        return self.points[:n]
+
+    def extract(self, landmarks, to_frame=None, transformation_matrix=None):
+        """
+        랜드마크에서 모든 특징을 한 번에 계산
+        :param to_frame: 불러온 (N, 3) 배열을 제자리 변환하는 함수 (얼굴 ROI 크롭 좌표 -> 전체 프레임 좌표)
+        :param transformation_matrix: 주어지면 yaw/pitch/roll을 행렬에서 계산 (matrix 백엔드)
+        :return: FaceFeatures (필요한 랜드마크가 부족하면 None)
+        """
+        if len(landmarks) < REQUIRED_LANDMARKS:
+            return None
+        points = self.load_landmarks(landmarks)
+        if to_frame is not None:
+            to_frame(points)
+        features = self.compute(points)
+        if transformation_matrix is not None:
+            features.yaw, features.pitch, features.roll = pose_from_matrix(transformation_matrix)
+            features.pose_backend = "matrix"
+        return features
+
+    @staticmethod
+    def compute(points):
+        """(N, 3) 랜드마크 배열에서 특징 계산 (일괄 인덱싱)"""
+        xy = points[:, :2]
+
+        # EAR: 양쪽 눈을 (2, 6, 2) 배열로 한 번에 계산
+        eyes = xy[EAR_INDICES]
+        vertical = (np.linalg.norm(eyes[:, 1] - eyes[:, 5], axis=-1)
+                    + np.linalg.norm(eyes[:, 2] - eyes[:, 4], axis=-1))
+        horizontal = np.linalg.norm(eyes[:, 0] - eyes[:, 3], axis=-1)
+        ears = np.divide(vertical, 2.0 * horizontal,
+                         out=np.zeros_like(vertical), where=horizontal > 0)
+
+        # 얼굴 방향: 코가 두 눈 중심선에서 벗어난 정도
+        corners = xy[EYE_CORNER_INDICES]  # (4, 2): 왼쪽 안/밖, 오른쪽 안/밖
+        eye_centers = corners.reshape(2, 2, 2).mean(axis=1)  # (2, 2): 왼쪽/오른쪽 눈 중심
+        eye_mid = eye_centers.mean(axis=0)
+        eye_distance = float(np.linalg.norm(eye_centers[1] - eye_centers[0]))
+        face_height = float(np.linalg.norm(xy[CHIN] - xy[FOREHEAD]))
+        nose = points[NOSE_TIP]
+
+        yaw = 0.0
+        if eye_distance > 0:
+            yaw = float((nose[0] - eye_mid[0]) / eye_distance * ORIENTATION_SCALE)
+        pitch = 0.0
+        if face_height > 0:
+            pitch = float((nose[1] - eye_mid[1] - NORMAL_NOSE_OFFSET) / face_height * ORIENTATION_SCALE)
+
+        # 볼: z-depth 차이와 코-볼 거리 비대칭
+        cheeks = points[CHEEK_INDICES]  # (2, 3)
+        cheek_nose_z = np.abs(cheeks[:, 2] - nose[2])
+        cheek_dists = np.linalg.norm(cheeks[:, :2] - nose[:2], axis=1)
+        max_dist = float(cheek_dists.max())
+        distance_valid = max_dist > 0.01
+        distance_ratio = float(abs(cheek_dists[0] - cheek_dists[1]) / max_dist) if distance_valid else 0.0
+
+        return FaceFeatures(
+            points=points,
+            left_ear=float(ears[0]),
+            right_ear=float(ears[1]),
+            avg_ear=float(ears.mean()),
+            pitch=pitch,
+            yaw=yaw,
+            cheek_z_diff=float(abs(cheeks[0, 2] - cheeks[1, 2])),
+            left_cheek_nose_z=float(cheek_nose_z[0]),
+            right_cheek_nose_z=float(cheek_nose_z[1]),
+            nose_z=float(nose[2]),
+            cheek_distance_ratio=distance_ratio,
+            cheek_distance_valid=distance_valid,
+        )
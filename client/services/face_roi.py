@@ -0,0 +1,134 @@
+# client/services/face_roi.py
+"""
+얼굴 ROI 추적 (Face Region of Interest)
+
+첫 검출 이후에는 얼굴이 화면의 일부에만 있으므로, 마지막 얼굴 bbox 주변(여백 포함)만 잘라
+랜드마크 모델에 넣는다. 모델 입력(수백 px)으로 축소되는 양이 줄어 얼굴이 더 크게 보이고,
+RGB 변환/리사이즈 비용도 잘라낸 영역 크기만큼만 든다.
+잘라낸 영역에서 얼굴을 놓치면 ROI를 버리고 전체 프레임 검출로 돌아간다.
+
+- 크롭은 정사각형이며 크기를 CROP_QUANTUM 배수로 맞춰 버퍼 재사용이 잘 되게 한다.
+- 얼굴이 현재 크롭 안쪽에 충분히 남아 있으면 크롭을 유지한다 (VIDEO 모드 추적이 흔들리지 않도록).
+- 크롭 안의 정규화 랜드마크는 to_frame()으로 전체 프레임 정규화 좌표로 되돌린다.
+  (z는 MediaPipe 정의상 x와 같은 스케일이므로 x와 같은 비율로 변환 - 기존 임계값 그대로 사용)
+
+[사용 예시]
+    rect = tracker.crop_rect(frame.shape)          # None이면 전체 프레임
+    region = frame[rect[1]:rect[3], rect[0]:rect[2]] if rect else frame
+    ... 추론 ...
+    tracker.to_frame(points, rect, frame.shape)    # 크롭 좌표 -> 전체 프레임 좌표 (제자리 변환)
+    tracker.update(points, frame.shape)            # 얼굴을 놓쳤으면 points=None
+"""
+
+import numpy as np
+
+from client.services.face_features import EAR_INDICES
+
+CROP_QUANTUM = 32  # 크롭 한 변 길이 단위 (px)
+
+
+def eye_region(points, frame_shape, margin=0.15):
+    """
+    두 눈 주변 영역 (움직임 게이트 관심 영역) - 전체 프레임 정규화 랜드마크 기준
+    :param margin: 두 눈 전체 너비 대비 각 방향 여백 비율 (눈꺼풀/눈썹까지 포함)
+    :return: (x0, y0, x1, y1) 픽셀, 영역이 비면 None
+    """
+    frame_height, frame_width = frame_shape[:2]
+    eyes = points[EAR_INDICES.ravel(), :2]
+    xs = eyes[:, 0] * frame_width
+    ys = eyes[:, 1] * frame_height
+    pad = (float(xs.max()) - float(xs.min())) * margin
+    x0 = max(int(xs.min() - pad), 0)
+    y0 = max(int(ys.min() - pad), 0)
+    x1 = min(int(np.ceil(xs.max() + pad)), frame_width)
+    y1 = min(int(np.ceil(ys.max() + pad)), frame_height)
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return (x0, y0, x1, y1)
+
+
+class FaceRoiTracker:
+    """마지막 얼굴 bbox 기반 크롭 영역 관리"""
+
+    def __init__(self, margin=0.5, min_size=128, keep_inner=0.25, max_area_ratio=2.5):
+        """
+        :param margin: 얼굴 bbox 크기 대비 각 방향 여백 비율
+        :param min_size: 최소 크롭 한 변 (px) - 너무 작은 얼굴은 주변을 더 포함
+        :param keep_inner: 얼굴이 현재 크롭 가장자리에서 (여백 x keep_inner) 이상 떨어져 있으면 크롭 유지
+        :param max_area_ratio: 현재 크롭이 새로 계산한 크롭보다 이 비율 이상 크면 다시 맞춤 (얼굴이 멀어짐)
+        """
+        self.margin = margin
+        self.min_size = min_size
+        self.keep_inner = keep_inner
+        self.max_area_ratio = max_area_ratio
+        self.rect = None  # (x0, y0, x1, y1) 픽셀, None이면 전체 프레임 검출
+
+    def crop_rect(self, frame_shape):
+        """다음 추론에 쓸 크롭 영역 (없거나 프레임 대부분을 덮으면 None -> 전체 프레임)"""
+        if self.rect is None:
+            return None
+        frame_height, frame_width = frame_shape[:2]
+        x0, y0, x1, y1 = self.rect
+        if x1 > frame_width or y1 > frame_height:
+            # 해상도가 바뀜
+            self.rect = None
+            return None
+        if (x1 - x0) * (y1 - y0) >= 0.8 * frame_width * frame_height:
+            return None
+        return self.rect
+
+    @staticmethod
+    def to_frame(points, rect, frame_shape):
+        """크롭 기준 정규화 랜드마크 (N, 3)를 전체 프레임 기준 정규화 좌표로 제자리 변환"""
+        if rect is None:
+            return points
+        frame_height, frame_width = frame_shape[:2]
+        x0, y0, x1, y1 = rect
+        scale_x = (x1 - x0) / frame_width
+        scale_y = (y1 - y0) / frame_height
+        points[:, 0] = points[:, 0] * scale_x + x0 / frame_width
+        points[:, 1] = points[:, 1] * scale_y + y0 / frame_height
+        points[:, 2] *= scale_x
+        return points
+
+    def update(self, points, frame_shape):
+        """
+        추론 결과로 크롭 영역 갱신
+        :param points: 전체 프레임 정규화 랜드마크 (N, 3), 얼굴을 놓쳤으면 None
+        :return: 크롭을 사용 중이었는데 얼굴을 놓쳤으면 True (전체 프레임으로 복귀)
+        """
+        if points is None:
+            lost = self.rect is not None
+            self.rect = None
+            return lost
+
+        frame_height, frame_width = frame_shape[:2]
+        xs = points[:, 0] * frame_width
+        ys = points[:, 1] * frame_height
+        fx0, fx1 = float(xs.min()), float(xs.max())
+        fy0, fy1 = float(ys.min()), float(ys.max())
+        face_size = max(fx1 - fx0, fy1 - fy0, 1.0)
+        pad = face_size * self.margin
+
+        # 얼굴이 현재 크롭 안쪽에 여유 있게 남아 있고 크롭이 지나치게 크지 않으면 유지
+        if self.rect is not None:
+            x0, y0, x1, y1 = self.rect
+            inner = pad * self.keep_inner
+            desired_side = face_size + 2 * pad
+            if (fx0 - inner >= x0 and fy0 - inner >= y0 and fx1 + inner <= x1 and fy1 + inner <= y1
+                    and (x1 - x0) * (y1 - y0) <= self.max_area_ratio * desired_side ** 2):
+                return False
+
+        side = max(face_size + 2 * pad, self.min_size)
+        side = int(np.ceil(side / CROP_QUANTUM) * CROP_QUANTUM)
+        side = min(side, frame_width, frame_height)
+        cx = (fx0 + fx1) / 2
+        cy = (fy0 + fy1) / 2
+        # 프레임 밖으로 나가면 크기를 유지한 채 안쪽으로 밀어 넣음
+        x0 = int(min(max(cx - side / 2, 0), frame_width - side))
+        y0 = int(min(max(cy - side / 2, 0), frame_height - side))
+        self.rect = (x0, y0, x0 + side, y0 + side)
+        return False
+
+    def reset(self):
+        self.rect = None
@@ -0,0 +1,131 @@
+# client/services/frame_buffer.py
+"""
+최신 프레임 버퍼 (Latest-Frame Buffer)
+
+캡처 스레드와 추론 스레드 사이에서 "가장 최근 프레임 1장"만 보관하는 단일 슬롯 버퍼.
+추론이 느려져도 프레임이 큐에 쌓이지 않고, 소비되지 않은 이전 프레임은 덮어쓰여 버려진다.
+
+[사용 예시]
+    buffer = LatestFrameBuffer()
+    # 캡처 스레드
+    buffer.put(frame, time.monotonic())
+    # 추론 스레드
+    item = buffer.get(last_seq, timeout=0.5)
+    if item:
+        last_seq, frame, timestamp = item
+
+FramePool은 프레임 크기 numpy 버퍼를 재사용해 프레임마다 수 MB씩 새로 할당하지 않게 한다.
+"""
+
+import sys
+import threading
+
+import numpy as np
+
+
+class LatestFrameBuffer:
+    """스레드 안전한 단일 슬롯 최신 프레임 버퍼"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._frame = None
+        self._timestamp = 0.0
+        self._seq = 0  # put 할 때마다 증가하는 프레임 번호
+        self._consumed_seq = 0  # 마지막으로 소비(get)된 프레임 번호
+        self._closed = False
+
+        # 통계
+        self.frames_written = 0
+        self.dropped_frames = 0  # 소비되기 전에 덮어쓰인 프레임 수
+
+    @property
+    def seq(self):
+        return self._seq
+
+    def put(self, frame, timestamp):
+        """새 프레임 기록 (이전 프레임이 소비되지 않았다면 버려진 것으로 집계)"""
+        with self._cond:
+            if self._seq > self._consumed_seq:
+                self.dropped_frames += 1
+            self._frame = frame
+            self._timestamp = timestamp
+            self._seq += 1
+            self.frames_written += 1
+            self._cond.notify_all()
+
+    def get(self, last_seq=0, timeout=None, consume=True):
+        """
+        last_seq 이후의 새 프레임이 들어올 때까지 대기 후 (seq, frame, timestamp) 반환
+        - timeout 내에 새 프레임이 없거나 버퍼가 닫히면 None
+        - consume=False: 보조 소비자(예: 다른 검출기)가 드롭 집계에 영향 없이 읽을 때 사용
+        """
+        with self._cond:
+            has_new = self._cond.wait_for(
+                lambda: self._seq != last_seq or self._closed, timeout
+            )
+            if not has_new or self._seq == last_seq:
+                return None
+            if consume:
+                self._consumed_seq = self._seq
+            return self._seq, self._frame, self._timestamp
+
+    def close(self):
+        """대기 중인 소비자를 모두 깨우고 버퍼 종료"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def reset(self):
+        """재시작을 위해 상태 초기화"""
+        with self._cond:
+            self._frame = None
+            self._timestamp = 0.0
+            self._seq = 0
+            self._consumed_seq = 0
+            self._closed = False
+            self.frames_written = 0
+            self.dropped_frames = 0
+
+
+class FramePool:
+    """
+    프레임 버퍼 재사용 풀 (cv2 dst= / cap.read(image) 출력 대상)
+
+    버퍼를 다른 스레드(최신 프레임 슬롯, 추론 루프, 휴대폰 감지, 디버그 창)가 아직 참조하고 있으면
+    덮어쓰면 안 되므로, CPython 참조 카운트로 풀 밖에서 참조가 없는 버퍼만 다시 내준다.
+    (numpy 뷰도 원본 배열을 참조하므로 함께 보호됨)
+    모든 버퍼가 사용 중이면 새로 할당하고, 풀이 가득 찼으면 풀에 넣지 않는다.
+    """
+
+    def __init__(self, max_buffers=4):
+        self.max_buffers = max_buffers
+        self._buffers = []
+        self._lock = threading.Lock()
+        self.allocations = 0  # 새로 할당한 횟수 (정상 상태에서는 증가하지 않아야 함)
+        self._free_refs = self._measure_free_refs()
+
+    def _measure_free_refs(self):
+        """풀 목록에서만 참조될 때 acquire 루프 안에서 보이는 참조 카운트 (인터프리터 버전별 차이 보정)"""
+        buffers = [np.empty(1, dtype=np.uint8)]
+        for buf in buffers:
+            return sys.getrefcount(buf)
+
+    def acquire(self, shape, dtype=np.uint8):
+        """shape/dtype이 맞고 아무도 참조하지 않는 버퍼 반환 (내용은 초기화되지 않음)"""
+        shape = tuple(shape)
+        dtype = np.dtype(dtype)
+        with self._lock:
+            for buf in self._buffers:
+                if buf.shape == shape and buf.dtype == dtype and sys.getrefcount(buf) <= self._free_refs:
+                    return buf
+            # 해상도가 바뀌었으면 이전 크기 버퍼는 버림
+            self._buffers = [buf for buf in self._buffers if buf.shape == shape and buf.dtype == dtype]
+            buf = np.empty(shape, dtype=dtype)
+            self.allocations += 1
+            if len(self._buffers) < self.max_buffers:
+                self._buffers.append(buf)
+            return buf
+
+    def clear(self):
+        with self._lock:
+            self._buffers = []
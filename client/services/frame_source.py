@@ -0,0 +1,249 @@
+# client/services/frame_source.py
+"""
+프레임 소스 추상화 (웹캠 / 동영상 파일 / 이미지 폴더)
+
+VisionWorker와 오프라인 벤치마크(tools/bench_vision.py)가 같은 인터페이스로 프레임을 읽는다.
+read()는 (성공 여부, BGR 프레임, 타임스탬프 초)를 반환한다.
+read(out=버퍼)로 크기가 맞는 기존 배열에 디코딩하면 프레임마다 새로 할당하지 않는다 (FramePool과 함께 사용).
+
+- CameraSource: time.perf_counter 기준 캡처 시각
+- VideoFileSource / ImageDirectorySource: 미디어 시간 (첫 프레임 = 0초)
+  realtime=True이면 미디어 시간에 맞춰 재생 속도를 맞추고, 타임스탬프를 perf_counter 기준으로 옮긴다
+  (웹캠과 같은 시계를 쓰므로 VisionWorker 내부 지연 측정이 그대로 동작).
+
+[사용 예시]
+    source = open_frame_source("clip.mp4")      # 또는 0 (웹캠), "frames/" (이미지 폴더)
+    source.open()
+    while True:
+        ok, frame, ts = source.read()
+        if not ok:
+            break
+    source.release()
+"""
+
+import os
+import time
+
+import cv2
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+
+class FrameSource:
+    """프레임 소스 기본 클래스"""
+
+    is_live = False  # True: 실시간 장치 (읽기 실패는 일시적), False: 끝이 있는 녹화본
+
+    def open(self):
+        """소스 열기 - 성공 여부 반환"""
+        raise NotImplementedError
+
+    def read(self, out=None):
+        """
+        (ok, frame, timestamp) 반환 - 녹화본은 끝에 도달하면 ok=False
+        :param out: 디코딩 대상 버퍼 (크기/타입이 맞으면 재사용, 아니면 무시하고 새로 할당)
+        """
+        raise NotImplementedError
+
+    def release(self):
+        pass
+
+    @property
+    def description(self):
+        return self.__class__.__name__
+
+
+class CameraSource(FrameSource):
+    """cv2.VideoCapture 웹캠 (해상도/FOURCC/드라이버 버퍼 크기 설정 가능, 0 또는 빈 값이면 드라이버 기본값)"""
+
+    is_live = True
+
+    def __init__(self, index=0, width=0, height=0, fourcc="", buffer_size=0):
+        self.index = index
+        self.width = width
+        self.height = height
+        self.fourcc = fourcc
+        self.buffer_size = buffer_size
+        self.cap = None
+
+    def open(self):
+        self.release()
+        self.cap = cv2.VideoCapture(self.index)
+        if not self.cap.isOpened():
+            self.cap.release()
+            self.cap = None
+            return False
+        self._apply_settings()
+        return True
+
+    def _apply_settings(self):
+        """캡처 설정 적용 (일부 백엔드는 FOURCC를 해상도보다 먼저 설정해야 적용됨)"""
+        requested = []
+        if self.fourcc:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc[:4].ljust(4)))
+            requested.append(f"fourcc={self.fourcc}")
+        if self.width and self.height:
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+            requested.append(f"{self.width}x{self.height}")
+        if self.buffer_size:
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+            requested.append(f"buffer={self.buffer_size}")
+        if requested:
+            # 드라이버가 요청을 무시할 수 있으므로 실제 적용값을 함께 출력
+            print(f"[OK] 카메라 설정 요청 ({', '.join(requested)}) -> 실제: {self.actual_settings()}")
+
+    def actual_settings(self):
+        """드라이버가 보고하는 실제 캡처 설정"""
+        if self.cap is None:
+            return {}
+        fourcc = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+        return {
+            "width": int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "fourcc": "".join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4)) if fourcc > 0 else "",
+            "buffer_size": int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE)),
+        }
+
+    def read(self, out=None):
+        if self.cap is None:
+            return False, None, None
+        ret, frame = self.cap.read(out) if out is not None else self.cap.read()
+        return ret, frame, time.perf_counter()
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+    @property
+    def description(self):
+        return f"camera:{self.index}"
+
+
+class _RecordedSource(FrameSource):
+    """녹화본 공통: 미디어 시간 -> 반환 타임스탬프 변환 및 실시간 재생 속도 조절"""
+
+    def __init__(self, realtime=False):
+        self.realtime = realtime
+        self._wall_start = None
+
+    def _stamp(self, media_ts):
+        if not self.realtime:
+            return media_ts
+        if self._wall_start is None:
+            self._wall_start = time.perf_counter() - media_ts
+        due = self._wall_start + media_ts
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        return due
+
+
+class VideoFileSource(_RecordedSource):
+    """동영상 파일 (타임스탬프 = 파일 내 재생 위치)"""
+
+    def __init__(self, path, realtime=False):
+        super().__init__(realtime)
+        self.path = path
+        self.cap = None
+        self.fps = 0.0
+        self.frame_count = 0
+        self._index = 0
+
+    def open(self):
+        self.cap = cv2.VideoCapture(self.path)
+        if not self.cap.isOpened():
+            return False
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self.frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        self._index = 0
+        self._wall_start = None
+        return True
+
+    def read(self, out=None):
+        ret, frame = self.cap.read(out) if out is not None else self.cap.read()
+        if not ret:
+            return False, None, None
+        # 일부 코덱은 POS_MSEC를 0으로 돌려주므로 프레임 번호 기반 시간으로 보정
+        media_ts = max(self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0, self._index / self.fps)
+        self._index += 1
+        return True, frame, self._stamp(media_ts)
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+    @property
+    def description(self):
+        return f"video:{self.path}"
+
+
+class ImageDirectorySource(_RecordedSource):
+    """이미지 폴더 (파일 이름 순서, 고정 fps로 타임스탬프 부여)"""
+
+    def __init__(self, path, fps=10.0, realtime=False):
+        super().__init__(realtime)
+        self.path = path
+        self.fps = fps
+        self.files = []
+        self._index = 0
+
+    def open(self):
+        if not os.path.isdir(self.path):
+            return False
+        self.files = sorted(
+            os.path.join(self.path, name) for name in os.listdir(self.path)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        self._index = 0
+        self._wall_start = None
+        return bool(self.files)
+
+    def read(self, out=None):
+        while self._index < len(self.files):
+            index = self._index
+            self._index += 1
+            frame = cv2.imread(self.files[index])
+            if frame is None:
+                print(f"[WARNING] 이미지를 읽을 수 없습니다: {self.files[index]}")
+                continue
+            return True, frame, self._stamp(index / self.fps)
+        return False, None, None
+
+    @property
+    def description(self):
+        return f"images:{self.path} ({len(self.files)} files @ {self.fps:g} fps)"
+
+
+def list_cameras(max_index=5):
+    """
+    연결된 웹캠 인덱스 목록 (0 ~ max_index-1을 차례로 열어 확인)
+    사용 중인 장치를 여는 비용이 있으므로 장애 복구나 설정 화면에서만 호출한다.
+    """
+    found = []
+    for index in range(max_index):
+        cap = cv2.VideoCapture(index)
+        try:
+            if cap.isOpened():
+                found.append(index)
+        finally:
+            cap.release()
+    return found
+
+
+def open_frame_source(spec=0, realtime=True, image_fps=10.0, **camera_settings):
+    """
+    소스 지정값으로 FrameSource 생성 (open은 호출하지 않음)
+    :param spec: 정수 또는 숫자 문자열 -> 웹캠 인덱스, 폴더 -> 이미지 폴더, 그 외 -> 동영상 파일
+    :param realtime: 녹화본을 실제 시간 속도로 재생할지 (False면 최대 속도, 미디어 시간 타임스탬프)
+    :param camera_settings: 웹캠일 때 CameraSource에 전달 (width, height, fourcc, buffer_size)
+    """
+    if isinstance(spec, FrameSource):
+        return spec
+    if isinstance(spec, int) or (isinstance(spec, str) and spec.strip().isdigit()):
+        return CameraSource(int(spec), **camera_settings)
+    if os.path.isdir(spec):
+        return ImageDirectorySource(spec, fps=image_fps, realtime=realtime)
+    return VideoFileSource(spec, realtime=realtime)
@@ -0,0 +1,158 @@
+# client/services/motion_gate.py
+"""
+움직임 게이트 (Motion Gate)
+
+집중해서 작업 중일 때 웹캠 프레임은 거의 변하지 않으므로,
+축소한 흑백 프레임을 마지막 추론 프레임과 비교해 변화가 임계값 이하이면 랜드마크 추론을 건너뛰고
+이전 결과를 재사용한다.
+
+- 비교 기준은 "직전 프레임"이 아니라 "마지막으로 추론한 프레임"이므로 느린 변화도 누적되어 잡힌다.
+- 눈 깜빡임처럼 전체 축소 영상에서 몇 픽셀만 바뀌는 변화는 관심 영역(focus, 보통 두 눈 주변)을
+  따로 축소해 비교한다. 전체 또는 관심 영역 중 하나라도 바뀌면 추론한다.
+  (관심 영역은 추론 직후 set_focus()로 그 프레임 기준으로 갱신)
+- 그 밖의 느린 변화는 refresh_seconds 강제 갱신으로 잡는다. (최악의 감지 지연 증가 ≈ refresh_seconds)
+
+비용: 간격 샘플링 후 INTER_AREA 축소 + absdiff, 프레임당 0.5ms 이하 (랜드마크 추론 대비 무시 가능)
+"""
+
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    """축소 흑백 프레임 차이 기반 추론 생략 판단"""
+
+    def __init__(self, changed_ratio=0.01, pixel_diff=15, refresh_seconds=1.0, size=(64, 48), focus_size=(48, 16)):
+        """
+        :param changed_ratio: 변화한 픽셀 비율이 이 값을 넘으면 추론 (0~1, 전체/관심 영역 각각 적용)
+        :param pixel_diff: 픽셀 밝기 차이가 이 값을 넘으면 변화한 픽셀로 봄 (0~255)
+        :param refresh_seconds: 변화가 없어도 이 주기마다 강제 추론 (초)
+        :param size: 비교용 축소 크기 (width, height)
+        :param focus_size: 관심 영역 비교용 축소 크기 (width, height)
+        """
+        self.changed_ratio = changed_ratio
+        self.pixel_diff = pixel_diff
+        self.refresh_seconds = refresh_seconds
+        self.size = size
+
+        # 비교용 버퍼 미리 할당 (프레임마다 재사용)
+        self._small = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        self._gray = np.empty((size[1], size[0]), dtype=np.uint8)
+        self._diff = np.empty_like(self._gray)
+        self._reference = None  # 마지막으로 추론한 프레임의 축소 흑백 이미지
+        self._reference_ts = None
+
+        # 관심 영역 (두 눈 주변) - 마지막으로 추론한 프레임에서 잘라 축소한 흑백 이미지와 비교
+        self.focus_size = focus_size
+        self._focus_small = np.empty((focus_size[1], focus_size[0], 3), dtype=np.uint8)
+        self._focus_gray = np.empty((focus_size[1], focus_size[0]), dtype=np.uint8)
+        self._focus_diff = np.empty_like(self._focus_gray)
+        self._focus_reference = None
+        self.focus_rect = None  # (x0, y0, x1, y1) 픽셀, None이면 전체 프레임만 비교
+        self.focus_changes = 0  # 전체 프레임은 그대로인데 관심 영역 변화로 추론한 횟수
+
+        self.last_change = 0.0  # 마지막 비교의 변화 픽셀 비율 (디버그 표시용)
+        self.checked = 0
+        self.skipped = 0
+        self._first_ts = None
+        self._last_ts = None
+
+    def should_process(self, frame, timestamp, force=False):
+        """
+        이번 프레임을 추론해야 하는지 판단 (True면 이 프레임이 새 비교 기준이 됨)
+        :param frame: BGR 프레임
+        :param timestamp: 프레임 시각 (초)
+        :param force: 변화와 관계없이 추론 (재사용할 이전 결과가 없을 때)
+        """
+        # 전체 프레임 INTER_AREA 축소는 비싸므로 (640x480에서 약 0.25ms) 먼저 간격 샘플링한 뒤
+        # 목표 크기의 약 2배에서 INTER_AREA로 평균 (센서 노이즈 완화)
+        step = max(1, min(frame.shape[1] // self.size[0], frame.shape[0] // self.size[1]) // 2)
+        cv2.resize(frame[::step, ::step], self.size, dst=self._small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+        self.checked += 1
+        if self._first_ts is None:
+            self._first_ts = timestamp
+        self._last_ts = timestamp
+
+        if force or self._reference is None or timestamp - self._reference_ts >= self.refresh_seconds:
+            self.last_change = 1.0
+            self._set_reference(timestamp)
+            return True
+
+        self.last_change = self._changed(self._gray, self._reference, self._diff)
+        if self.last_change > self.changed_ratio:
+            self._set_reference(timestamp)
+            return True
+        if self._focus_reference is not None and self._changed(
+                self._shrink_focus(frame), self._focus_reference, self._focus_diff) > self.changed_ratio:
+            self.focus_changes += 1
+            self._set_reference(timestamp)
+            return True
+
+        self.skipped += 1
+        return False
+
+    def _changed(self, gray, reference, diff):
+        """축소 흑백 이미지 간 변화 픽셀 비율"""
+        cv2.absdiff(gray, reference, dst=diff)
+        return cv2.countNonZero(
+            cv2.threshold(diff, self.pixel_diff, 255, cv2.THRESH_BINARY, dst=diff)[1]
+        ) / diff.size
+
+    def _shrink_focus(self, frame):
+        x0, y0, x1, y1 = self.focus_rect
+        cv2.resize(frame[y0:y1, x0:x1], self.focus_size, dst=self._focus_small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._focus_small, cv2.COLOR_BGR2GRAY, dst=self._focus_gray)
+        return self._focus_gray
+
+    def set_focus(self, frame, rect):
+        """
+        관심 영역 갱신 (추론한 프레임과 그 결과로 구한 영역 - 이 프레임이 관심 영역 비교 기준이 됨)
+        :param rect: (x0, y0, x1, y1) 픽셀, None이면 관심 영역 비교 안 함 (얼굴 없음)
+        """
+        if rect is None or rect[2] <= rect[0] or rect[3] <= rect[1]:
+            self.focus_rect = None
+            self._focus_reference = None
+            return
+        self.focus_rect = rect
+        gray = self._shrink_focus(frame)
+        if self._focus_reference is None:
+            self._focus_reference = gray.copy()
+        else:
+            self._focus_reference[...] = gray
+
+    def _set_reference(self, timestamp):
+        if self._reference is None:
+            self._reference = self._gray.copy()
+        else:
+            self._reference[...] = self._gray
+        self._reference_ts = timestamp
+
+    def invalidate(self):
+        """다음 프레임을 강제로 추론 (이전 결과를 재사용할 수 없을 때)"""
+        self._reference = None
+        self._reference_ts = None
+        self.focus_rect = None
+        self._focus_reference = None
+
+    @property
+    def skip_ratio(self):
+        """추론을 건너뛴 프레임 비율"""
+        return self.skipped / self.checked if self.checked else 0.0
+
+    @property
+    def skipped_per_hour(self):
+        """시간당 절약한 추론 호출 수 (프레임 타임스탬프 기준)"""
+        if self._first_ts is None or self._last_ts <= self._first_ts:
+            return 0.0
+        return self.skipped / (self._last_ts - self._first_ts) * 3600.0
+
+    def reset(self):
+        self.invalidate()
+        self.last_change = 0.0
+        self.checked = 0
+        self.skipped = 0
+        self.focus_changes = 0
+        self._first_ts = None
+        self._last_ts = None
@@ -0,0 +1,91 @@
+# client/services/perf.py
+"""
+파이프라인 성능 계측 유틸리티
+
+단계(stage)별 지연 시간을 최근 N개 샘플 링 버퍼로 보관하고
+last/avg/p50/p95 요약과 카운터(드롭 프레임 수 등)를 제공한다.
+"""
+
+import threading
+from collections import defaultdict, deque
+
+
+class StageStats:
+    """단계별 지연 시간(초) 및 카운터 집계"""
+
+    def __init__(self, window=300):
+        self.window = window
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._totals = defaultdict(int)  # 단계별 누적 샘플 수
+        self.counters = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, stage, seconds):
+        """단계 지연 시간 기록 (초 단위)"""
+        with self._lock:
+            self._samples[stage].append(seconds)
+            self._totals[stage] += 1
+
+    def incr(self, name, n=1):
+        """카운터 증가"""
+        with self._lock:
+            self.counters[name] += n
+
+    def set_counter(self, name, value):
+        with self._lock:
+            self.counters[name] = value
+
+    def clear_stage(self, stage):
+        """한 단계의 지연 시간 샘플만 비움 (재측정용)"""
+        with self._lock:
+            self._samples.pop(stage, None)
+            self._totals.pop(stage, None)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+            self.counters.clear()
+
+    @staticmethod
+    def _percentile(sorted_values, q):
+        if not sorted_values:
+            return 0.0
+        idx = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+        return sorted_values[idx]
+
+    def stage_summary(self, stage):
+        """단일 단계 요약 (밀리초 단위)"""
+        with self._lock:
+            values = list(self._samples.get(stage, ()))
+            total = self._totals.get(stage, 0)
+        if not values:
+            return {"count": total, "last_ms": 0.0, "avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0}
+        ordered = sorted(values)
+        return {
+            "count": total,
+            "last_ms": values[-1] * 1000.0,
+            "avg_ms": sum(values) / len(values) * 1000.0,
+            "p50_ms": self._percentile(ordered, 0.50) * 1000.0,
+            "p95_ms": self._percentile(ordered, 0.95) * 1000.0,
+        }
+
+    def snapshot(self):
+        """모든 단계 요약 + 카운터"""
+        with self._lock:
+            stages = list(self._samples.keys())
+            counters = dict(self.counters)
+        return {
+            "stages": {stage: self.stage_summary(stage) for stage in stages},
+            "counters": counters,
+        }
+
+    def format_summary(self):
+        """로그 출력용 한 줄 요약"""
+        snap = self.snapshot()
+        parts = [
+            f"{stage}={s['p50_ms']:.1f}/{s['p95_ms']:.1f}ms"
+            for stage, s in snap["stages"].items()
+        ]
+        parts += [f"{name}={value}" for name, value in snap["counters"].items()]
+        return " ".join(parts)
@@ -0,0 +1,188 @@
+# client/services/phone_detector.py
+"""
+휴대폰 감지 워커 (MediaPipe Object Detector, EfficientDet-Lite0)
+
+얼굴 랜드마크 추론과 분리된 별도 스레드에서 자체 주기(interval)로 최신 프레임만 검사한다.
+단일 프레임 오검출로 PHONE_DETECTED가 발생하지 않도록,
+최근 window_seconds 동안 hits_required 회 이상 감지되어야 감지 상태로 판단한다 (시간 기반 투표).
+
+최악의 감지 지연 ≈ interval * hits_required + 추론 시간
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+from mediapipe.tasks import python
+from mediapipe.tasks.python import vision
+from mediapipe import Image as MPImage
+from mediapipe.tasks.python.vision.core.image import ImageFormat
+
+from client.services.frame_buffer import FramePool
+
+
+class TemporalVote:
+    """최근 window_seconds 내 hits_required 회 이상 감지되면 True"""
+
+    def __init__(self, hits_required=2, window_seconds=3.0):
+        self.hits_required = hits_required
+        self.window_seconds = window_seconds
+        self._hits = deque()  # 감지된 타임스탬프
+
+    @property
+    def hit_count(self):
+        return len(self._hits)
+
+    def add(self, hit, timestamp):
+        """검사 결과 추가 후 투표 결과 반환"""
+        if hit:
+            self._hits.append(timestamp)
+        while self._hits and timestamp - self._hits[0] > self.window_seconds:
+            self._hits.popleft()
+        return self.decision
+
+    @property
+    def decision(self):
+        return len(self._hits) >= self.hits_required
+
+    def reset(self):
+        self._hits.clear()
+
+
+class PhoneDetector:
+    """최신 프레임 버퍼를 주기적으로 검사하는 휴대폰 감지 워커"""
+
+    CATEGORY_NAME = "cell phone"
+
+    def __init__(self, frame_buffer, stats, interval=1.0, hits_required=2, window_seconds=3.0,
+                 score_threshold=0.4):
+        """
+        :param frame_buffer: 캡처 스레드가 기록하는 LatestFrameBuffer (보조 소비자로 읽음)
+        :param stats: 지연 시간 기록용 StageStats
+        :param interval: 검사 주기 (초)
+        """
+        self.frame_buffer = frame_buffer
+        self.stats = stats
+        self.interval = interval
+        self.score_threshold = score_threshold  # 휴대폰 감지 최소 신뢰도
+        self.vote = TemporalVote(hits_required, window_seconds)
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._rgb_pool = FramePool(max_buffers=1)  # RGB 변환 버퍼 재사용 (MPImage가 생성 시 복사)
+
+        # 최신 감지 상태 (추론 루프/디버그 표시에서 읽음)
+        self.is_detected = False
+        self.last_result = None
+        self.last_score = 0.0
+
+        # 모델은 load()에서 생성 (VisionWorker 백그라운드 초기화 스레드에서 호출)
+        self.object_detector = None
+
+    @property
+    def available(self):
+        return self.object_detector is not None
+
+    def load(self, warm_up_shape=(480, 640, 3)):
+        """모델 로딩 + 빈 프레임 워밍업 (첫 실제 검사가 초기화 비용을 내지 않도록)"""
+        self.object_detector = self._load_model()
+        if self.object_detector is not None and warm_up_shape:
+            blank = np.zeros(warm_up_shape, dtype=np.uint8)
+            self.object_detector.detect(MPImage(image_format=ImageFormat.SRGB, data=blank))
+        return self.available
+
+    def _load_model(self):
+        """MediaPipe Object Detector 초기화 (모델이 없으면 None - 휴대폰 감지 비활성화)"""
+        object_model_path = os.path.join(os.path.dirname(__file__), 'efficientdet_lite0.tflite')
+
+        if not os.path.exists(object_model_path):
+            print(f"⚠️ Object Detector 모델 파일을 찾을 수 없습니다: {object_model_path}")
+            print("💡 휴대폰 감지 기능이 비활성화됩니다. 모델을 다운로드하세요: python download_object_detector_model.py")
+            return None
+
+        try:
+            object_base_options = python.BaseOptions(model_asset_path=object_model_path)
+            object_options = vision.ObjectDetectorOptions(
+                base_options=object_base_options,
+                max_results=5,  # 최대 5개 객체 감지
+                score_threshold=self.score_threshold,  # 최소 신뢰도 (얼굴 위치 상관없이 더 잘 잡히도록 완화)
+                category_allowlist=[self.CATEGORY_NAME]  # 휴대폰만 감지
+            )
+            detector = vision.ObjectDetector.create_from_options(object_options)
+            print(f"[OK] Object Detector 초기화 완료 (휴대폰 감지 활성화, {self.interval:.1f}초 주기)")
+            return detector
+        except Exception as e:
+            print(f"⚠️ Object Detector 초기화 실패: {e}")
+            print("💡 휴대폰 감지 기능이 비활성화됩니다. 모델을 다운로드하세요: python download_object_detector_model.py")
+            return None
+
+    def get_state(self):
+        """(투표 결과 감지 여부, 후보 존재 여부, 마지막 검출 결과) 반환"""
+        with self._lock:
+            return self.is_detected, self.vote.hit_count > 0, self.last_result
+
+    def detect_frame(self, frame_bgr, timestamp):
+        """
+        프레임 1장 검사 후 투표 결과 갱신 (워커 스레드 또는 오프라인 재생에서 동기 호출)
+        :return: 투표 결과 감지 여부
+        """
+        t0 = time.perf_counter()
+        frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, dst=self._rgb_pool.acquire(frame_bgr.shape))
+        mp_image = MPImage(image_format=ImageFormat.SRGB, data=frame_rgb)
+        result = self.object_detector.detect(mp_image)
+        self.stats.record("object_detector", time.perf_counter() - t0)
+        self.stats.incr("phone_checks")
+
+        best_score = 0.0
+        for detection in result.detections or []:
+            for category in detection.categories:
+                if category.category_name == self.CATEGORY_NAME and category.score >= self.score_threshold:
+                    best_score = max(best_score, category.score)
+
+        with self._lock:
+            self.is_detected = self.vote.add(best_score > 0.0, timestamp)
+            self.last_result = result
+            self.last_score = best_score
+            return self.is_detected
+
+    def _loop(self):
+        last_seq = 0
+        while not self._stop_event.is_set():
+            started = time.perf_counter()
+            item = self.frame_buffer.get(last_seq, timeout=self.interval, consume=False)
+            if item is not None:
+                last_seq, frame, capture_ts = item
+                try:
+                    self.detect_frame(frame, capture_ts)
+                except Exception as e:
+                    print(f"[WARNING] Object Detection 오류: {e}")
+            # 다음 검사 시각까지 대기 (stop 시 즉시 깨어남)
+            self._stop_event.wait(max(0.0, self.interval - (time.perf_counter() - started)))
+
+    def start(self):
+        if not self.available or self._thread is not None:
+            return
+        self._stop_event.clear()
+        with self._lock:
+            self.vote.reset()
+            self.is_detected = False
+            self.last_result = None
+        self._thread = threading.Thread(target=self._loop, name="PhoneDetector", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def close(self):
+        """검사 스레드 종료 + 모델 해제"""
+        self.stop()
+        if self.object_detector is not None:
+            self.object_detector.close()
+            self.object_detector = None
@@ -0,0 +1,167 @@
+# client/services/process_cache.py
+"""
+프로세스 메타데이터 LRU 캐시 (ScreenSensor 창 변경 경로용)
+
+브라우저 탭 전환처럼 같은 프로세스에서 창 제목만 자주 바뀌면, 매번 psutil.Process를 만들고
+name()/exe()를 다시 조회하는 것이 창 변경 처리에서 가장 비싼 부분이 된다.
+(pid, create_time)을 키로 이름/실행 파일 경로/분류 결과를 캐시한다.
+
+- 적중 시에는 Process.is_running()으로 프로세스가 살아 있고 PID가 재사용되지 않았는지만 확인
+  (psutil이 create_time을 비교해 PID 재사용을 구분함)
+- 종료된 프로세스 항목은 조회 시(is_running 실패) 또는 prune() 때 제거
+- 용량을 넘으면 가장 오래 사용하지 않은 항목부터 제거
+- stats(StageStats): lookup 지연 시간 + hits/misses/invalidations/evictions 카운터
+
+[사용 예시]
+    cache = ProcessCache(capacity=64)
+    info = cache.lookup(pid)  # ProcessInfo 또는 None (접근 불가/이미 종료)
+    info.name, info.exe, info.category
+"""
+
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import psutil
+
+from client.services.perf import StageStats
+from client.services.stats import DISTRACTING_KEYWORDS
+
+
+@dataclass
+class ProcessInfo:
+    """캐시 항목 (한 프로세스 인스턴스의 메타데이터)"""
+    pid: int
+    create_time: float
+    name: str
+    exe: str
+    category: str  # "distracting" / "neutral"
+    process: psutil.Process  # 적중 시 생존 확인용
+
+    @property
+    def key(self):
+        return (self.pid, self.create_time)
+
+
+def classify_process(name, exe=""):
+    """
+    프로세스 이름/실행 파일 이름만으로 분류 (창 제목과 무관하므로 캐시 가능)
+    창 제목 기반 판단은 SessionStats/Agent가 따로 함
+    """
+    targets = (name.lower(), os.path.basename(exe).lower())
+    for kw in DISTRACTING_KEYWORDS:
+        if any(kw in target for target in targets):
+            return "distracting"
+    return "neutral"
+
+
+class ProcessCache:
+    """(pid, create_time) 키 LRU 캐시"""
+
+    def __init__(self, capacity=64):
+        if capacity <= 0:
+            raise ValueError(f"잘못된 캐시 용량: {capacity}")
+        self.capacity = capacity
+        self._entries = OrderedDict()  # (pid, create_time) -> ProcessInfo (사용 순서)
+        self._by_pid = {}  # pid -> 현재 키 (PID로 바로 찾기 위한 인덱스)
+        self.stats = StageStats()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, pid):
+        """pid의 메타데이터 (캐시 적중 시 재조회 없음), 조회할 수 없으면 None"""
+        start = time.perf_counter()
+        try:
+            key = self._by_pid.get(pid)
+            if key is not None:
+                info = self._entries[key]
+                if self._is_alive(info):
+                    self._entries.move_to_end(key)
+                    self.stats.incr("hits")
+                    return info
+                # 프로세스 종료 또는 PID 재사용 -> 무효화 후 새로 조회
+                self._remove(key)
+                self.stats.incr("invalidations")
+
+            self.stats.incr("misses")
+            info = self._load(pid)
+            if info is not None:
+                self._insert(info)
+            return info
+        finally:
+            self.stats.record("lookup", time.perf_counter() - start)
+
+    def prune(self):
+        """종료된 프로세스 항목 제거 (제거한 개수 반환)"""
+        dead = [key for key, info in self._entries.items() if not self._is_alive(info)]
+        for key in dead:
+            self._remove(key)
+        if dead:
+            self.stats.incr("invalidations", len(dead))
+        return len(dead)
+
+    def clear(self):
+        self._entries.clear()
+        self._by_pid.clear()
+
+    def get_stats(self):
+        """적중률 + lookup 지연 시간 (ms)"""
+        snap = self.stats.snapshot()
+        counters = snap["counters"]
+        hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        lookups = hits + misses
+        return {
+            "size": len(self._entries),
+            "capacity": self.capacity,
+            "hits": hits,
+            "misses": misses,
+            "invalidations": counters.get("invalidations", 0),
+            "evictions": counters.get("evictions", 0),
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "lookup": snap["stages"].get("lookup"),
+        }
+
+    @staticmethod
+    def _is_alive(info):
+        try:
+            return info.process.is_running()
+        except psutil.Error:
+            return False
+
+    @staticmethod
+    def _load(pid):
+        try:
+            process = psutil.Process(pid)
+            with process.oneshot():
+                name = process.name().lower()
+                try:
+                    exe = process.exe()
+                except psutil.AccessDenied:
+                    exe = ""  # 권한이 높은 프로세스는 경로를 읽을 수 없음 (이름만 사용)
+            return ProcessInfo(
+                pid=pid,
+                create_time=process.create_time(),
+                name=name,
+                exe=exe,
+                category=classify_process(name, exe),
+                process=process,
+            )
+        except psutil.Error as e:
+            print(f"[WARNING] 프로세스 정보 조회 실패 (pid={pid}): {e}")
+            return None
+
+    def _insert(self, info):
+        self._entries[info.key] = info
+        self._by_pid[info.pid] = info.key
+        while len(self._entries) > self.capacity:
+            old_key, _ = self._entries.popitem(last=False)
+            if self._by_pid.get(old_key[0]) == old_key:
+                del self._by_pid[old_key[0]]
+            self.stats.incr("evictions")
+
+    def _remove(self, key):
+        self._entries.pop(key, None)
+        if self._by_pid.get(key[0]) == key:
+            del self._by_pid[key[0]]
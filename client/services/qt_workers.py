@@ -0,0 +1,93 @@
+# client/services/qt_workers.py
+"""
+Qt 어댑터 - Qt 없는 센서(VisionSensor, ScreenSensor)를 QThread + pyqtSignal로 감싼다.
+
+센서 로직은 client/services/vision.py, screen.py에 있고, 이 모듈은 UI가 쓰는 인터페이스만 제공한다:
+    alert_signal(Packet), start/stop/isRunning/wait (QThread)
+    ScreenWorker: dwell
+    VisionWorker: camera_status_signal(str, str), models_ready_signal(bool), debug_frames,
+                  set_debug_enabled, get_pipeline_stats, recalibrate, wait_until_ready
+센서 콜백은 센서 스레드에서 호출되므로 pyqtSignal.emit으로 넘기면 Qt가 수신 스레드(GUI)로 전달한다.
+"""
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from client.services.vision import VisionSensor
+from client.services.screen import ScreenSensor
+
+
+class VisionWorker(QThread):
+    """VisionSensor의 QThread 어댑터 (run()에서 센서 메인 루프 실행)"""
+    alert_signal = pyqtSignal(object)  # Packet 객체를 보냄
+    camera_status_signal = pyqtSignal(str, str)  # (CameraStatus 값, 메시지) - 카메라 연결/끊김 상태
+    models_ready_signal = pyqtSignal(bool)  # 백그라운드 모델 로딩 완료 (성공 여부)
+
+    def __init__(self, show_debug_window=False, **sensor_options):
+        """
+        :param sensor_options: VisionSensor 생성 인자 (running_mode, source 등)
+        """
+        super().__init__()
+        # 시그널을 모두 연결한 뒤 모델 로딩 시작 (연결 전에 로딩이 끝나 models_ready를 놓치지 않도록)
+        preload = sensor_options.pop("preload", True)
+        self.sensor = VisionSensor(show_debug_window=show_debug_window, preload=False, **sensor_options)
+        self.sensor.alert_signal.connect(self.alert_signal.emit)
+        self.sensor.camera_status_signal.connect(self.camera_status_signal.emit)
+        self.sensor.models_ready_signal.connect(self.models_ready_signal.emit)
+        self.debug_frames = self.sensor.debug_frames  # DebugWindow가 폴링하는 최신 프레임 슬롯
+        if preload:
+            self.sensor.start_loading()
+
+    @property
+    def running(self):
+        return self.sensor.running
+
+    @property
+    def is_ready(self):
+        return self.sensor.is_ready
+
+    def wait_until_ready(self, timeout=None):
+        return self.sensor.wait_until_ready(timeout)
+
+    def set_debug_enabled(self, enabled):
+        self.sensor.set_debug_enabled(enabled)
+
+    def get_pipeline_stats(self):
+        return self.sensor.get_pipeline_stats()
+
+    def recalibrate(self):
+        self.sensor.recalibrate()
+
+    def run(self):
+        self.sensor.run()
+
+    def stop(self):
+        """센서 종료 요청 후 스레드 종료 대기"""
+        self.sensor.request_stop()
+        self.wait()
+
+
+class ScreenWorker(QThread):
+    """ScreenSensor의 QThread 어댑터"""
+    alert_signal = pyqtSignal(object)  # Packet 객체를 보냄
+
+    def __init__(self, **sensor_options):
+        super().__init__()
+        self.sensor = ScreenSensor(**sensor_options)
+        self.sensor.alert_signal.connect(self.alert_signal.emit)
+
+    @property
+    def running(self):
+        return self.sensor.running
+
+    @property
+    def dwell(self):
+        """전경 창 체류 시간 타임라인 (SessionStats.attach_dwell)"""
+        return self.sensor.dwell
+
+    def run(self):
+        self.sensor.run()
+
+    def stop(self):
+        """센서 종료 요청 후 스레드 종료 대기"""
+        self.sensor.request_stop()
+        self.wait()
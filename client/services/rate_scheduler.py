@@ -0,0 +1,81 @@
+# client/services/rate_scheduler.py
+"""
+적응형 추론 주기 스케줄러
+
+상태가 안정적일 때(집중 중)는 낮은 idle 주기(min_fps)로 추론하고,
+눈 감음/얼굴 부재/휴대폰 후보 등 조건이 쌓이기 시작하면 즉시 최대 주기(max_fps)로 올린다.
+조건이 사라지면 idle_after 초 후부터 점진적으로 min_fps까지 내려간다.
+
+[사용 예시]
+    scheduler = AdaptiveRateScheduler(min_fps=3, max_fps=30)
+    while running:
+        time.sleep(scheduler.time_until_next(time.perf_counter()))
+        ... 추론 ...
+        scheduler.mark_run(now)
+        scheduler.update(condition_building, now)
+"""
+
+
+class AdaptiveRateScheduler:
+    """조건 기반 추론 FPS 조절"""
+
+    def __init__(self, min_fps=3.0, max_fps=30.0, idle_after=3.0, decay=0.7):
+        if min_fps <= 0 or max_fps < min_fps:
+            raise ValueError(f"잘못된 FPS 범위: min_fps={min_fps}, max_fps={max_fps}")
+        self.min_fps = float(min_fps)
+        self.max_fps = float(max_fps)
+        self.idle_after = idle_after  # 조건이 사라진 뒤 속도를 낮추기 시작할 때까지의 시간 (초)
+        self.decay = decay  # idle 구간에서 업데이트마다 target_fps에 곱하는 감쇠 계수
+
+        self.target_fps = self.max_fps  # 시작 직후에는 최대 속도로 상태 파악
+        self._last_active_ts = None
+        self._last_run_ts = None
+        self._interval_ema = None  # 실제 추론 간격 지수 이동 평균 (초)
+
+    @property
+    def interval(self):
+        """현재 목표 추론 간격 (초)"""
+        return 1.0 / self.target_fps
+
+    @property
+    def effective_fps(self):
+        """실제 측정된 추론 FPS"""
+        if not self._interval_ema:
+            return 0.0
+        return 1.0 / self._interval_ema
+
+    def time_until_next(self, now):
+        """다음 추론까지 남은 시간 (초, 0이면 즉시)"""
+        if self._last_run_ts is None:
+            return 0.0
+        return max(0.0, self._last_run_ts + self.interval - now)
+
+    def mark_run(self, now):
+        """추론 1회 수행 기록 (실제 FPS 측정용)"""
+        if self._last_run_ts is not None:
+            dt = now - self._last_run_ts
+            if self._interval_ema is None:
+                self._interval_ema = dt
+            else:
+                self._interval_ema = 0.9 * self._interval_ema + 0.1 * dt
+        self._last_run_ts = now
+
+    def update(self, building, now):
+        """
+        추론 결과 반영
+        :param building: 감지 조건이 쌓이는 중인지 (눈 감음 시작, 얼굴 사라짐, 휴대폰 후보 등)
+        :param now: 현재 시각 (초)
+        """
+        if building or self._last_active_ts is None:
+            self._last_active_ts = now
+            if building:
+                self.target_fps = self.max_fps
+            return
+        if now - self._last_active_ts >= self.idle_after:
+            self.target_fps = max(self.min_fps, self.target_fps * self.decay)
+
+    def reset(self):
+        self.target_fps = self.max_fps
+        self._last_active_ts = None
+        self._last_run_ts = None
+        self._interval_ema = None
@@ -0,0 +1,78 @@
+# client/services/resolution_ladder.py
+"""
+추론 입력 해상도 단계 (Resolution Ladder)
+
+랜드마크 모델에 넣기 전 이미지(전체 프레임 또는 얼굴 ROI)의 최대 너비를 단계(예: 1280 -> 640 -> 320) 중에서
+측정된 추론 시간(RGB 변환 + 리사이즈 + 랜드마크)에 따라 고른다.
+- 최근 window개 추론 시간의 중앙값이 budget_ms를 넘으면 한 단계 낮춤
+- 더 긴 구간(upgrade_window개) 동안 중앙값이 budget_ms x upgrade_ratio 미만이면 한 단계 올림
+  (올리는 쪽을 느리게 해서 두 단계 사이를 오가지 않게 함)
+단계가 바뀌면 측정 구간을 비우고 새 해상도 기준으로 다시 잰다.
+
+[사용 예시]
+    ladder = ResolutionLadder(widths=(1280, 640, 320), budget_ms=25)
+    width = ladder.width                 # None이면 축소하지 않음
+    ... 추론 ...
+    ladder.record(elapsed_seconds)
+"""
+
+import threading
+from collections import deque
+
+import numpy as np
+
+
+class ResolutionLadder:
+    """측정 추론 시간 기반 입력 너비 선택"""
+
+    def __init__(self, widths=(1280, 640, 320), budget_ms=25.0, window=30, upgrade_window=120, upgrade_ratio=0.5):
+        """
+        :param widths: 입력 최대 너비 단계 (px) - 비어 있으면 축소하지 않음
+        :param budget_ms: 프레임당 추론 시간 목표 (ms)
+        """
+        self.widths = sorted({int(w) for w in widths if int(w) > 0}, reverse=True)
+        self.budget = budget_ms / 1000.0
+        self.upgrade_ratio = upgrade_ratio
+        self._lock = threading.Lock()  # LIVE_STREAM 모드에서는 결과 콜백 스레드가 기록
+        self._samples = deque(maxlen=max(window, upgrade_window))
+        self.window = window
+        self.upgrade_window = upgrade_window
+        self.index = 0
+        self.changes = 0  # 단계 변경 횟수
+
+    @property
+    def width(self):
+        """현재 입력 최대 너비 (px), 단계가 없으면 None"""
+        if not self.widths:
+            return None
+        return self.widths[self.index]
+
+    def record(self, seconds):
+        """추론 1회 소요 시간 기록 후 필요하면 단계 변경 - 바뀌었으면 True"""
+        if len(self.widths) < 2:
+            return False
+        with self._lock:
+            self._samples.append(seconds)
+            if len(self._samples) >= self.window:
+                recent = np.median(list(self._samples)[-self.window:])
+                if recent > self.budget and self.index < len(self.widths) - 1:
+                    return self._step(1)
+            if len(self._samples) >= self.upgrade_window and self.index > 0:
+                if np.median(self._samples) < self.budget * self.upgrade_ratio:
+                    return self._step(-1)
+            return False
+
+    def _step(self, delta):
+        previous = self.widths[self.index]
+        self.index += delta
+        self._samples.clear()
+        self.changes += 1
+        print(f"[VISION] 추론 입력 해상도 {previous}px -> {self.widths[self.index]}px "
+              f"(목표 {self.budget * 1000:.0f}ms)")
+        return True
+
+    def reset(self):
+        with self._lock:
+            self.index = 0
+            self._samples.clear()
+            self.changes = 0
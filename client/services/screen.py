@@ -1,6 +1,6 @@
 # client/services/screen.py
 """
-Screen Monitoring Service - Windows 활성 창 제목 모니터링
+Screen Monitoring Service - 활성 창 제목 모니터링
 
 [주요 기능]
 1. 활성 창 제목 추출
@@ -11,313 +11,395 @@ Screen Monitoring Service - Windows 활성 창 제목 모니터링
 [이벤트 타입]
 - WINDOW_CHANGE: 활성 창이 변경되었을 때
 
+[플랫폼 백엔드] (client/services/screen_backends.py, Config.SCREEN_BACKEND)
+- windows: SetWinEventHook (포커스 변경 + 전경 창 제목 변경), 훅 실패 시 폴링
+- x11: _NET_ACTIVE_WINDOW / _NET_WM_NAME PropertyNotify (폴링 없음)
+- fake: 창 제목 타임라인 재생 (테스트/처리량 측정, tools/bench_screen.py)
+
+[감지 방식] (이벤트 우선)
+- 백엔드가 창 변경 알림을 큐에 넣기만 하고, 오래 사는 디스패처 스레드 1개가 큐에서 꺼내 창 제목을 확인한다
+  (이벤트마다 스레드를 만들지 않음). 센서 스레드는 백엔드 이벤트 루프에서 대기하므로 이벤트가 없으면 깨어나지 않는다.
+- 알림을 놓칠 수 있는 백엔드(windows)는 SCREEN_POLL_INTERVAL(기본 1초)마다 안전망 폴링
+- 폴링 모드 (알림을 받을 수 없을 때): 디스패처가 SCREEN_FALLBACK_POLL_INTERVAL(50ms)마다 확인
+- 카운터: 알림 이벤트 / 폴링 / 디스패처 깨어남 횟수와 분당 비율 (get_stats)
+
+[제목 변화 묶기] (client/services/title_coalescer.py, SCREEN_TITLE_COALESCE)
+- 재생 시간, "(3) Inbox" 배지, 터미널 명령처럼 같은 창 안의 제목 변화는 WINDOW_CHANGE로 보내지 않음
+- 정규화된 (제목, 프로세스)가 바뀌고 SCREEN_TITLE_SETTLE_SECONDS 동안 유지되면 발송
+
+[체류 시간] (client/services/dwell.py)
+- 정규화된 창이 바뀔 때마다 dwell 타임라인에 구간을 기록 (발송 여부/settle과 무관하게 바뀐 시각 기준)
+- SessionStats가 세션 종료 시 집중/딴짓 시간을 누적값으로 바로 가져감 (attach_dwell)
+
 [사용 예시]
-    screen_worker = ScreenWorker()
-    screen_worker.alert_signal.connect(on_alert)
-    screen_worker.start()
+    screen_sensor = ScreenSensor()  # Qt 없이 실행 (GUI 앱은 qt_workers.ScreenWorker 어댑터 사용)
+    screen_sensor.alert_signal.connect(on_alert)
+    screen_sensor.start()
 """
 
 import sys
 import os
 import time
+import queue
 import threading
-from PyQt6.QtCore import QThread, pyqtSignal
-
-# Windows API (pywin32)
-try:
-    import win32gui
-    import win32process
-    import win32con
-    import psutil
-    WINDOWS_AVAILABLE = True
-except ImportError:
-    WINDOWS_AVAILABLE = False
-    print("[WARNING] Windows API를 사용할 수 없습니다. pywin32와 psutil이 설치되어 있는지 확인하세요.")
-
-# ctypes for SetWinEventHook (not available in win32gui)
-if WINDOWS_AVAILABLE:
-    try:
-        import ctypes
-        from ctypes import wintypes
-        user32 = ctypes.windll.user32
-        ole32 = ctypes.windll.ole32
-        
-        # SetWinEventHook 함수 타입 정의
-        WINEVENTPROC = ctypes.WINFUNCTYPE(
-            None,
-            wintypes.HANDLE,
-            wintypes.DWORD,
-            wintypes.HWND,
-            ctypes.c_long,
-            ctypes.c_long,
-            wintypes.DWORD,
-            wintypes.DWORD
-        )
-        
-        EVENT_HOOK_AVAILABLE = True
-    except Exception as e:
-        EVENT_HOOK_AVAILABLE = False
-        print(f"[WARNING] Event Hook 기능을 사용할 수 없습니다: {e}")
-else:
-    EVENT_HOOK_AVAILABLE = False
 
 # shared 폴더 import를 위한 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from shared.protocol import Packet, PacketMeta
 from shared.constants import ScreenEvents, PacketCategory
+from client.services.sensor import Signal, SensorThread
+from client.services.perf import StageStats
+from client.services.process_cache import ProcessCache
+from client.services.screen_backends import create_backend
+from client.services.title_coalescer import TitleCoalescer, normalize_title
+from client.services.dwell import DwellTracker, DISTRACTING
+from client.services.stats import is_distracting
+from client.config import Config
+
+
+class ScreenSensor(SensorThread):
+    """활성 창 제목 모니터링 (Qt 없이 실행, 플랫폼별 처리는 백엔드가 담당)"""
+    STATS_LOG_INTERVAL = 60.0  # 이벤트/폴링 카운터 로그 주기 (초)
+    PROCESS_PRUNE_INTERVAL = 30.0  # 종료된 프로세스 캐시 항목 정리 주기 (초)
+
+    def __init__(self, check_interval=2.0, backend=None):
+        """
+        :param backend: ScreenBackend 인스턴스 (None이면 Config.SCREEN_BACKEND로 생성)
+        """
+        super().__init__(name="ScreenSensor")
+        self.alert_signal = Signal()  # Packet 객체를 보냄
+
+        if backend is None:
+            backend = create_backend(Config.SCREEN_BACKEND, use_event_hook=Config.SCREEN_EVENT_HOOK)
+        self.backend = backend
+        self.poll_interval = Config.SCREEN_POLL_INTERVAL  # 안전망 폴링 간격 (초)
+        self.fallback_poll_interval = Config.SCREEN_FALLBACK_POLL_INTERVAL  # 폴링 모드 간격 (초)
+        self.mode = "polling"  # 실제 동작 모드 ("event" / "polling")
+
+        # 백엔드 알림 -> 디스패처 스레드 (None은 종료 신호)
+        self._events = queue.Queue()
+        self._dispatcher_thread = None
+        self.stats = StageStats()
+        self._started_at = None
 
-class ScreenWorker(QThread):
-    """Windows 활성 창 제목 모니터링"""
-    # 메인 UI로 보낼 신호 정의
-    alert_signal = pyqtSignal(object)  # Packet 객체를 보냄
-    
-    def __init__(self, check_interval=2.0):
-        super().__init__()
-        self.running = False
-        
-        # 창 제목 체크 간격
-        self.window_check_interval = 0.05  # 창 제목 체크 간격 (50ms) - 크롬 탭 변경 감지용
-        self._last_window_title_check = 0  # 마지막 창 제목 체크 시간
-        
-        # 이벤트 기반 창 감지 (사용 안 함으로 설정 - 폴링 모드 사용)
-        self.use_event_hook = False  # 이벤트 기반 창 감지 사용 여부
-        self._event_hook_handle = None  # Windows Event Hook 핸들
-        self._win_event_callback = None  # 콜백 함수 참조 유지 (가비지 컬렉션 방지)
-        
         self.last_alert_time = {}  # 각 이벤트별 마지막 알림 시간 (중복 방지)
-        
+
         # 스레드 동기화를 위한 Lock (경쟁 조건 방지)
         self._check_lock = threading.Lock()
-        
+
         # 현재 상태 추적
         self.current_window_title = None
         self.current_process_name = None
-        
-        if not WINDOWS_AVAILABLE:
-            print("[WARNING] Screen Worker가 Windows 환경에서만 작동합니다.")
-    
+
+        # 프로세스 메타데이터 캐시 (탭 전환마다 psutil.Process를 새로 만들지 않도록)
+        self.process_cache = ProcessCache(capacity=Config.SCREEN_PROCESS_CACHE_SIZE)
+        self.current_process = None  # ProcessInfo (이름/경로/분류)
+
+        # 같은 창 안의 제목 변화(배지/재생 시간 등)는 묶어서 WINDOW_CHANGE 발송 (None이면 매 변화마다 발송)
+        self.title_coalescer = None
+        if Config.SCREEN_TITLE_COALESCE:
+            self.title_coalescer = TitleCoalescer(settle_delay=Config.SCREEN_TITLE_SETTLE_SECONDS)
+
+        # 전경 창 체류 시간 (세션마다 run()에서 초기화)
+        self.dwell = DwellTracker()
+
+        if self.backend is None:
+            print("[WARNING] 사용할 수 있는 Screen 백엔드가 없습니다. "
+                  "(Windows: pywin32, Linux: python-xlib + X11 DISPLAY 필요)")
+
     def get_active_window_title(self):
         """현재 활성 창의 제목 가져오기"""
-        if not WINDOWS_AVAILABLE:
+        if self.backend is None:
             return None
-        
+
         try:
-            hwnd = win32gui.GetForegroundWindow()
-            window_title = win32gui.GetWindowText(hwnd)
+            window = self.backend.active_window()
+            window_title = self.backend.window_title(window) if window is not None else None
             return window_title if window_title else None
         except Exception as e:
             print(f"[WARNING] 활성 창 제목 가져오기 실패: {e}")
             return None
-    
-    def get_active_process_name(self):
-        """현재 활성 창의 프로세스 이름 가져오기"""
-        if not WINDOWS_AVAILABLE:
+
+    def get_active_process(self, window=None):
+        """현재 활성 창(또는 window)의 프로세스 정보 (ProcessInfo, 캐시 사용)"""
+        if self.backend is None:
             return None
-        
+
         try:
-            hwnd = win32gui.GetForegroundWindow()
-            _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            process = psutil.Process(pid)
-            return process.name().lower()
+            if window is None:
+                window = self.backend.active_window()
+            pid = self.backend.window_pid(window) if window is not None else None
+            return self.process_cache.lookup(pid) if pid else None
         except Exception as e:
-            print(f"[WARNING] 활성 프로세스 이름 가져오기 실패: {e}")
+            print(f"[WARNING] 활성 프로세스 정보 가져오기 실패: {e}")
             return None
-    
+
+    def get_active_process_name(self, window=None):
+        """현재 활성 창의 프로세스 이름 가져오기"""
+        info = self.get_active_process(window)
+        return info.name if info else None
+
     def _check_window_title_change(self):
         """
         창 제목 변경 체크 (크롬 탭 변경 등 감지용)
         마우스로 클릭할 때 앱이 detect 되는 기능
-        
+
         Thread-safe: 여러 스레드에서 동시 호출되어도 경쟁 조건 방지
         """
         # Lock을 사용하여 동시 실행 방지 (경쟁 조건 방지)
         with self._check_lock:
+            start = time.perf_counter()
             try:
-                current_hwnd = win32gui.GetForegroundWindow()
-                if current_hwnd:
-                    window_title = win32gui.GetWindowText(current_hwnd)
+                current_window = self.backend.active_window()
+                if current_window is not None:
+                    window_title = self.backend.window_title(current_window)
                     if window_title and window_title != self.current_window_title:
                         self.current_window_title = window_title
-                        
-                        # 창 변경 시에만 프로세스 이름 가져오기
-                        process_name = self.get_active_process_name()
+                        self.stats.incr("window_changes")
+
+                        # 창 변경 시에만 프로세스 정보 가져오기 (같은 프로세스면 캐시 적중)
+                        process = self.get_active_process(current_window)
+                        process_name = process.name if process else None
+                        self.current_process = process
                         self.current_process_name = process_name
-                        
-                        # WINDOW_CHANGE 이벤트 발송
-                        if self.should_alert(ScreenEvents.WINDOW_CHANGE):
-                            packet = Packet(
-                                event=ScreenEvents.WINDOW_CHANGE,
-                                data={
-                                    "window_title": window_title,
-                                    "process_name": process_name or "unknown"
-                                },
-                                meta=PacketMeta(category=PacketCategory.SCREEN)
-                            )
-                            self.alert_signal.emit(packet)
-                            print(f"[SCREEN] 창 변경: {window_title}")
-                        
+
+                        data = {
+                            "window_title": window_title,
+                            "process_name": process_name or "unknown",
+                            "process_category": process.category if process else "unknown"
+                        }
+                        self._record_dwell(window_title, process_name, process)
+                        if self.title_coalescer is not None:
+                            # 같은 창 안의 제목 변화면 None (정체성이 바뀌면 settle 후 _flush_title_change에서 발송)
+                            data = self.title_coalescer.offer(window_title, process_name, data, time.monotonic())
+                        if data is not None:
+                            self._emit_window_change(data)
+
                         return True
                 return False
             except Exception as e:
                 print(f"[WARNING] 창 제목 확인 중 오류: {e}")
                 return False
-    
-    def _on_window_focus_change(self, hWinEventHook, event, hwnd, idObject, idChild, dwEventThread, dwmsTimeStamp):
-        """
-        Windows Event Hook 콜백: 창 포커스 변경 시 즉시 호출됨
-        이벤트 기반으로 즉시 반응 (CPU 사용량 거의 0, 딜레이 없음)
-        크롬 탭 변경도 즉시 감지
-        """
-        try:
-            # 활성 창이 변경되었을 때만 처리
-            if event == win32con.EVENT_SYSTEM_FOREGROUND:
-                # 약간의 지연 후 창 제목 가져오기 (크롬 탭 변경 시 제목 업데이트 대기)
-                def check_window_title():
-                    time.sleep(0.05)  # 50ms 대기 (크롬이 제목 업데이트할 시간)
-                    if not self.running:
-                        return
-                    
-                    # 창 제목 변경 체크
-                    self._check_window_title_change()
-                
-                # 별도 스레드에서 실행 (메인 루프 블로킹 방지)
-                threading.Thread(target=check_window_title, daemon=True).start()
-        except Exception as e:
-            print(f"[WARNING] 창 포커스 변경 콜백 오류: {e}")
-    
+            finally:
+                self.stats.record("window_check", time.perf_counter() - start)
+
+    def _record_dwell(self, window_title, process_name, process):
+        """체류 시간 타임라인 갱신 (같은 정규화 창이면 DwellTracker가 무시)"""
+        if self.title_coalescer is not None:
+            normalized_title, normalized_process = self.title_coalescer.identity(window_title, process_name)
+        else:
+            normalized_title, normalized_process = normalize_title(window_title), (process_name or "")
+        distracting = (process is not None and process.category == DISTRACTING) or \
+            is_distracting(window_title, process_name)
+        category = DISTRACTING if distracting else "neutral"
+        self.dwell.switch(normalized_process, normalized_title, category, time.time())
+
+    def _emit_window_change(self, data):
+        """WINDOW_CHANGE 이벤트 발송"""
+        if self.should_alert(ScreenEvents.WINDOW_CHANGE):
+            packet = Packet(
+                event=ScreenEvents.WINDOW_CHANGE,
+                data=data,
+                meta=PacketMeta(category=PacketCategory.SCREEN)
+            )
+            self.alert_signal.emit(packet)
+            print(f"[SCREEN] 창 변경: {data['window_title']}")
+
+    def _flush_title_change(self, force=False):
+        """settle_delay가 지난 창 변경 후보 발송 (force=True면 대기 중인 후보를 바로 발송)"""
+        if self.title_coalescer is None:
+            return
+        with self._check_lock:
+            if force:
+                data = self.title_coalescer.flush()
+            else:
+                data = self.title_coalescer.pop_due(time.monotonic())
+            if data is not None:
+                self._emit_window_change(data)
+
+    def _on_backend_event(self, kind):
+        """백엔드 알림 ("focus" / "title"): 큐에 넣기만 하고 바로 반환 (백엔드 이벤트 루프 스레드)"""
+        self.stats.incr("events")
+        self._events.put(kind)
+
     def should_alert(self, event_type, cooldown_seconds=5):
         """
         중복 알림 방지 (쿨다운)
-        
+
         WINDOW_CHANGE 이벤트는 쿨다운 없이 즉시 발송 (크롬 탭 변경 등 빠른 반응 필요)
         """
         # WINDOW_CHANGE는 쿨다운 없이 항상 발송 (크롬 탭 변경 등 즉시 반응 필요)
         if event_type == ScreenEvents.WINDOW_CHANGE:
             return True
-        
+
         current_time = time.time()
         last_time = self.last_alert_time.get(event_type, 0)
-        
+
         if current_time - last_time < cooldown_seconds:
             return False
-        
+
         self.last_alert_time[event_type] = current_time
         return True
-    
-    def run(self):
+
+    def _dispatch_loop(self):
         """
-        메인 모니터링 루프 (창 제목 변경 감지)
-        마우스로 클릭할 때 앱이 detect 되는 기능
+        디스패처 스레드: 백엔드 알림을 모아서 창 제목 확인 (None을 받으면 남은 알림까지 처리하고 종료)
+        폴링이 필요한 모드에서는 큐가 interval 동안 비어 있으면 창 확인 1회
         """
-        if not WINDOWS_AVAILABLE:
-            print("[ERROR] Screen Worker는 Windows 환경에서만 작동합니다.")
-            return
-        
-        self.running = True
-        print("[OK] Screen Worker 시작 - 활성 창 제목 모니터링")
-        
-        # ========== Windows Event Hook 설정 (이벤트 기반 창 감지) ==========
-        if self.use_event_hook and WINDOWS_AVAILABLE and EVENT_HOOK_AVAILABLE:
+        if not self.backend.event_driven:
+            interval = self.fallback_poll_interval
+        elif self.backend.safety_poll:
+            interval = self.poll_interval
+        else:
+            interval = None  # 순수 이벤트 기반 - 정리/로그 주기로만 깨어남
+        settle_delay = self.backend.settle_delay
+        last_stats_log = time.monotonic()
+        last_prune = last_stats_log
+        stopping = False
+        while not stopping:
+            timeout = interval or self.PROCESS_PRUNE_INTERVAL
+            title_due = self.title_coalescer.time_until_due(time.monotonic()) if self.title_coalescer else None
+            settle_wakeup = title_due is not None and title_due < timeout
             try:
-                # Windows Event Hook 설정
-                # EVENT_SYSTEM_FOREGROUND: 활성 창이 변경될 때 발생
-                # Bug Fix 1: 콜백 함수를 인스턴스 변수로 저장하여 가비지 컬렉션 방지
-                def win_event_callback(hWinEventHook, event, hwnd, idObject, idChild, dwEventThread, dwmsTimeStamp):
-                    """Windows Event Hook 콜백 래퍼"""
-                    if self.running:
-                        self._on_window_focus_change(hWinEventHook, event, hwnd, idObject, idChild, dwEventThread, dwmsTimeStamp)
-                
-                # 콜백 함수 참조 유지 (가비지 컬렉션 방지)
-                self._win_event_callback = WINEVENTPROC(win_event_callback)
-                
-                # Bug Fix 2: ctypes를 사용하여 SetWinEventHook 직접 호출
-                # win32gui에는 SetWinEventHook이 없으므로 ctypes로 직접 바인딩
-                SetWinEventHook = user32.SetWinEventHook
-                SetWinEventHook.argtypes = [
-                    wintypes.DWORD,  # eventMin
-                    wintypes.DWORD,  # eventMax
-                    wintypes.HMODULE,  # hmodWinEventProc
-                    WINEVENTPROC,  # lpfnWinEventProc
-                    wintypes.DWORD,  # idProcess
-                    wintypes.DWORD,  # idThread
-                    wintypes.DWORD   # dwFlags
-                ]
-                SetWinEventHook.restype = wintypes.HANDLE
-                
-                # Event Hook 등록
-                self._event_hook_handle = SetWinEventHook(
-                    win32con.EVENT_SYSTEM_FOREGROUND,  # 이벤트 타입: 활성 창 변경
-                    win32con.EVENT_SYSTEM_FOREGROUND,  # 이벤트 범위
-                    0,  # hmodWinEventProc (0 = 현재 프로세스)
-                    self._win_event_callback,  # 콜백 함수
-                    0,  # 프로세스 ID (0 = 모든 프로세스)
-                    0,  # 스레드 ID (0 = 모든 스레드)
-                    win32con.WINEVENT_OUTOFCONTEXT  # 컨텍스트
-                )
-                
-                if self._event_hook_handle:
-                    print("[INFO] 이벤트 기반 창 감지 활성화 (즉시 반응, CPU 사용량 거의 0)")
+                item = self._events.get(timeout=title_due if settle_wakeup else timeout)
+            except queue.Empty:
+                if settle_wakeup:
+                    item = "settle"
+                else:
+                    item = "poll" if interval else "idle"
+            if item is None:
+                break
+            self.stats.incr("wakeups")
+            try:
+                if item in ("poll", "idle"):
+                    if time.monotonic() - last_prune >= self.PROCESS_PRUNE_INTERVAL:
+                        # 종료된 프로세스 캐시 항목 정리
+                        last_prune = time.monotonic()
+                        with self._check_lock:
+                            self.process_cache.prune()
+                    if item == "poll":
+                        self.stats.incr("polls")
+                        self._check_window_title_change()
+                elif item == "settle":
+                    pass  # 아래에서 후보 발송
                 else:
-                    raise Exception("SetWinEventHook returned NULL")
+                    # 크롬 탭 전환 등 제목 갱신 대기 후 그동안 쌓인 알림을 한 번에 처리
+                    if settle_delay:
+                        time.sleep(settle_delay)
+                    while True:
+                        try:
+                            pending = self._events.get_nowait()
+                        except queue.Empty:
+                            break
+                        if pending is None:
+                            stopping = True
+                            break
+                        self.stats.incr("coalesced_events")
+                    self._check_window_title_change()
+                self._flush_title_change()
             except Exception as e:
-                print(f"[WARNING] 이벤트 기반 창 감지 설정 실패, 폴링 모드로 전환: {e}")
-                import traceback
-                traceback.print_exc()
-                self.use_event_hook = False
-                self._win_event_callback = None
-        
+                print(f"[ERROR] Screen Worker 창 확인 중 오류 발생: {e}")
+                time.sleep(0.1)
+
+            if time.monotonic() - last_stats_log >= self.STATS_LOG_INTERVAL:
+                last_stats_log = time.monotonic()
+                stats = self.get_stats()
+                rates, cache = stats["per_minute"], stats["process_cache"]
+                lookup_ms = cache["lookup"]["p50_ms"] if cache["lookup"] else 0.0
+                print(f"[SCREEN] events {rates['events']:.0f}/min, polls {rates['polls']:.0f}/min, "
+                      f"wakeups {rates['wakeups']:.0f}/min, suppressed {rates['suppressed']:.0f}/min | "
+                      f"process cache hit {cache['hit_rate']:.0%}, lookup p50 {lookup_ms:.2f}ms")
+
+        # 종료 직전 마지막 창 변경 후보 (녹화 타임라인 끝 등)
+        self._flush_title_change(force=True)
+
+    def get_stats(self):
+        """
+        카운터와 분당 비율
+        - events: 받은 백엔드 알림 (windows 제목 변경은 전경 창 것만), coalesced_events: 한 번에 묶여 처리된 알림
+        - polls: 안전망/폴링 모드 확인 횟수, wakeups: 디스패처가 깨어난 횟수, window_changes: WINDOW_CHANGE 발생
+        - suppressed/superseded: 제목 변화 묶기로 보내지 않은 변화 (같은 창 / settle 전에 밀려난 후보)
+        - window_check: 창 확인 1회 지연 시간, process_cache: 프로세스 캐시 적중률과 lookup 지연 시간
+        """
+        snap = self.stats.snapshot()
+        counters = dict(snap["counters"])
+        if self.title_coalescer is not None:
+            coalesced = self.title_coalescer.get_stats()
+            counters["suppressed"] = coalesced["suppressed"]
+            counters["superseded"] = coalesced["superseded"]
+        elapsed_minutes = (time.monotonic() - self._started_at) / 60.0 if self._started_at else 0.0
+        names = ("events", "coalesced_events", "polls", "wakeups", "window_changes", "suppressed", "superseded")
+        return {
+            "backend": self.backend.name if self.backend else None,
+            "mode": self.mode,
+            "counters": {name: counters.get(name, 0) for name in names},
+            "per_minute": {
+                name: round(counters.get(name, 0) / elapsed_minutes, 1) if elapsed_minutes > 0 else 0.0
+                for name in names
+            },
+            "window_check": snap["stages"].get("window_check"),
+            "process_cache": self.process_cache.get_stats(),
+        }
+
+    def run(self):
+        """
+        메인 루프: 백엔드 이벤트 루프에서 대기 (이벤트가 없으면 깨어나지 않음)
+        창 제목 확인은 모두 디스패처 스레드에서 처리
+        """
+        if self.backend is None:
+            print("[ERROR] Screen Worker를 실행할 백엔드가 없습니다.")
+            return
+
+        self.running = True
+        self._events = queue.Queue()
+        self.stats.reset()
+        self.dwell.reset()
+        if self.title_coalescer is not None:
+            self.title_coalescer.reset()
+            self.title_coalescer.stats.reset()
+        self._started_at = time.monotonic()
+        print(f"[OK] Screen Worker 시작 - 활성 창 제목 모니터링 ({self.backend.name})")
+
         try:
-            while self.running:
-                try:
-                    current_time = time.time()
-                    
-                    # ========== 창 제목 체크 (크롬 탭 변경 감지용) ==========
-                    # 이벤트 기반으로는 창 포커스 변경만 감지되므로,
-                    # 크롬 탭 변경 등 제목만 바뀌는 경우를 위해 주기적으로 체크
-                    if current_time - self._last_window_title_check >= self.window_check_interval:
-                        self._check_window_title_change()
-                        self._last_window_title_check = current_time
-                    
-                    # 이벤트 기반 모드: Windows 메시지 펌프 (이벤트 처리)
-                    if self.use_event_hook:
-                        # Windows 메시지 펌프를 통해 이벤트 처리
-                        win32gui.PumpWaitingMessages()
-                        time.sleep(0.05)  # 매우 짧은 대기 (크롬 탭 변경 감지 반응성 향상)
-                    else:
-                        # 폴링 모드 (이벤트 훅이 실패한 경우)
-                        time.sleep(0.05)  # 창 제목 체크 간격과 동일하게 설정
-                
-                except Exception as e:
-                    print(f"[ERROR] Screen Worker 프레임 처리 중 오류 발생: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    time.sleep(0.1)
-                    continue
-        
+            self.backend.open(self._on_backend_event)
+        except Exception as e:
+            print(f"[ERROR] Screen 백엔드 초기화 실패 ({self.backend.name}): {e}")
+            self.running = False
+            return
+
+        self.mode = "event" if self.backend.event_driven else "polling"
+        if not self.backend.event_driven:
+            print(f"[INFO] 폴링 모드 ({self.fallback_poll_interval * 1000:.0f}ms)")
+        elif self.backend.safety_poll:
+            print(f"[INFO] 이벤트 기반 창 감지 활성화 (안전망 폴링 {self.poll_interval:.1f}초)")
+        else:
+            print("[INFO] 이벤트 기반 창 감지 활성화")
+
+        # 시작 시점의 창을 바로 확인한 뒤 디스패처 시작
+        self._check_window_title_change()
+        self._dispatcher_thread = threading.Thread(target=self._dispatch_loop, name="ScreenDispatcher", daemon=True)
+        self._dispatcher_thread.start()
+
+        try:
+            if self.running:
+                self.backend.run_loop()
         except Exception as e:
             print(f"[ERROR] Screen Worker 치명적 오류: {e}")
             import traceback
             traceback.print_exc()
         finally:
             self.running = False
-            
-            # Event Hook 해제
-            if self._event_hook_handle:
-                try:
-                    # Bug Fix 2: ctypes를 사용하여 UnhookWinEventHook 직접 호출
-                    if EVENT_HOOK_AVAILABLE:
-                        UnhookWinEventHook = user32.UnhookWinEvent
-                        UnhookWinEventHook.argtypes = [wintypes.HANDLE]
-                        UnhookWinEventHook.restype = wintypes.BOOL
-                        UnhookWinEventHook(self._event_hook_handle)
-                    self._event_hook_handle = None
-                    self._win_event_callback = None  # 콜백 참조 해제
-                    print("[INFO] Event Hook 해제 완료")
-                except Exception as e:
-                    print(f"[WARNING] Event Hook 해제 실패: {e}")
-            
-            print("[OK] Screen Worker 종료")
-    
-    def stop(self):
-        """스레드 종료"""
+            self._events.put(None)  # 디스패처 종료 (남은 알림은 처리)
+            self._dispatcher_thread.join(timeout=2.0)
+            self._dispatcher_thread = None
+            self.backend.close()
+            self.dwell.close(time.time())
+            stats = self.get_stats()
+            print(f"[OK] Screen Worker 종료 ({stats['backend']}/{stats['mode']}, {stats['counters']}, "
+                  f"process cache hit {stats['process_cache']['hit_rate']:.0%})")
+
+    def request_stop(self):
+        """종료 요청 - 백엔드 이벤트 루프를 깨움"""
         self.running = False
+        if self.backend is not None:
+            self.backend.request_stop()
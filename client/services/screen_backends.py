@@ -0,0 +1,466 @@
+# client/services/screen_backends.py
+"""
+ScreenSensor 플랫폼 백엔드 - 활성 창 조회와 창 변경 알림을 OS별로 구현
+
+ScreenSensor는 백엔드 인터페이스만 사용한다:
+    active_window()            현재 활성 창 ID (없으면 None)
+    window_title(window)       창 제목
+    window_pid(window)         창을 소유한 프로세스 PID
+    open(notify) / run_loop() / request_stop() / close()
+        open: 센서 스레드에서 알림 준비, 이후 변경이 생기면 notify(kind) 호출 ("focus" / "title")
+        run_loop: 센서 스레드에서 블로킹 (request_stop()까지, fake는 타임라인이 끝나면 반환)
+    event_driven  알림을 받을 수 있는지 (False면 센서가 SCREEN_FALLBACK_POLL_INTERVAL로 폴링)
+    safety_poll   알림을 받아도 놓칠 수 있어 SCREEN_POLL_INTERVAL 안전망 폴링이 필요한지
+    settle_delay  알림 후 제목을 읽기 전 대기 (초)
+
+[백엔드]
+- windows: SetWinEventHook (포커스/전경 창 제목 변경) + 메시지 루프, 훅 실패 시 폴링 (pywin32 필요)
+- x11: 루트 창 _NET_ACTIVE_WINDOW PropertyNotify + 활성 창 _NET_WM_NAME PropertyNotify (python-xlib 필요, 폴링 없음)
+- fake: 창 제목 타임라인 재생 (CI/처리량 측정용, speed=0이면 대기 없이 최대 속도)
+
+[사용 예시]
+    backend = create_backend("auto")  # 현재 환경에서 쓸 수 있는 백엔드 (없으면 None)
+    sensor = ScreenSensor(backend=FakeScreenBackend([(0.0, "VS Code"), (1.5, "YouTube - Chrome")]))
+"""
+
+import json
+import os
+import select
+import threading
+import time
+
+# Windows API (pywin32)
+try:
+    import win32api
+    import win32gui
+    import win32process
+    import win32con
+    WINDOWS_AVAILABLE = True
+except ImportError:
+    WINDOWS_AVAILABLE = False
+
+# ctypes for SetWinEventHook (not available in win32gui)
+if WINDOWS_AVAILABLE:
+    try:
+        import ctypes
+        from ctypes import wintypes
+        user32 = ctypes.windll.user32
+
+        # SetWinEventHook 함수 타입 정의
+        WINEVENTPROC = ctypes.WINFUNCTYPE(
+            None,
+            wintypes.HANDLE,
+            wintypes.DWORD,
+            wintypes.HWND,
+            ctypes.c_long,
+            ctypes.c_long,
+            wintypes.DWORD,
+            wintypes.DWORD
+        )
+
+        EVENT_HOOK_AVAILABLE = True
+    except Exception as e:
+        EVENT_HOOK_AVAILABLE = False
+        print(f"[WARNING] Event Hook 기능을 사용할 수 없습니다: {e}")
+else:
+    EVENT_HOOK_AVAILABLE = False
+
+# X11 (python-xlib)
+try:
+    from Xlib import X, display as xdisplay, error as xerror
+    XLIB_AVAILABLE = True
+except ImportError:
+    XLIB_AVAILABLE = False
+
+EVENT_OBJECT_NAMECHANGE = 0x800C  # 창/컨트롤 이름 변경 (전경 창 제목 변경 감지용)
+OBJID_WINDOW = 0  # 이벤트 대상이 창 자체 (자식 컨트롤 이름 변경은 무시)
+
+BACKENDS = ("auto", "windows", "x11", "fake")
+
+
+class ScreenBackend:
+    """백엔드 기반 클래스 (기본값: 알림 없음 -> 센서가 폴링)"""
+    name = "base"
+    event_driven = False
+    safety_poll = False
+    settle_delay = 0.0
+
+    @classmethod
+    def is_available(cls):
+        return False
+
+    def open(self, notify):
+        self._notify = notify
+
+    def run_loop(self):
+        raise NotImplementedError
+
+    def request_stop(self):
+        pass
+
+    def close(self):
+        pass
+
+    def active_window(self):
+        raise NotImplementedError
+
+    def window_title(self, window):
+        raise NotImplementedError
+
+    def window_pid(self, window):
+        raise NotImplementedError
+
+
+class WindowsScreenBackend(ScreenBackend):
+    """
+    Windows: SetWinEventHook 콜백은 notify만 호출하고 바로 반환, 훅 스레드는 메시지 루프에서 대기
+    EVENT_OBJECT_NAMECHANGE는 일부 앱이 보내지 않으므로 안전망 폴링을 켠다
+    """
+    name = "windows"
+    settle_delay = 0.05  # 이벤트 후 창 제목 확인 전 대기 (크롬이 제목을 갱신할 시간)
+
+    def __init__(self, use_event_hook=True):
+        self.use_event_hook = use_event_hook
+        self.event_driven = False
+        self.safety_poll = False
+        self._notify = None
+        self._event_hook_handles = []  # Windows Event Hook 핸들
+        self._win_event_callback = None  # 콜백 함수 참조 유지 (가비지 컬렉션 방지)
+        self._hook_thread_id = None  # 메시지 루프 스레드 ID (종료 시 WM_QUIT 전달)
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def is_available(cls):
+        return WINDOWS_AVAILABLE
+
+    def open(self, notify):
+        self._notify = notify
+        self._stop_event.clear()
+        self.event_driven = False
+        self.safety_poll = False
+        if not (self.use_event_hook and EVENT_HOOK_AVAILABLE):
+            return
+        try:
+            self._hook_thread_id = win32api.GetCurrentThreadId()
+            self._install_hooks()
+            self.event_driven = True
+            self.safety_poll = True
+        except Exception as e:
+            print(f"[WARNING] 이벤트 기반 창 감지 설정 실패, 폴링 모드로 전환: {e}")
+            self._remove_hooks()
+            self._hook_thread_id = None
+
+    def run_loop(self):
+        if self.event_driven:
+            # 메시지 루프 (훅 콜백 전달) - request_stop()이 보낸 WM_QUIT으로 종료
+            win32gui.PumpMessages()
+        else:
+            self._stop_event.wait()
+
+    def request_stop(self):
+        self._stop_event.set()
+        if self._hook_thread_id is not None:
+            try:
+                win32api.PostThreadMessage(self._hook_thread_id, win32con.WM_QUIT, 0, 0)
+            except Exception as e:
+                print(f"[WARNING] Screen Worker 메시지 루프 종료 요청 실패: {e}")
+
+    def close(self):
+        self._remove_hooks()
+        self._hook_thread_id = None
+
+    def active_window(self):
+        return win32gui.GetForegroundWindow() or None
+
+    def window_title(self, window):
+        return win32gui.GetWindowText(window)
+
+    def window_pid(self, window):
+        _, pid = win32process.GetWindowThreadProcessId(window)
+        return pid
+
+    def _on_win_event(self, hWinEventHook, event, hwnd, idObject, idChild, dwEventThread, dwmsTimeStamp):
+        """
+        Windows Event Hook 콜백 (메시지 루프 스레드): notify만 호출하고 바로 반환
+        제목 변경 이벤트는 전경 창 자체의 이름 변경만 받음 (다른 창/자식 컨트롤 이름 변경은 버림)
+        """
+        try:
+            if event == EVENT_OBJECT_NAMECHANGE:
+                if idObject != OBJID_WINDOW or hwnd != win32gui.GetForegroundWindow():
+                    return
+                self._notify("title")
+            else:
+                self._notify("focus")
+        except Exception as e:
+            print(f"[WARNING] 창 이벤트 콜백 오류: {e}")
+
+    def _install_hooks(self):
+        """포커스 변경 + 제목 변경 이벤트 훅 설치 (이 스레드의 메시지 루프로 콜백이 전달됨)"""
+        # 콜백 함수 참조 유지 (가비지 컬렉션 방지)
+        self._win_event_callback = WINEVENTPROC(self._on_win_event)
+
+        # win32gui에는 SetWinEventHook이 없으므로 ctypes로 직접 바인딩
+        SetWinEventHook = user32.SetWinEventHook
+        SetWinEventHook.argtypes = [
+            wintypes.DWORD,  # eventMin
+            wintypes.DWORD,  # eventMax
+            wintypes.HMODULE,  # hmodWinEventProc
+            WINEVENTPROC,  # lpfnWinEventProc
+            wintypes.DWORD,  # idProcess
+            wintypes.DWORD,  # idThread
+            wintypes.DWORD   # dwFlags
+        ]
+        SetWinEventHook.restype = wintypes.HANDLE
+
+        # 이벤트 범위를 좁게 나눠 등록 (FOREGROUND~NAMECHANGE 범위로 한 번에 걸면 관계없는 이벤트가 쏟아짐)
+        for event in (win32con.EVENT_SYSTEM_FOREGROUND, EVENT_OBJECT_NAMECHANGE):
+            handle = SetWinEventHook(
+                event, event,  # 이벤트 범위
+                0,  # hmodWinEventProc (0 = 현재 프로세스)
+                self._win_event_callback,  # 콜백 함수
+                0,  # 프로세스 ID (0 = 모든 프로세스)
+                0,  # 스레드 ID (0 = 모든 스레드)
+                win32con.WINEVENT_OUTOFCONTEXT | win32con.WINEVENT_SKIPOWNPROCESS
+            )
+            if not handle:
+                raise Exception(f"SetWinEventHook returned NULL (event=0x{event:X})")
+            self._event_hook_handles.append(handle)
+
+    def _remove_hooks(self):
+        if not self._event_hook_handles:
+            return
+        try:
+            UnhookWinEvent = user32.UnhookWinEvent
+            UnhookWinEvent.argtypes = [wintypes.HANDLE]
+            UnhookWinEvent.restype = wintypes.BOOL
+            for handle in self._event_hook_handles:
+                UnhookWinEvent(handle)
+            print("[INFO] Event Hook 해제 완료")
+        except Exception as e:
+            print(f"[WARNING] Event Hook 해제 실패: {e}")
+        finally:
+            self._event_hook_handles = []
+            self._win_event_callback = None  # 콜백 참조 해제
+
+
+class X11ScreenBackend(ScreenBackend):
+    """
+    X11 (EWMH 창 관리자): 루트 창의 _NET_ACTIVE_WINDOW와 활성 창의 _NET_WM_NAME/WM_NAME
+    PropertyNotify를 받아 알림 (폴링 없음)
+    이벤트 수신(run_loop 스레드)과 창 조회(디스패처 스레드)는 별도 Display 연결을 사용한다
+    """
+    name = "x11"
+    event_driven = True
+    safety_poll = False
+    settle_delay = 0.0  # PropertyNotify는 속성이 바뀐 뒤에 오므로 대기 불필요
+
+    def __init__(self, display_name=None):
+        self.display_name = display_name
+        self._notify = None
+        self._events_display = None
+        self._query_display = None
+        self._watched = None  # 제목 변경을 구독 중인 창 (활성 창)
+        self._wake_r = self._wake_w = None  # request_stop()이 select를 깨우는 파이프
+
+    @classmethod
+    def is_available(cls):
+        return XLIB_AVAILABLE and bool(os.environ.get("DISPLAY"))
+
+    def open(self, notify):
+        self._notify = notify
+        self._events_display = xdisplay.Display(self.display_name)
+        self._query_display = xdisplay.Display(self.display_name)
+        # 이미 닫힌 창에 대한 비동기 오류(BadWindow)는 무시
+        self._events_display.set_error_handler(lambda *args: None)
+        atom = self._query_display.intern_atom  # atom은 서버 전역이라 두 연결에서 같은 값
+        self._NET_ACTIVE_WINDOW = atom("_NET_ACTIVE_WINDOW")
+        self._NET_WM_NAME = atom("_NET_WM_NAME")
+        self._NET_WM_PID = atom("_NET_WM_PID")
+        self._UTF8_STRING = atom("UTF8_STRING")
+        self._WM_NAME = atom("WM_NAME")
+        self._title_atoms = (self._NET_WM_NAME, self._WM_NAME)
+
+        root = self._events_display.screen().root
+        root.change_attributes(event_mask=X.PropertyChangeMask)
+        self._root_id = root.id
+        self._wake_r, self._wake_w = os.pipe()
+        self._watch(self._read_active_window(self._events_display))
+
+    def run_loop(self):
+        fd = self._events_display.fileno()
+        while True:
+            # Xlib 버퍼에 이미 들어온 이벤트를 먼저 처리 (pending_events는 블로킹하지 않음)
+            while self._events_display.pending_events():
+                self._handle_event(self._events_display.next_event())
+            readable, _, _ = select.select([fd, self._wake_r], [], [])
+            if self._wake_r in readable:
+                break
+
+    def request_stop(self):
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b"x")
+            except OSError:
+                pass
+
+    def close(self):
+        for disp in (self._events_display, self._query_display):
+            if disp is not None:
+                try:
+                    disp.close()
+                except Exception:
+                    pass
+        self._events_display = self._query_display = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._wake_r = self._wake_w = None
+        self._watched = None
+
+    def active_window(self):
+        return self._read_active_window(self._query_display)
+
+    def window_title(self, window):
+        win = self._query_display.create_resource_object("window", window)
+        try:
+            prop = win.get_full_property(self._NET_WM_NAME, self._UTF8_STRING)
+            if prop is not None and prop.value:
+                return _decode(prop.value)
+            return _decode(win.get_wm_name() or "")
+        except xerror.XError:
+            return None  # 조회 중 창이 닫힘
+
+    def window_pid(self, window):
+        win = self._query_display.create_resource_object("window", window)
+        try:
+            prop = win.get_full_property(self._NET_WM_PID, X.AnyPropertyType)
+        except xerror.XError:
+            return None
+        return int(prop.value[0]) if prop is not None and len(prop.value) else None
+
+    def _read_active_window(self, disp):
+        try:
+            prop = disp.screen().root.get_full_property(self._NET_ACTIVE_WINDOW, X.AnyPropertyType)
+        except xerror.XError:
+            return None
+        if prop is None or not len(prop.value):
+            return None
+        return int(prop.value[0]) or None
+
+    def _watch(self, window):
+        """활성 창의 PropertyNotify 구독을 옮김 (이전 활성 창은 해제)"""
+        if window == self._watched:
+            return
+        if self._watched is not None:
+            old = self._events_display.create_resource_object("window", self._watched)
+            old.change_attributes(event_mask=X.NoEventMask)
+        if window is not None:
+            new = self._events_display.create_resource_object("window", window)
+            new.change_attributes(event_mask=X.PropertyChangeMask)
+        self._watched = window
+        self._events_display.flush()
+
+    def _handle_event(self, event):
+        if event.type != X.PropertyNotify:
+            return
+        if event.window.id == self._root_id:
+            if event.atom == self._NET_ACTIVE_WINDOW:
+                self._watch(self._read_active_window(self._events_display))
+                self._notify("focus")
+        elif event.window.id == self._watched and event.atom in self._title_atoms:
+            self._notify("title")
+
+
+def _decode(value):
+    return value.decode("utf-8", "replace") if isinstance(value, bytes) else value
+
+
+class FakeScreenBackend(ScreenBackend):
+    """
+    창 제목 타임라인 재생 (테스트/처리량 측정용)
+    timeline: [(초, 제목)] 또는 [(초, 제목, pid)] - pid를 생략하면 현재 프로세스 PID
+    speed: 재생 배속 (0이면 대기 없이 연속 재생), 타임라인이 끝나면 run_loop가 반환 -> 센서 종료
+    lockstep: 센서가 현재 창 제목을 읽은 뒤에 다음 항목 재생 (알림이 묶이지 않음 -> 창 확인 경로 최대 처리량 측정)
+    """
+    name = "fake"
+    event_driven = True
+    safety_poll = False
+    settle_delay = 0.0
+
+    def __init__(self, timeline, speed=1.0, lockstep=False):
+        self.timeline = [
+            (float(entry[0]), str(entry[1]), int(entry[2]) if len(entry) > 2 else os.getpid())
+            for entry in sorted(timeline, key=lambda entry: entry[0])
+        ]
+        if speed < 0:
+            raise ValueError(f"잘못된 재생 배속: {speed}")
+        self.speed = speed
+        self.lockstep = lockstep
+        self.replayed = 0  # 재생한 타임라인 항목 수
+        self._current = None  # 현재 활성 창 (타임라인 인덱스)
+        self._notify = None
+        self._stop_event = threading.Event()
+        self._consumed = threading.Event()  # lockstep: 현재 항목의 제목을 센서가 읽음
+
+    @classmethod
+    def is_available(cls):
+        return True
+
+    @classmethod
+    def from_file(cls, path, speed=1.0, lockstep=False):
+        """JSON 파일 ([[초, 제목], [초, 제목, pid], ...])에서 타임라인 로드"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f), speed=speed, lockstep=lockstep)
+
+    def open(self, notify):
+        self._notify = notify
+        self._stop_event.clear()
+        self._current = None
+        self.replayed = 0
+
+    def run_loop(self):
+        start = time.monotonic()
+        for index, (offset, _, _) in enumerate(self.timeline):
+            if self.speed > 0:
+                remaining = start + offset / self.speed - time.monotonic()
+                if remaining > 0 and self._stop_event.wait(remaining):
+                    return
+            elif self._stop_event.is_set():
+                return
+            self._consumed.clear()
+            self._current = index
+            self.replayed += 1
+            self._notify("focus")
+            if self.lockstep:
+                while not self._consumed.wait(0.1):
+                    if self._stop_event.is_set():
+                        return
+
+    def request_stop(self):
+        self._stop_event.set()
+
+    def active_window(self):
+        return self._current
+
+    def window_title(self, window):
+        if window == self._current:
+            self._consumed.set()
+        return self.timeline[window][1]
+
+    def window_pid(self, window):
+        return self.timeline[window][2]
+
+
+def create_backend(name="auto", use_event_hook=True):
+    """
+    이름으로 백엔드 생성 ("auto": windows -> x11 순서로 사용 가능한 것, 없으면 None)
+    fake는 타임라인이 필요하므로 여기서 만들지 않음 (FakeScreenBackend 직접 생성)
+    """
+    name = (name or "auto").lower()
+    if name not in BACKENDS or name == "fake":
+        raise ValueError(f"지원하지 않는 Screen 백엔드: {name} (windows, x11, auto)")
+    if name in ("auto", "windows") and WindowsScreenBackend.is_available():
+        return WindowsScreenBackend(use_event_hook=use_event_hook)
+    if name in ("auto", "x11") and X11ScreenBackend.is_available():
+        return X11ScreenBackend()
+    return None
@@ -0,0 +1,84 @@
+# client/services/sensor.py
+"""
+Qt 없이 동작하는 센서 실행 기반 (Signal, SensorThread)
+
+VisionSensor / ScreenSensor가 이 클래스를 상속해 Qt 애플리케이션 없이도 실행된다.
+- Signal: pyqtSignal과 같은 connect/emit 인터페이스의 콜백 목록 (emit한 스레드에서 바로 호출)
+- SensorThread: QThread와 같은 start/isRunning/wait/stop(request_stop) 인터페이스의 데몬 스레드 래퍼 (run()을 오버라이드)
+
+GUI 앱에서는 client/services/qt_workers.py의 QThread 어댑터가 Signal을 pyqtSignal로 중계하고,
+헤드리스 실행(client/headless.py)에서는 콜백에서 바로 JSONL로 내보낸다.
+"""
+
+import threading
+import traceback
+
+
+class Signal:
+    """Qt 없는 시그널 (연결된 콜백을 emit한 스레드에서 순서대로 호출)"""
+
+    def __init__(self):
+        self._slots = []
+        self._lock = threading.Lock()
+
+    def connect(self, slot):
+        with self._lock:
+            self._slots.append(slot)
+
+    def disconnect(self, slot=None):
+        """slot 연결 해제 (None이면 전부)"""
+        with self._lock:
+            if slot is None:
+                self._slots.clear()
+            elif slot in self._slots:
+                self._slots.remove(slot)
+
+    def emit(self, *args):
+        with self._lock:
+            slots = list(self._slots)
+        for slot in slots:
+            try:
+                slot(*args)
+            except Exception as e:
+                # 콜백 하나의 오류가 센서 루프나 다른 콜백을 멈추지 않도록
+                print(f"[ERROR] 시그널 콜백 오류: {e}")
+                traceback.print_exc()
+
+
+class SensorThread:
+    """센서 실행 기반 클래스 - run()은 블로킹 메인 루프, start()는 이를 데몬 스레드에서 실행"""
+
+    def __init__(self, name="Sensor"):
+        self.name = name
+        self.running = False
+        self._thread = None
+
+    def run(self):
+        raise NotImplementedError
+
+    def start(self):
+        """run()을 별도 데몬 스레드에서 실행 (이미 실행 중이면 무시)"""
+        if self.isRunning():
+            return
+        self._thread = threading.Thread(target=self.run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def isRunning(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout=None):
+        """start()로 시작한 스레드 종료 대기 (timeout 초, 종료되었으면 True)"""
+        thread = self._thread
+        if thread is None or thread is threading.current_thread():
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def request_stop(self):
+        """종료 요청만 보냄 (대기하지 않음) - 블로킹 대기 중인 센서는 오버라이드해서 깨운다"""
+        self.running = False
+
+    def stop(self):
+        """종료 요청 후 대기"""
+        self.request_stop()
+        self.wait()
@@ -0,0 +1,70 @@
+# client/services/startup.py
+"""
+클라이언트 시작 시간 계측
+
+프로세스 시작부터 주요 시점(import 완료, 모델 로딩 완료, 첫 창 표시, 첫 추론)까지의 경과 시간과
+구간 소요 시간(모델 로딩, 워밍업)을 기록한다. 무거운 import 전에 가장 먼저 import해야 기준 시각이 정확하다.
+
+[사용 예시]
+    from client.services.startup import startup_timer
+    startup_timer.mark("imports")          # 시작 후 경과 시간 기록
+    startup_timer.record("model_load", dt) # 구간 소요 시간 기록
+    print(startup_timer.format_summary())
+"""
+
+import threading
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+class StartupTimer:
+    """시작 시점 기록 (스레드 안전, 같은 이름은 처음 한 번만 기록)"""
+
+    def __init__(self):
+        self._t0 = time.perf_counter()
+        # 인터프리터 시작부터 이 모듈 import까지의 시간 (psutil이 있으면 프로세스 생성 시각 기준)
+        self.boot_offset = 0.0
+        if psutil is not None:
+            try:
+                self.boot_offset = max(0.0, time.time() - psutil.Process().create_time())
+            except Exception:
+                self.boot_offset = 0.0
+        self._lock = threading.Lock()
+        self.marks = {}  # 이름 -> 프로세스 시작 후 경과 시간 (초)
+        self.durations = {}  # 이름 -> 구간 소요 시간 (초)
+
+    def elapsed(self):
+        """프로세스 시작 후 경과 시간 (초)"""
+        return self.boot_offset + time.perf_counter() - self._t0
+
+    def mark(self, name):
+        """시점 기록 (이미 기록된 이름이면 무시) - 기록했으면 True"""
+        with self._lock:
+            if name in self.marks:
+                return False
+            self.marks[name] = self.elapsed()
+        print(f"[STARTUP] {name}: {self.marks[name]:.2f}s")
+        return True
+
+    def record(self, name, seconds):
+        """구간 소요 시간 기록"""
+        with self._lock:
+            self.durations[name] = seconds
+        print(f"[STARTUP] {name} took {seconds:.2f}s")
+
+    def snapshot(self):
+        with self._lock:
+            return {"marks": dict(self.marks), "durations": dict(self.durations)}
+
+    def format_summary(self):
+        snap = self.snapshot()
+        parts = [f"{name}={value:.2f}s" for name, value in snap["marks"].items()]
+        parts += [f"{name}({value:.2f}s)" for name, value in snap["durations"].items()]
+        return ", ".join(parts) if parts else "no marks"
+
+
+startup_timer = StartupTimer()
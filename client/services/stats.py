@@ -10,6 +10,12 @@ DISTRACTING_KEYWORDS = [
     "minecraft", "roblox", "overwatch", "valorant", "pubg", "apex", "fifa", "nexon"
 ]
 
+def is_distracting(title: str, process_name: str) -> bool:
+    """Keyword check on a window title / process name (shared by SessionStats and the screen dwell timeline)"""
+    title = (title or "").lower()
+    process = (process_name or "").lower()
+    return any(kw in title or kw in process for kw in DISTRACTING_KEYWORDS)
+
 class SessionStats:
     """
     Records session statistics and distraction events for the Result Dashboard.
@@ -20,6 +26,7 @@ class SessionStats:
         # Assuming Packet events are discrete triggers.
         self.last_event_time = defaultdict(float)
         self.cooldown = 5.0 # Seconds
+        self.dwell = None  # DwellTracker from the screen sensor (foreground time per app/category)
         self.reset()
 
     def reset(self):
@@ -33,13 +40,21 @@ class SessionStats:
     
     def is_distracting_window(self, packet: Packet) -> bool:
         """Check if a WINDOW_CHANGE packet is distracting based on keywords"""
-        title = packet.data.get("window_title", "").lower()
-        process = packet.data.get("process_name", "").lower()
-        
-        for kw in DISTRACTING_KEYWORDS:
-            if kw in title or kw in process:
-                return True
-        return False
+        # Process-level verdict from the ScreenSensor process cache (already keyword-checked)
+        if packet.data.get("process_category") == "distracting":
+            return True
+        return is_distracting(packet.data.get("window_title", ""), packet.data.get("process_name", ""))
+
+    def attach_dwell(self, dwell):
+        """Use the screen sensor's dwell timeline for focused/distracted time"""
+        self.dwell = dwell
+
+    def get_dwell_summary(self):
+        """Focused vs distracted foreground time (running sums, no event re-scan)"""
+        if self.dwell is None:
+            return {}
+        end = self.end_time if self.end_time else time.time()
+        return self.dwell.summary(end)
 
     def record_event(self, packet: Packet):
         """Record a distraction event"""
@@ -88,6 +103,9 @@ class SessionStats:
         self.end_time = time.time()
         print(f"📊 Session Ended. Duration: {self.get_duration():.1f}s")
         print(f"📊 Summary: {dict(self.counts)}")
+        dwell = self.get_dwell_summary()
+        if dwell:
+            print(f"📊 Focused {dwell['focused_seconds']:.0f}s / Distracted {dwell['distracted_seconds']:.0f}s")
     
     def get_duration(self) -> float:
         """Get session duration in seconds"""
@@ -108,5 +126,6 @@ class SessionStats:
             "duration_seconds": duration,
             "total_distractions": total_counts,
             "counts": dict(self.counts),
-            "history": self.events
+            "history": self.events,
+            "dwell": self.get_dwell_summary()
         }
@@ -0,0 +1,133 @@
+# client/services/title_coalescer.py
+"""
+WINDOW_CHANGE 제목 변화 묶기 (Title-churn coalescing)
+
+창 제목은 사용자가 창을 바꾸지 않아도 계속 바뀐다:
+YouTube 재생 시간/진행률, "(3) Inbox" 같은 안 읽은 개수 배지, VS Code 미저장 표시(●),
+명령마다 제목을 바꾸는 터미널 등. 이런 변화마다 WINDOW_CHANGE 패킷을 보내면 Agent가 매번 판단을 다시 한다.
+
+- 제목을 정규화(배지/개수/시각/진행률 제거)한 (제목, 프로세스)를 창의 정체성으로 보고,
+  정체성이 바뀔 때만 내보낸다 (같은 정체성 안의 제목 변화는 suppressed로 셈)
+- 정체성이 바뀌어도 settle_delay 동안 유지될 때까지 기다린다 (Ctrl+Tab으로 탭을 훑으면 마지막 탭만 보냄,
+  중간에 밀려난 후보는 superseded로 셈). settle_delay=0이면 즉시 내보냄
+- 터미널처럼 제목이 명령마다 바뀌는 프로세스는 프로세스만으로 정체성을 판단
+
+[사용 예시]
+    coalescer = TitleCoalescer(settle_delay=0.3)
+    payload = coalescer.offer(title, process_name, payload, now)  # 바로 내보낼 것 (없으면 None)
+    payload = coalescer.pop_due(now)  # settle_delay가 지난 후보 (없으면 None)
+"""
+
+import re
+
+from client.services.perf import StageStats
+
+# 제목이 명령/경로마다 바뀌는 터미널 (소문자 프로세스 이름) - 제목과 무관하게 한 창으로 봄
+VOLATILE_TITLE_PROCESSES = {
+    "windowsterminal.exe", "cmd.exe", "powershell.exe", "pwsh.exe", "conhost.exe", "mintty.exe",
+    "wezterm-gui.exe", "alacritty.exe",
+    "gnome-terminal-server", "konsole", "xterm", "alacritty", "kitty", "wezterm-gui", "tilix", "terminator",
+    "xfce4-terminal",
+}
+
+# 정규화 규칙 (순서대로 적용)
+_NORMALIZE_PATTERNS = [
+    re.compile(r"^\s*[\(\[]\d+\+?[\)\]]\s*"),  # 앞쪽 개수 배지: "(3) Inbox", "[12] Slack"
+    re.compile(r"^\s*[●•*]\s*"),  # 앞쪽 미저장/새 알림 표시: "● main.py"
+    re.compile(r"\s*[\(\[]\d+\+?[\)\]]"),  # 중간 개수: "Inbox (12) - Gmail"
+    re.compile(r"\b\d{1,2}:\d{2}(?::\d{2})?(?:\s*[AaPp][Mm])?\b"),  # 시각/재생 시간: "1:02:03", "10:30 PM"
+    re.compile(r"\b\d{1,3}(?:\.\d+)?\s?%"),  # 진행률: "45%"
+]
+_SEPARATORS = re.compile(r"(?:\s*[/|·•\-–—]\s*){2,}")  # 제거 후 남은 연속 구분자: "  /  - "
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_title(title):
+    """창 제목에서 자주 바뀌는 부분(배지, 개수, 시각, 진행률)을 제거"""
+    text = title or ""
+    for pattern in _NORMALIZE_PATTERNS:
+        text = pattern.sub(" ", text)
+    text = _SEPARATORS.sub(" - ", text)
+    return _SPACES.sub(" ", text).strip(" -|/·•–—").lower()
+
+
+class TitleCoalescer:
+    """정규화된 (제목, 프로세스) 정체성이 바뀔 때만 WINDOW_CHANGE를 내보냄"""
+
+    def __init__(self, settle_delay=0.3, volatile_processes=VOLATILE_TITLE_PROCESSES):
+        self.settle_delay = settle_delay
+        self.volatile_processes = volatile_processes
+        self.stats = StageStats()  # counters: offered / emitted / suppressed / superseded
+        self.reset()
+
+    def reset(self):
+        self._emitted_identity = None  # 마지막으로 내보낸 정체성
+        self._pending = None  # (identity, payload, due) - settle_delay를 기다리는 후보
+
+    def identity(self, title, process_name):
+        process = (process_name or "").lower()
+        if process in self.volatile_processes:
+            return ("", process)
+        return (normalize_title(title), process)
+
+    def offer(self, title, process_name, payload, now):
+        """
+        새 raw 제목 (창 제목이 바뀔 때마다 호출)
+        :return: 지금 내보낼 payload (settle_delay=0이고 정체성이 바뀐 경우), 아니면 None
+        """
+        self.stats.incr("offered")
+        identity = self.identity(title, process_name)
+
+        if self._pending is not None and identity == self._pending[0]:
+            # 대기 중인 후보 안의 제목 변화 - 최신 제목으로 갱신
+            self._pending = (identity, payload, self._pending[2])
+            self.stats.incr("suppressed")
+            return None
+
+        if identity == self._emitted_identity:
+            if self._pending is not None:
+                # 다른 창으로 갔다가 settle_delay 안에 돌아옴 - 후보 취소
+                self._pending = None
+                self.stats.incr("superseded")
+            self.stats.incr("suppressed")
+            return None
+
+        if self._pending is not None:
+            self.stats.incr("superseded")
+            self._pending = None
+
+        if self.settle_delay <= 0:
+            return self._emit(identity, payload)
+        self._pending = (identity, payload, now + self.settle_delay)
+        return None
+
+    def pop_due(self, now):
+        """settle_delay가 지난 후보가 있으면 내보낼 payload, 없으면 None"""
+        if self._pending is None or now < self._pending[2]:
+            return None
+        identity, payload, _ = self._pending
+        self._pending = None
+        return self._emit(identity, payload)
+
+    def flush(self):
+        """대기 중인 후보를 바로 내보냄 (종료 시)"""
+        if self._pending is None:
+            return None
+        identity, payload, _ = self._pending
+        self._pending = None
+        return self._emit(identity, payload)
+
+    def time_until_due(self, now):
+        """대기 중인 후보가 나갈 때까지 남은 시간 (초, 후보가 없으면 None)"""
+        if self._pending is None:
+            return None
+        return max(0.0, self._pending[2] - now)
+
+    def _emit(self, identity, payload):
+        self._emitted_identity = identity
+        self.stats.incr("emitted")
+        return payload
+
+    def get_stats(self):
+        counters = self.stats.snapshot()["counters"]
+        return {name: counters.get(name, 0) for name in ("offered", "emitted", "suppressed", "superseded")}
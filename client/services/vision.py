@@ -1,7 +1,6 @@
 # client/services/vision.py
 import sys
 import os
-from PyQt6.QtCore import QThread, pyqtSignal
 import cv2
 import mediapipe as mp
 from mediapipe.tasks import python
@@ -10,21 +9,71 @@ from mediapipe import Image as MPImage
 from mediapipe.tasks.python.vision.core.image import ImageFormat
 import numpy as np
 import time
+import threading
+from collections import deque
 
 # shared 폴더 import를 위한 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from shared.protocol import Packet, PacketMeta
-from shared.constants import VisionEvents, PacketCategory
-
-class VisionWorker(QThread):
-    # 메인 UI로 보낼 신호 정의
-    alert_signal = pyqtSignal(object) # Packet 객체를 보냄
-    debug_frame_signal = pyqtSignal(np.ndarray) # 디버그 이미지(OpenCV 포맷) 보냄
-
-    def __init__(self, show_debug_window=False):
-        super().__init__()
-        self.running = False
-        self.show_debug_window = show_debug_window  # 디버그 이미지를 송출할지 여부
+from client.services.frame_buffer import LatestFrameBuffer, FramePool
+from client.services.perf import StageStats
+from client.services.vision_state import ConditionTimer
+from client.services.rate_scheduler import AdaptiveRateScheduler
+from client.services.phone_detector import PhoneDetector
+from client.services.face_features import FaceFeatureExtractor, EAR_INDICES, CHEEK_INDICES
+from client.services.frame_source import open_frame_source
+from client.services.motion_gate import MotionGate
+from client.services.drowsiness import DrowsinessMonitor, DrowsinessLevel
+from client.services.detectors import (
+    DetectorRegistry, FrameObservation, SleepDetector, AbsenceDetector, GazeDetector, PhoneVoteDetector,
+)
+from client.services.calibration import VisionCalibrator, THRESHOLD_LIMITS
+from client.services.face_roi import FaceRoiTracker, eye_region
+from client.services.resolution_ladder import ResolutionLadder
+from client.services.camera_supervisor import CameraSupervisor, CameraStatus
+from client.services.startup import startup_timer
+from client.services.sensor import Signal, SensorThread
+from client.config import Config
+
+class VisionSensor(SensorThread):
+    """
+    웹캠/녹화본 프레임 -> 얼굴 랜드마크 -> 상태 판단 -> Packet (Qt 없이 실행)
+    GUI 앱은 client/services/qt_workers.py의 VisionWorker(QThread 어댑터)로 감싸서 사용
+    """
+
+    # FaceLandmarker 실행 모드
+    RUNNING_MODES = {
+        "IMAGE": vision.RunningMode.IMAGE,  # 매 프레임 전체 얼굴 검출 (폴백)
+        "VIDEO": vision.RunningMode.VIDEO,  # 이전 프레임 얼굴 ROI 추적 재사용 (동기)
+        "LIVE_STREAM": vision.RunningMode.LIVE_STREAM,  # 추적 재사용 + 비동기 콜백
+    }
+
+    # 얼굴 방향(pose) 계산 방식 (face_features 모듈 docstring 참고)
+    POSE_BACKENDS = ("heuristic", "matrix")
+
+    def __init__(self, show_debug_window=False, running_mode=None, min_fps=None, max_fps=None, source=None,
+                 motion_gate=None, preload=True, roi=None, input_widths=None, calibration=None, pose_backend=None):
+        """
+        :param source: 프레임 소스 (웹캠 인덱스, 동영상 파일/이미지 폴더 경로 또는 FrameSource) - 기본값 Config.VISION_SOURCE
+        :param motion_gate: 정지 화면에서 랜드마크 추론 생략 여부 - 기본값 Config.MOTION_GATE_ENABLED
+        :param roi: 마지막 얼굴 주변만 잘라 추론할지 여부 - 기본값 Config.VISION_ROI_ENABLED
+        :param input_widths: 추론 입력 최대 너비 단계 (빈 값이면 축소 안 함) - 기본값 Config.VISION_INPUT_WIDTHS
+        :param calibration: 사용자별 임계값 보정/프로필 사용 여부 - 기본값 Config.VISION_CALIBRATION_ENABLED
+        :param pose_backend: 얼굴 방향 계산 방식 (heuristic | matrix) - 기본값 Config.VISION_POSE_BACKEND
+        :param preload: 생성 직후 백그라운드에서 모델 로딩 시작 (False면 start_loading()/run() 시점에 시작)
+        """
+        super().__init__(name="VisionSensor")
+        # 결과 알림 (Qt 어댑터가 pyqtSignal로 중계, 헤드리스에서는 콜백 직접 연결)
+        self.alert_signal = Signal()  # Packet 객체를 보냄
+        self.camera_status_signal = Signal()  # (CameraStatus 값, 메시지) - 카메라 연결/끊김 상태
+        self.models_ready_signal = Signal()  # 백그라운드 모델 로딩 완료 (성공 여부)
+        self.source_spec = source if source is not None else Config.VISION_SOURCE
+        self.show_debug_window = show_debug_window  # 디버그 이미지를 송출할지 여부 (디버그 창 표시 중에만 True)
+        self.debug_stream_fps = Config.DEBUG_STREAM_FPS  # 디버그 이미지 최대 송출 FPS
+        self.debug_stream_width = Config.DEBUG_STREAM_WIDTH  # 디버그 이미지 축소 너비 (px)
+        self._last_debug_emit = 0.0
+        # 디버그 이미지(OpenCV BGR) 최신 1장 슬롯 - DebugWindow가 자체 타이머로 가져감 (큐잉 없음)
+        self.debug_frames = LatestFrameBuffer()
+        self._debug_pool = FramePool(max_buffers=3)  # 디버그 이미지 버퍼 (슬롯 + GUI 변환 중 + 그리는 중)
         # MediaPipe Face Landmarker 초기화 (0.10.x API)
         # 모델 파일 경로
         model_path = os.path.join(os.path.dirname(__file__), 'face_landmarker.task')
@@ -35,88 +84,64 @@ class VisionWorker(QThread):
                 f"다음 명령으로 모델을 다운로드하세요: python download_mediapipe_model.py"
             )
         
-        base_options = python.BaseOptions(model_asset_path=model_path)
-        
-        options = vision.FaceLandmarkerOptions(
-            base_options=base_options,
-            output_face_blendshapes=False,
-            output_facial_transformation_matrixes=False,
-            num_faces=1,
-            min_face_detection_confidence=0.5,
-            min_face_presence_confidence=0.5,
-            min_tracking_confidence=0.5,
-            running_mode=vision.RunningMode.IMAGE  # 이미지 모드
-        )
-        
-        try:
-            self.face_landmarker = vision.FaceLandmarker.create_from_options(options)
-        except Exception as e:
-            print(f"⚠️ FaceLandmarker 초기화 실패: {e}")
-            print("💡 모델 파일을 다운로드하거나 다른 방법을 시도해주세요.")
-            raise
-        
-        # MediaPipe Object Detector 초기화 (휴대폰 감지용)
-        object_model_path = os.path.join(os.path.dirname(__file__), 'efficientdet_lite0.tflite')
+        self._model_path = model_path
         
-        if os.path.exists(object_model_path):
-            try:
-                object_base_options = python.BaseOptions(model_asset_path=object_model_path)
-                object_options = vision.ObjectDetectorOptions(
-                    base_options=object_base_options,
-                    max_results=5,  # 최대 5개 객체 감지
-                    score_threshold=0.4,  # 최소 신뢰도 40% (얼굴 위치 상관없이 더 잘 잡히도록 완화)
-                    category_allowlist=["cell phone"]  # 휴대폰만 감지
-                )
-                self.object_detector = vision.ObjectDetector.create_from_options(object_options)
-                print("[OK] Object Detector 초기화 완료 (휴대폰 감지 활성화)")
-            except Exception as e:
-                print(f"⚠️ Object Detector 초기화 실패: {e}")
-                print("💡 휴대폰 감지 기능이 비활성화됩니다. 모델을 다운로드하세요: python download_object_detector_model.py")
-                self.object_detector = None
-        else:
-            print(f"⚠️ Object Detector 모델 파일을 찾을 수 없습니다: {object_model_path}")
-            print("💡 휴대폰 감지 기능이 비활성화됩니다. 모델을 다운로드하세요: python download_object_detector_model.py")
-            self.object_detector = None
-        
-        # 상태 추적 (카운터 방식)
-        self.eye_closed_counter = 0  # 눈 감음 연속 프레임 카운터
-        self.no_face_counter = 0  # 얼굴 부재 연속 프레임 카운터
-        self.gaze_away_counter = 0  # 시선 벗어남 연속 프레임 카운터
-        self.last_alert_time = {}  # 각 이벤트별 마지막 알림 시간 (중복 방지)
+        # 실행 모드 결정 (IMAGE는 항상 사용 가능한 폴백)
+        mode = (running_mode or Config.VISION_RUNNING_MODE or "IMAGE").upper()
+        if mode not in self.RUNNING_MODES:
+            print(f"⚠️ 알 수 없는 VISION_RUNNING_MODE '{mode}' - IMAGE 모드로 대체합니다.")
+            mode = "IMAGE"
+        self.running_mode = mode  # 초기화 실패 시 IMAGE로 바뀔 수 있음
+
+        # 얼굴 방향 백엔드: heuristic (코-눈 2D 오프셋 + 볼 z-depth) | matrix (facial transformation matrix 각도)
+        pose_backend = (pose_backend or Config.VISION_POSE_BACKEND or "heuristic").lower()
+        if pose_backend not in self.POSE_BACKENDS:
+            print(f"⚠️ 알 수 없는 VISION_POSE_BACKEND '{pose_backend}' - heuristic으로 대체합니다.")
+            pose_backend = "heuristic"
+        self.pose_backend = pose_backend
+
+        # LIVE_STREAM 모드용 비동기 결과 상태
+        self._result_lock = threading.Lock()
+        self._latest_face_result = None
+        self._pending_submits = deque()  # (timestamp_ms, 제출 시각) - 콜백 지연 측정용
+        self._last_timestamp_ms = -1  # VIDEO/LIVE_STREAM 타임스탬프는 단조 증가해야 함
+
+        # 모델은 백그라운드 스레드에서 로딩 (첫 창 표시를 막지 않음) - model_state: loading | ready | failed
+        self.face_landmarker = None
+        self.model_state = "loading"
+        self._models_ready = threading.Event()
+        self._loader_thread = None
+        self._first_inference_marked = False
         
         # EAR 임계값
         self.EAR_THRESHOLD = 0.25  # 눈 감음 임계값
-        self.EAR_CONSECUTIVE_FRAMES = 100  # 연속 프레임 수 (졸음 감지 임계값)
-        self.NO_FACE_CONSECUTIVE_FRAMES = 100  # 얼굴 부재 연속 프레임 수
+        self.EYE_CLOSED_SECONDS = 10.0  # 눈 감음 연속 유지 시간 (ASLEEP 단계 임계값, 초)
+        self.DROWSY_ALERT_LEVEL = DrowsinessLevel.VERY_DROWSY  # 이 단계 이상이면 SLEEPING 패킷 전송
+        self.DROWSY_REPEAT_SECONDS = 30.0  # 같은 단계가 유지될 때 SLEEPING 재전송 간격 (단계가 오르면 즉시 전송)
+        self.NO_FACE_SECONDS = 10.0  # 얼굴 부재 연속 유지 시간 (초)
         
         # 시선 벗어남 임계값 (각도 기준, 도 단위)
         self.GAZE_PITCH_THRESHOLD = 20.0  # 위/아래 시선 벗어남 임계값 (도)
         self.GAZE_YAW_THRESHOLD = 20.0  # 좌/우 시선 벗어남 임계값 (도)
-        self.GAZE_AWAY_CONSECUTIVE_FRAMES = 30  # 연속 프레임 수 (약 3초로 단축 - 더 빠르게 반응)
+        self.GAZE_AWAY_SECONDS = 3.0  # 시선 벗어남 연속 유지 시간 (초)
+        # 화면을 보는 평소 자세의 각도 (matrix 백엔드 - 카메라가 모니터 위/옆에 있으면 0이 아님, 보정으로 갱신)
+        self.GAZE_PITCH_BASELINE = 0.0
+        self.GAZE_YAW_BASELINE = 0.0
+
+        # 상태 추적 (프레임 타임스탬프 기반 연속 시간) - FPS가 바뀌어도 판단 시점 동일
+        # 졸음: 연속 눈 감음(잠깐 뜬 노이즈 프레임 무시) + 최근 구간 PERCLOS/눈 깜빡임 -> 졸음 단계
+        self.drowsiness = DrowsinessMonitor(
+            window_seconds=Config.DROWSINESS_WINDOW_SECONDS,
+            asleep_seconds=self.EYE_CLOSED_SECONDS,
+            perclos_drowsy=Config.DROWSINESS_PERCLOS_DROWSY,
+            perclos_very_drowsy=Config.DROWSINESS_PERCLOS_VERY_DROWSY,
+        )
+        self.no_face_timer = ConditionTimer(self.NO_FACE_SECONDS)
+        self.gaze_away_timer = ConditionTimer(self.GAZE_AWAY_SECONDS)
         
         # 휴대폰 감지 임계값
         self.PHONE_SCORE_THRESHOLD = 0.4  # 휴대폰 감지 최소 신뢰도
-        
-        # 얼굴 방향 계산용 추가 랜드마크
-        self.LEFT_EYE_INNER = 133
-        self.LEFT_EYE_OUTER = 33
-        self.RIGHT_EYE_INNER = 362
-        self.RIGHT_EYE_OUTER = 263
-        self.FOREHEAD = 10
-        
-        # 눈 랜드마크 인덱스 (EAR 계산용)
-        self.LEFT_EYE_EAR = [33, 160, 158, 133, 153, 144]
-        self.RIGHT_EYE_EAR = [362, 385, 387, 263, 390, 374]
-        
-        # 얼굴 방향 계산용 랜드마크
-        self.NOSE_TIP = 1
-        self.CHIN = 175
-        self.LEFT_EYE_CENTER = 33
-        self.RIGHT_EYE_CENTER = 362
-        
-        # 볼 랜드마크 (GAZE_AWAY 감지용) - 안쪽 볼 영역 사용
-        self.LEFT_CHEEK = 118   # 왼쪽 볼 안쪽 (face oval, 116보다 안쪽)
-        self.RIGHT_CHEEK = 347  # 오른쪽 볼 안쪽 (face oval, 345보다 안쪽)
+        self.PHONE_DETECT_INTERVAL = Config.PHONE_DETECT_INTERVAL  # 휴대폰 검사 주기 (초)
         
         # 볼 가시성 검사 임계값 (민감도 높임 - Strict)
         self.CHEEK_Z_DEPTH_THRESHOLD = 0.08
@@ -124,192 +149,359 @@ class VisionWorker(QThread):
         self.CHEEK_NOSE_Z_THRESHOLD = 0.12
         self.CHEEK_Z_DIFF_PASS_THRESHOLD = 0.015
 
-        # 자리비움 상태 추적
-        self.is_in_absent_mode = False
-        self.absent_start_time = 0.0
-
-    def calculate_ear(self, landmarks, eye_indices):
-        """Eye Aspect Ratio (EAR) 계산"""
-        # MediaPipe 0.10.x는 landmarks가 리스트 형태
-        # 수직 거리 계산
-        vertical_1 = np.linalg.norm(
-            np.array([landmarks[eye_indices[1]].x, landmarks[eye_indices[1]].y]) -
-            np.array([landmarks[eye_indices[5]].x, landmarks[eye_indices[5]].y])
+        # 사용자별 임계값 보정 (저장된 프로필이 있으면 바로 적용, 없으면 세션 초반 분포 수집 후 적용)
+        self._default_thresholds = {name: getattr(self, name) for name in THRESHOLD_LIMITS}
+        self.calibration_enabled = calibration if calibration is not None else Config.VISION_CALIBRATION_ENABLED
+        self.calibrator = VisionCalibrator(
+            Config.VISION_PROFILE_PATH if self.calibration_enabled else None,
+            duration_seconds=Config.VISION_CALIBRATION_SECONDS,
+            pose_backend=self.pose_backend,
         )
-        vertical_2 = np.linalg.norm(
-            np.array([landmarks[eye_indices[2]].x, landmarks[eye_indices[2]].y]) -
-            np.array([landmarks[eye_indices[4]].x, landmarks[eye_indices[4]].y])
+        if self.calibration_enabled:
+            thresholds = self.calibrator.load()
+            if thresholds is not None:
+                self._apply_thresholds(thresholds, "저장된 프로필")
+
+        # 얼굴 특징 추출기 (랜드마크 배열 미리 할당, 프레임당 1회 계산)
+        self.feature_extractor = FaceFeatureExtractor()
+
+        # 감지기 플러그인 (입력: 프레임별 FaceFeatures, 출력: 상태 전이 Packet)
+        # 감지기별 실행 간격(Config.VISION_DETECTOR_INTERVALS)과 비용 예산으로 스케줄링
+        # 등록 순서대로 실행 (복귀 USER_RETURNED가 같은 프레임의 SLEEPING보다 먼저 나감)
+        self.detectors = DetectorRegistry(
+            default_budget_ms=Config.VISION_DETECTOR_BUDGET_MS,
+            enforce_budget=Config.VISION_DETECTOR_BUDGET_ENFORCE,
+            reprobe_seconds=Config.VISION_DETECTOR_REPROBE_SECONDS,
         )
-        
-        # 수평 거리 계산
-        horizontal = np.linalg.norm(
-            np.array([landmarks[eye_indices[0]].x, landmarks[eye_indices[0]].y]) -
-            np.array([landmarks[eye_indices[3]].x, landmarks[eye_indices[3]].y])
+        for detector in (AbsenceDetector(self), SleepDetector(self), GazeDetector(self), PhoneVoteDetector(self)):
+            self.register_detector(detector)
+
+        # 캡처/추론 분리 파이프라인
+        self.frame_buffer = LatestFrameBuffer()  # 캡처 스레드 -> 추론 루프 (최신 프레임 1장)
+        # 프레임 버퍼 재사용 (프레임마다 수 MB 할당 방지)
+        # 캡처: 슬롯 + 추론 중 + 휴대폰 감지 중 + 디코딩 중 + 여유 1
+        self.capture_pool = FramePool(max_buffers=5)
+        self._rgb_pool = FramePool(max_buffers=1)  # MPImage는 생성 시 데이터를 복사하므로 1개로 충분
+        self._scaled_pool = FramePool(max_buffers=1)  # 해상도 단계에 맞춘 축소 이미지 (변환 직후 버려짐)
+        self.stats = StageStats()  # 단계별 지연 및 드롭 프레임 통계
+        self._capture_thread = None
+        self._camera_supervisor = None  # 웹캠 소스일 때 읽기 실패 감시 및 재연결
+        self.camera_status = CameraStatus.CONNECTING
+        self.STATS_LOG_INTERVAL = 30.0  # 파이프라인 통계 로그 주기 (초)
+
+        # 휴대폰 감지는 별도 스레드에서 자체 주기로 최신 프레임만 검사 (매 프레임 X)
+        self.phone_detector = PhoneDetector(
+            self.frame_buffer,
+            self.stats,
+            interval=self.PHONE_DETECT_INTERVAL,
+            hits_required=Config.PHONE_VOTE_HITS,
+            window_seconds=Config.PHONE_VOTE_WINDOW,
+            score_threshold=self.PHONE_SCORE_THRESHOLD,
         )
+
+        # 적응형 추론 주기 (안정 상태: min_fps, 조건 누적 중: max_fps)
+        self.scheduler = AdaptiveRateScheduler(
+            min_fps=min_fps if min_fps is not None else Config.VISION_MIN_FPS,
+            max_fps=max_fps if max_fps is not None else Config.VISION_MAX_FPS,
+        )
+
+        # 움직임 게이트: 화면 변화가 없으면 이전 랜드마크 결과 재사용 (강제 갱신 주기 포함)
+        # 두 눈 주변은 따로 비교하고, 눈 감음이 진행 중이면 게이트를 건너뜀 (눈 깜빡임/PERCLOS 샘플 보존)
+        self.motion_gate_enabled = motion_gate if motion_gate is not None else Config.MOTION_GATE_ENABLED
+        self.motion_gate_eye_region = Config.MOTION_GATE_EYE_REGION
+        self.motion_gate = MotionGate(
+            changed_ratio=Config.MOTION_GATE_CHANGED_RATIO,
+            pixel_diff=Config.MOTION_GATE_PIXEL_DIFF,
+            refresh_seconds=Config.MOTION_GATE_REFRESH_SECONDS,
+        )
+        self._last_detection_result = None  # 움직임 게이트가 재사용할 마지막 랜드마크 결과
+        self._last_detection_roi = None  # 위 결과를 추론한 크롭 영역 (None이면 전체 프레임)
+
+        # 얼굴 ROI 크롭 + 추론 입력 해상도 단계 (측정된 추론 시간으로 선택)
+        self.roi_enabled = roi if roi is not None else Config.VISION_ROI_ENABLED
+        self.roi_tracker = FaceRoiTracker(margin=Config.VISION_ROI_MARGIN)
+        self.resolution_ladder = ResolutionLadder(
+            widths=input_widths if input_widths is not None else Config.VISION_INPUT_WIDTHS,
+            budget_ms=Config.VISION_INFERENCE_BUDGET_MS,
+        )
+
+        if preload:
+            self.start_loading()
+
+    @property
+    def is_ready(self):
+        """모델 로딩과 워밍업이 끝나 추론 가능한 상태인지"""
+        return self.model_state == "ready"
+
+    def start_loading(self):
+        """백그라운드 모델 로딩 시작 (이미 시작했으면 무시)"""
+        if self._loader_thread is not None:
+            return
+        self._loader_thread = threading.Thread(target=self._load_models, name="VisionModelLoader", daemon=True)
+        self._loader_thread.start()
+
+    def wait_until_ready(self, timeout=None):
+        """모델 로딩 완료까지 대기 - 추론 가능하면 True"""
+        self.start_loading()
+        self._models_ready.wait(timeout)
+        return self.is_ready
+
+    def _load_models(self):
+        """FaceLandmarker / Object Detector 생성 후 빈 프레임으로 워밍업 (로더 스레드)"""
+        t0 = time.perf_counter()
+        mode = self.running_mode
+        try:
+            try:
+                self.face_landmarker = self._create_face_landmarker(self._model_path, mode)
+            except Exception as e:
+                if mode == "IMAGE":
+                    raise
+                print(f"⚠️ FaceLandmarker {mode} 모드 초기화 실패, IMAGE 모드로 대체합니다: {e}")
+                mode = "IMAGE"
+                self.face_landmarker = self._create_face_landmarker(self._model_path, mode)
+            self.running_mode = mode
+            print(f"[OK] FaceLandmarker 초기화 완료 (running_mode={mode})")
+            self.phone_detector.load()
+            startup_timer.record("model_load", time.perf_counter() - t0)
+
+            t1 = time.perf_counter()
+            self._warm_up()
+            startup_timer.record("warm_up", time.perf_counter() - t1)
+            self.model_state = "ready"
+            startup_timer.mark("models_ready")
+        except Exception as e:
+            print(f"⚠️ FaceLandmarker 초기화 실패: {e}")
+            print("💡 모델 파일을 다운로드하거나 다른 방법을 시도해주세요.")
+            self.model_state = "failed"
+        finally:
+            self._models_ready.set()
+            self.models_ready_signal.emit(self.is_ready)
+
+    def _warm_up(self, shape=(480, 640, 3)):
+        """
+        빈 프레임으로 1회 추론해 그래프/델리게이트 초기화 비용을 미리 지불
+        결과와 타임스탬프 상태는 실제 프레임에 영향을 주지 않도록 정리한다.
+        """
+        blank = MPImage(image_format=ImageFormat.SRGB, data=np.zeros(shape, dtype=np.uint8))
+        if self.running_mode == "IMAGE":
+            self.face_landmarker.detect(blank)
+        elif self.running_mode == "VIDEO":
+            self.face_landmarker.detect_for_video(blank, self._next_timestamp_ms(0.0))
+        else:
+            self.face_landmarker.detect_async(blank, self._next_timestamp_ms(0.0))
+            deadline = time.perf_counter() + 5.0
+            while time.perf_counter() < deadline:
+                with self._result_lock:
+                    if self._latest_face_result is not None:
+                        break
+                time.sleep(0.01)
+            with self._result_lock:
+                self._latest_face_result = None
+                self._pending_submits.clear()
+
+    def close(self):
+        """모델 해제 (run() 종료 후 호출 - 인터프리터 종료 시점의 소멸자 대신 명시적으로 정리)"""
+        self.phone_detector.close()
+        if self.face_landmarker is not None:
+            self.face_landmarker.close()
+            self.face_landmarker = None
+
+    def _apply_thresholds(self, thresholds, reason):
+        """보정 임계값을 감지 로직에 적용"""
+        changes = []
+        for name, value in thresholds.items():
+            if name in self._default_thresholds:
+                setattr(self, name, value)
+                if value != self._default_thresholds[name]:
+                    changes.append(f"{name} {self._default_thresholds[name]} -> {value}")
+        print(f"[VISION] 사용자 보정 임계값 적용 ({reason}): {', '.join(changes) if changes else '기본값과 동일'}")
+
+    def recalibrate(self):
+        """저장된 보정 프로필을 버리고 기본 임계값으로 되돌린 뒤 다시 보정"""
+        for name, value in self._default_thresholds.items():
+            setattr(self, name, value)
+        self.calibrator.recalibrate()
+        print("[VISION] 사용자 임계값 보정을 다시 시작합니다.")
+
+    def set_debug_enabled(self, enabled):
+        """디버그 이미지 송출 on/off (디버그 창 표시 상태에 연동, 꺼져 있으면 비용 0)"""
+        self.show_debug_window = bool(enabled)
+        self._last_debug_emit = 0.0
+
+    @property
+    def current_fps(self):
+        """현재 실제 추론 FPS"""
+        return self.scheduler.effective_fps
+
+    def _create_face_landmarker(self, model_path, mode):
+        """실행 모드에 맞는 FaceLandmarker 생성"""
+        base_options = python.BaseOptions(model_asset_path=model_path)
+        extra = {}
+        if mode == "LIVE_STREAM":
+            extra["result_callback"] = self._on_face_result
         
-        # EAR 계산
-        if horizontal == 0:
-            return 0.0
-        ear = (vertical_1 + vertical_2) / (2.0 * horizontal)
-        return ear
+        options = vision.FaceLandmarkerOptions(
+            base_options=base_options,
+            output_face_blendshapes=False,
+            output_facial_transformation_matrixes=self.pose_backend == "matrix",
+            num_faces=1,
+            min_face_detection_confidence=0.5,
+            min_face_presence_confidence=0.5,
+            min_tracking_confidence=0.5,
+            running_mode=self.RUNNING_MODES[mode],
+            **extra
+        )
+        return vision.FaceLandmarker.create_from_options(options)
+
+    def _next_timestamp_ms(self, capture_ts):
+        """캡처 시각 기반 단조 증가 타임스탬프 (ms) - VIDEO/LIVE_STREAM 모드 요구사항"""
+        timestamp_ms = int(capture_ts * 1000)
+        if timestamp_ms <= self._last_timestamp_ms:
+            timestamp_ms = self._last_timestamp_ms + 1
+        self._last_timestamp_ms = timestamp_ms
+        return timestamp_ms
+
+    def _on_face_result(self, result, output_image, timestamp_ms):
+        """LIVE_STREAM 모드 결과 콜백 (MediaPipe 내부 스레드에서 호출됨)"""
+        now = time.perf_counter()
+        with self._result_lock:
+            # 이 결과보다 오래된 제출 기록은 MediaPipe가 드롭한 프레임
+            while self._pending_submits and self._pending_submits[0][0] < timestamp_ms:
+                self._pending_submits.popleft()
+                self.stats.incr("landmarker_dropped")
+            if self._pending_submits and self._pending_submits[0][0] == timestamp_ms:
+                _, submitted_at = self._pending_submits.popleft()
+                self.stats.record("landmarker", now - submitted_at)
+                self.resolution_ladder.record(now - submitted_at)
+            self._latest_face_result = result
+
+    def _detect_face(self, mp_image, capture_ts):
+        """
+        실행 모드별 얼굴 랜드마크 검출
+        - IMAGE/VIDEO: 동기 결과 반환
+        - LIVE_STREAM: 비동기 제출 후 가장 최근에 도착한 결과 반환 (아직 없으면 None)
+        """
+        if self.running_mode == "IMAGE":
+            t0 = time.perf_counter()
+            result = self.face_landmarker.detect(mp_image)
+            self.stats.record("landmarker", time.perf_counter() - t0)
+            return result
+
+        timestamp_ms = self._next_timestamp_ms(capture_ts)
+        if self.running_mode == "VIDEO":
+            t0 = time.perf_counter()
+            result = self.face_landmarker.detect_for_video(mp_image, timestamp_ms)
+            self.stats.record("landmarker", time.perf_counter() - t0)
+            return result
+
+        # LIVE_STREAM
+        t0 = time.perf_counter()
+        with self._result_lock:
+            self._pending_submits.append((timestamp_ms, t0))
+        self.face_landmarker.detect_async(mp_image, timestamp_ms)
+        self.stats.record("landmarker_submit", time.perf_counter() - t0)
+        with self._result_lock:
+            return self._latest_face_result
+
+    def _infer_landmarks(self, frame, capture_ts):
+        """
+        얼굴 ROI 크롭(있으면) -> 해상도 단계에 맞춰 축소 -> RGB 변환 -> 랜드마크 검출
+        크롭에서 얼굴을 놓치면 같은 프레임을 다시 검출한다.
+        - VIDEO: 추적 좌표는 직전 입력 이미지 기준이라 크롭이 바뀐 첫 프레임은 추적을 놓친다.
+                 추적이 끊긴 다음 호출은 새로 검출하므로 같은 크롭으로 한 번 더 시도
+        - 그래도 없으면 ROI를 버리고 전체 프레임으로 재검출
+        ROI는 동기 모드(IMAGE/VIDEO)에서만 사용 (LIVE_STREAM은 같은 프레임을 다시 검출할 수 없음)
+        :return: (결과, 결과를 추론한 크롭 영역) - LIVE_STREAM 첫 결과 전이면 (None, None)
+        """
+        roi = None
+        if self.roi_enabled and self.running_mode != "LIVE_STREAM":
+            roi = self.roi_tracker.crop_rect(frame.shape)
+        crop_retried = False
+        while True:
+            t0 = time.perf_counter()
+            region = frame if roi is None else frame[roi[1]:roi[3], roi[0]:roi[2]]
+            max_width = self.resolution_ladder.width
+            region_height, region_width = region.shape[:2]
+            if max_width is not None and region_width > max_width:
+                scaled_size = (max_width, max(1, round(region_height * max_width / region_width)))
+                scaled = self._scaled_pool.acquire((scaled_size[1], scaled_size[0], region.shape[2]))
+                region = cv2.resize(region, scaled_size, dst=scaled, interpolation=cv2.INTER_AREA)
+            # RGB 변환은 재사용 버퍼에 (MPImage가 내부로 복사하므로 바로 다음 프레임에 덮어써도 안전)
+            frame_rgb = cv2.cvtColor(region, cv2.COLOR_BGR2RGB, dst=self._rgb_pool.acquire(region.shape))
+            mp_image = MPImage(image_format=ImageFormat.SRGB, data=frame_rgb)
+            t1 = time.perf_counter()
+            self.stats.record("convert", t1 - t0)
+
+            result = self._detect_face(mp_image, capture_ts)
+            if self.running_mode != "LIVE_STREAM":
+                self.resolution_ladder.record(time.perf_counter() - t0)
+            if roi is not None:
+                self.stats.incr("roi_inferences")
+            if result is None or result.face_landmarks or roi is None:
+                return result, roi
+            if self.running_mode == "VIDEO" and not crop_retried:
+                crop_retried = True
+                self.stats.incr("roi_retries")
+                continue
+            # 크롭에서 얼굴을 놓침 -> ROI를 버리고 같은 프레임을 전체 프레임으로 재검출
+            self.roi_tracker.reset()
+            self.stats.incr("roi_fallbacks")
+            roi = None
+
+    def register_detector(self, detector, interval=None, budget_ms=None):
+        """
+        감지기 플러그인 등록 (캡처/추론 루프 수정 없이 새 감지 추가)
+        :param interval: 최소 실행 간격 (초) - 생략하면 Config.VISION_DETECTOR_INTERVALS[name] 또는 감지기 기본값
+        :param budget_ms: 1회 실행 비용 예산 - 생략하면 감지기 기본값 또는 Config.VISION_DETECTOR_BUDGET_MS
+        """
+        if interval is None:
+            interval = Config.VISION_DETECTOR_INTERVALS.get(detector.name)
+        return self.detectors.register(detector, interval=interval, budget_ms=budget_ms)
     
-    def should_alert(self, event_type, cooldown_seconds=5):
-        """중복 알림 방지 (쿨다운)"""
-        current_time = time.time()
-        last_time = self.last_alert_time.get(event_type, 0)
+    def is_facing_screen(self, features):
+        """화면을 보고 있는지 판단 (pose 백엔드에 따라 볼 가시성 또는 평소 자세 대비 각도)"""
+        if features.pose_backend == "matrix":
+            return (abs(features.yaw - self.GAZE_YAW_BASELINE) <= self.GAZE_YAW_THRESHOLD
+                    and abs(features.pitch - self.GAZE_PITCH_BASELINE) <= self.GAZE_PITCH_THRESHOLD)
+        return self.has_cheeks_visible(features)
+
+    def has_cheeks_visible(self, features):
+        """볼(left/right cheek)이 실제로 보이는지 확인 (FaceFeatures의 z-depth 및 위치 특징 사용)"""
+        # 방법 1: z-depth 차이 확인 (가장 신뢰할 만한 방법)
+        # 얼굴이 옆으로 돌아가면 한쪽 볼의 z 값이 다른 쪽보다 크게 차이남
+        z_diff = features.cheek_z_diff
+        
+        # z-depth 차이가 매우 작으면 (정면을 보고 있음) 무조건 통과
+        if z_diff < self.CHEEK_Z_DIFF_PASS_THRESHOLD:
+            return True
         
-        if current_time - last_time < cooldown_seconds:
+        # z-depth 차이가 크면 얼굴이 옆으로 돌아간 것으로 판단
+        if z_diff > self.CHEEK_Z_DEPTH_THRESHOLD:
             return False
         
-        self.last_alert_time[event_type] = current_time
-        return True
-    
-    def has_cheeks_visible(self, face_landmarks):
-        """볼(left/right cheek)이 실제로 보이는지 확인 (z-depth 및 위치 검증)"""
-        try:
-            # 랜드마크 인덱스 범위 확인
-            if (self.LEFT_CHEEK >= len(face_landmarks) or 
-                self.RIGHT_CHEEK >= len(face_landmarks) or
-                self.NOSE_TIP >= len(face_landmarks)):
-                return False
-            
-            # 볼과 코 랜드마크 추출
-            left_cheek = face_landmarks[self.LEFT_CHEEK]
-            right_cheek = face_landmarks[self.RIGHT_CHEEK]
-            nose_tip = face_landmarks[self.NOSE_TIP]
-            
-            # z-depth 추출 (있으면 사용, 없으면 0)
-            def get_z(landmark):
-                return getattr(landmark, 'z', 0.0)
-            
-            left_cheek_z = get_z(left_cheek)
-            right_cheek_z = get_z(right_cheek)
-            nose_z = get_z(nose_tip)
-            
-            # 방법 1: z-depth 차이 확인 (가장 신뢰할 만한 방법)
-            # 얼굴이 옆으로 돌아가면 한쪽 볼의 z 값이 다른 쪽보다 크게 차이남
-            z_diff = abs(left_cheek_z - right_cheek_z)
-            
-            # z-depth 차이가 매우 작으면 (정면을 보고 있음) 무조건 통과
-            if z_diff < self.CHEEK_Z_DIFF_PASS_THRESHOLD:
-                return True
-            
-            # z-depth 차이가 크면 얼굴이 옆으로 돌아간 것으로 판단
-            if z_diff > self.CHEEK_Z_DEPTH_THRESHOLD:
-                return False
-            
-            # 방법 2: 볼의 상대적 위치 확인 (보조 검증)
-            # 얼굴 중심(코)에서 볼까지의 거리 확인
-            nose_x, nose_y = nose_tip.x, nose_tip.y
-            left_cheek_x, left_cheek_y = left_cheek.x, left_cheek.y
-            right_cheek_x, right_cheek_y = right_cheek.x, right_cheek.y
-            
-            # 코에서 각 볼까지의 거리
-            left_distance = np.sqrt((left_cheek_x - nose_x)**2 + (left_cheek_y - nose_y)**2)
-            right_distance = np.sqrt((right_cheek_x - nose_x)**2 + (right_cheek_y - nose_y)**2)
-            
-            # 두 볼 사이의 거리
-            cheek_distance = np.sqrt((right_cheek_x - left_cheek_x)**2 + (right_cheek_y - left_cheek_y)**2)
-            
-            # 얼굴이 옆으로 돌아가면 볼 사이 거리가 줄어들거나, 한쪽 볼이 코에 가까워짐
-            # 정면을 볼 때는 두 볼이 코에서 비슷한 거리에 있어야 함
-            # 단, 거리가 너무 작으면 계산 오류 방지를 위해 스킵
-            if max(left_distance, right_distance) > 0.01:
-                distance_ratio = abs(left_distance - right_distance) / max(left_distance, right_distance)
-                
-                # 방법 1과 방법 2를 모두 통과해야 실패 (AND 조건)
-                # 즉, z-depth 차이도 크고 거리 비율도 크면 실패
-                # 민감도 낮춤: 더 큰 차이가 있어야 실패
-                if distance_ratio > self.CHEEK_POSITION_THRESHOLD and z_diff > self.CHEEK_Z_DEPTH_THRESHOLD * 0.7:
-                    # 두 조건을 모두 만족하면 얼굴이 옆으로 돌아간 것으로 판단
-                    return False
-            
-            # 방법 3: 볼의 z 값이 코보다 크게 차이나면 (얼굴이 옆으로 돌아감)
-            # 이 방법은 z-depth가 유효할 때만 사용
-            if abs(nose_z) > 0.001:  # nose_z가 유효한 경우만
-                left_z_diff = abs(left_cheek_z - nose_z)
-                right_z_diff = abs(right_cheek_z - nose_z)
-                
-                # 한쪽 볼의 z 값이 코와 크게 차이나고, 동시에 z-depth 차이도 크면 실패
-                # 민감도 낮춤: 더 큰 차이가 있어야 실패
-                if (left_z_diff > self.CHEEK_NOSE_Z_THRESHOLD or right_z_diff > self.CHEEK_NOSE_Z_THRESHOLD) and z_diff > self.CHEEK_Z_DEPTH_THRESHOLD * 0.7:
-                    return False
-            
-            # 모든 검증을 통과하면 양쪽 볼이 보이는 것으로 판단
-            return True
-            
-        except (IndexError, AttributeError, ZeroDivisionError) as e:
+        # 방법 2: 볼의 상대적 위치 확인 (보조 검증)
+        # 정면을 볼 때는 두 볼이 코에서 비슷한 거리에 있어야 함
+        # z-depth 차이도 크고 거리 비율도 크면 얼굴이 옆으로 돌아간 것으로 판단 (AND 조건)
+        if (features.cheek_distance_valid
+                and features.cheek_distance_ratio > self.CHEEK_POSITION_THRESHOLD
+                and z_diff > self.CHEEK_Z_DEPTH_THRESHOLD * 0.7):
             return False
-    
-    def calculate_face_orientation(self, landmarks, frame_width, frame_height):
-        """얼굴 방향 계산 (pitch, yaw) - 기하학적 계산 기반"""
-        # 주요 얼굴 랜드마크 추출
-        nose_tip = landmarks[self.NOSE_TIP]
-        chin = landmarks[self.CHIN]
-        left_eye_inner = landmarks[self.LEFT_EYE_INNER]
-        left_eye_outer = landmarks[self.LEFT_EYE_OUTER]
-        right_eye_inner = landmarks[self.RIGHT_EYE_INNER]
-        right_eye_outer = landmarks[self.RIGHT_EYE_OUTER]
-        forehead = landmarks[self.FOREHEAD]
-        
-        # 2D 좌표 추출 (x, y만 사용 - 더 안정적)
-        def get_2d(landmark):
-            return np.array([landmark.x, landmark.y])
-        
-        nose_2d = get_2d(nose_tip)
-        chin_2d = get_2d(chin)
-        left_eye_inner_2d = get_2d(left_eye_inner)
-        left_eye_outer_2d = get_2d(left_eye_outer)
-        right_eye_inner_2d = get_2d(right_eye_inner)
-        right_eye_outer_2d = get_2d(right_eye_outer)
-        forehead_2d = get_2d(forehead)
-        
-        # 두 눈의 중심점 계산
-        left_eye_center_2d = (left_eye_inner_2d + left_eye_outer_2d) / 2
-        right_eye_center_2d = (right_eye_inner_2d + right_eye_outer_2d) / 2
-        eye_center_2d = (left_eye_center_2d + right_eye_center_2d) / 2
-        
-        # 두 눈 사이의 거리 (정규화된 좌표 기준)
-        eye_distance = np.linalg.norm(right_eye_center_2d - left_eye_center_2d)
-        
-        # 얼굴 높이 (이마에서 턱까지)
-        face_height = np.linalg.norm(chin_2d - forehead_2d)
         
-        # Yaw 계산 (좌우 회전) - 코가 두 눈 중심선에서 얼마나 벗어났는지
-        # 정면을 보면 코는 두 눈 중심선의 중앙에 있어야 함
-        eye_midpoint_x = eye_center_2d[0]
-        nose_x = nose_2d[0]
-        
-        # 코가 눈 중심선에서 벗어난 거리 (정규화)
-        if eye_distance > 0:
-            yaw_offset = (nose_x - eye_midpoint_x) / eye_distance
-            # 각도로 변환 (대략적인 변환: 정면 기준 ±30도 범위)
-            # yaw_offset이 0이면 정면, ±0.5면 약 30도 회전
-            yaw_degrees = yaw_offset * 60.0  # 스케일 조정
-        else:
-            yaw_degrees = 0.0
-        
-        # Pitch 계산 (상하 회전) - 코가 눈 중심선에서 얼마나 위아래로 벗어났는지
-        # 정면을 보면 코는 눈 중심선보다 약간 아래에 있어야 함
-        eye_midpoint_y = eye_center_2d[1]
-        nose_y = nose_2d[1]
-        
-        # 코가 눈 중심선보다 아래에 있으면 양수 (아래로 고개를 숙임)
-        # 코가 눈 중심선보다 위에 있으면 음수 (위로 고개를 듦)
-        if face_height > 0:
-            # 정면 기준으로 코는 눈보다 약간 아래에 있어야 함
-            # 정상적인 위치 차이를 보정
-            normal_nose_offset = 0.05  # 정면 기준 코의 정상 위치 (눈보다 약간 아래)
-            pitch_offset = (nose_y - eye_midpoint_y - normal_nose_offset) / face_height
-            # 각도로 변환
-            pitch_degrees = pitch_offset * 60.0  # 스케일 조정
-        else:
-            pitch_degrees = 0.0
+        # 방법 3: 볼의 z 값이 코보다 크게 차이나면 (얼굴이 옆으로 돌아감)
+        # 이 방법은 z-depth가 유효할 때만 사용
+        if abs(features.nose_z) > 0.001:
+            max_nose_z_diff = max(features.left_cheek_nose_z, features.right_cheek_nose_z)
+            if max_nose_z_diff > self.CHEEK_NOSE_Z_THRESHOLD and z_diff > self.CHEEK_Z_DEPTH_THRESHOLD * 0.7:
+                return False
         
-        return pitch_degrees, yaw_degrees
+        # 모든 검증을 통과하면 양쪽 볼이 보이는 것으로 판단
+        return True
     
-    def draw_debug_info(self, frame, face_landmarks, avg_ear, pitch, yaw, is_sleeping, is_absent, is_gaze_away, is_phone_detected=False, object_result=None):
-        """디버그 정보를 프레임에 그리기"""
+    def draw_debug_info(self, frame, features, is_sleeping, is_absent, is_gaze_away, is_phone_detected=False, object_result=None, bbox_scale=1.0):
+        """
+        디버그 정보를 프레임에 그리기 (특징 값은 FaceFeatures에서 읽기만 함)
+        :param bbox_scale: 원본 프레임 대비 frame 축소 비율 (휴대폰 바운딩 박스 픽셀 좌표 보정용)
+        """
         frame_height, frame_width = frame.shape[:2]
         
         # 상태 정보 텍스트
@@ -319,122 +511,100 @@ class VisionWorker(QThread):
         thickness = 2
         
         # 얼굴 감지 여부 표시
-        if face_landmarks:
+        if features is not None:
             # 얼굴이 감지됨
             cv2.putText(frame, "Face: DETECTED", (10, y_offset),
                        font, font_scale, (0, 255, 0), thickness)
             
+            # 정규화 좌표 -> 픽셀 좌표 (일괄 변환)
+            pixel_scale = np.array([frame_width, frame_height], dtype=np.float32)
+            
             # 눈 영역 그리기
-            for eye_indices in [self.LEFT_EYE_EAR, self.RIGHT_EYE_EAR]:
-                eye_points = []
-                for idx in eye_indices:
-                    if idx < len(face_landmarks):
-                        point = face_landmarks[idx]
-                        x = int(point.x * frame_width)
-                        y = int(point.y * frame_height)
-                        eye_points.append((x, y))
-                        cv2.circle(frame, (x, y), 2, (0, 255, 0), -1)
-                
+            eye_pixels = (features.points[EAR_INDICES, :2] * pixel_scale).astype(np.int32)  # (2, 6, 2)
+            for eye_points in eye_pixels:
+                for x, y in eye_points:
+                    cv2.circle(frame, (int(x), int(y)), 2, (0, 255, 0), -1)
                 # 눈 윤곽선 그리기
-                if len(eye_points) >= 4:
-                    pts = np.array(eye_points, np.int32)
-                    cv2.polylines(frame, [pts], True, (0, 255, 0), 1)
+                cv2.polylines(frame, [eye_points], True, (0, 255, 0), 1)
             
             # 볼 그리기 (GAZE_AWAY 감지용)
-            cheeks_visible = self.has_cheeks_visible(face_landmarks)
-            
-            # 왼쪽 볼
-            if self.LEFT_CHEEK < len(face_landmarks):
-                left_cheek = face_landmarks[self.LEFT_CHEEK]
-                x = int(left_cheek.x * frame_width)
-                y = int(left_cheek.y * frame_height)
-                cheek_color = (0, 255, 0) if cheeks_visible else (0, 165, 255)
-                cv2.circle(frame, (x, y), 6, cheek_color, -1)
-                cv2.putText(frame, "L", (x + 8, y), font, 0.5, cheek_color, 2)
-            
-            # 오른쪽 볼
-            if self.RIGHT_CHEEK < len(face_landmarks):
-                right_cheek = face_landmarks[self.RIGHT_CHEEK]
-                x = int(right_cheek.x * frame_width)
-                y = int(right_cheek.y * frame_height)
-                cheek_color = (0, 255, 0) if cheeks_visible else (0, 165, 255)
-                cv2.circle(frame, (x, y), 6, cheek_color, -1)
-                cv2.putText(frame, "R", (x + 8, y), font, 0.5, cheek_color, 2)
+            cheeks_visible = features.cheeks_visible
+            cheek_color = (0, 255, 0) if cheeks_visible else (0, 165, 255)
+            cheek_pixels = (features.points[CHEEK_INDICES, :2] * pixel_scale).astype(np.int32)
+            for (x, y), label in zip(cheek_pixels, ("L", "R")):
+                cv2.circle(frame, (int(x), int(y)), 6, cheek_color, -1)
+                cv2.putText(frame, label, (int(x) + 8, int(y)), font, 0.5, cheek_color, 2)
             
             y_offset += 25
             
-            # 볼 가시성 표시
-            cheek_status = "VISIBLE" if cheeks_visible else "NOT VISIBLE"
-            cheek_color = (0, 255, 0) if cheeks_visible else (0, 165, 255)
-            cv2.putText(frame, f"Cheeks: {cheek_status}", (10, y_offset),
-                       font, font_scale, cheek_color, thickness)
+            # 볼 가시성 (matrix 백엔드는 평소 자세 대비 각도) 표시
+            if features.pose_backend == "matrix":
+                cv2.putText(frame, f"Facing: {'YES' if cheeks_visible else 'NO'} "
+                           f"(base {self.GAZE_PITCH_BASELINE:.0f}/{self.GAZE_YAW_BASELINE:.0f}deg)",
+                           (10, y_offset), font, font_scale, cheek_color, thickness)
+            else:
+                cheek_status = "VISIBLE" if cheeks_visible else "NOT VISIBLE"
+                cv2.putText(frame, f"Cheeks: {cheek_status}", (10, y_offset),
+                           font, font_scale, cheek_color, thickness)
             y_offset += 25
             
             # 볼 z-depth 정보 표시 (디버그용)
-            if self.LEFT_CHEEK < len(face_landmarks) and self.RIGHT_CHEEK < len(face_landmarks) and self.NOSE_TIP < len(face_landmarks):
-                left_cheek = face_landmarks[self.LEFT_CHEEK]
-                right_cheek = face_landmarks[self.RIGHT_CHEEK]
-                nose_tip = face_landmarks[self.NOSE_TIP]
-                left_z = getattr(left_cheek, 'z', 0.0)
-                right_z = getattr(right_cheek, 'z', 0.0)
-                nose_z = getattr(nose_tip, 'z', 0.0)
-                z_diff = abs(left_z - right_z)
-                left_z_diff = abs(left_z - nose_z)
-                right_z_diff = abs(right_z - nose_z)
-                
-                # 코에서 각 볼까지의 거리
-                nose_x, nose_y = nose_tip.x, nose_tip.y
-                left_cheek_x, left_cheek_y = left_cheek.x, left_cheek.y
-                right_cheek_x, right_cheek_y = right_cheek.x, right_cheek.y
-                left_distance = np.sqrt((left_cheek_x - nose_x)**2 + (left_cheek_y - nose_y)**2)
-                right_distance = np.sqrt((right_cheek_x - nose_x)**2 + (right_cheek_y - nose_y)**2)
-                distance_ratio = abs(left_distance - right_distance) / max(left_distance, right_distance, 0.01) if max(left_distance, right_distance) > 0.01 else 0.0
-                
-                cv2.putText(frame, f"Z-diff: {z_diff:.3f} (th: {self.CHEEK_Z_DEPTH_THRESHOLD})", 
-                           (10, y_offset), font, font_scale * 0.7, (255, 255, 255), 1)
-                y_offset += 18
-                cv2.putText(frame, f"L-z: {left_z_diff:.3f}, R-z: {right_z_diff:.3f} (th: {self.CHEEK_NOSE_Z_THRESHOLD})", 
-                           (10, y_offset), font, font_scale * 0.7, (255, 255, 255), 1)
-                y_offset += 18
-                cv2.putText(frame, f"Dist-ratio: {distance_ratio:.3f} (th: {self.CHEEK_POSITION_THRESHOLD})", 
-                           (10, y_offset), font, font_scale * 0.7, (255, 255, 255), 1)
-                y_offset += 18
+            cv2.putText(frame, f"Z-diff: {features.cheek_z_diff:.3f} (th: {self.CHEEK_Z_DEPTH_THRESHOLD})", 
+                       (10, y_offset), font, font_scale * 0.7, (255, 255, 255), 1)
+            y_offset += 18
+            cv2.putText(frame, f"L-z: {features.left_cheek_nose_z:.3f}, R-z: {features.right_cheek_nose_z:.3f} (th: {self.CHEEK_NOSE_Z_THRESHOLD})", 
+                       (10, y_offset), font, font_scale * 0.7, (255, 255, 255), 1)
+            y_offset += 18
+            cv2.putText(frame, f"Dist-ratio: {features.cheek_distance_ratio:.3f} (th: {self.CHEEK_POSITION_THRESHOLD})", 
+                       (10, y_offset), font, font_scale * 0.7, (255, 255, 255), 1)
+            y_offset += 18
             
             # EAR 값
-            ear_color = (0, 255, 0) if avg_ear >= self.EAR_THRESHOLD else (0, 0, 255)
-            cv2.putText(frame, f"EAR: {avg_ear:.3f}", (10, y_offset), 
+            ear_color = (0, 255, 0) if features.avg_ear >= self.EAR_THRESHOLD else (0, 0, 255)
+            cv2.putText(frame, f"EAR: {features.avg_ear:.3f}", (10, y_offset), 
                        font, font_scale, ear_color, thickness)
             y_offset += 25
             
             # 얼굴 방향 (시선 벗어남 여부에 따라 색상 변경)
             gaze_color = (0, 255, 0) if not is_gaze_away else (0, 165, 255)  # 정상: 초록, 벗어남: 주황
-            cv2.putText(frame, f"Pitch: {pitch:.1f}deg, Yaw: {yaw:.1f}deg", (10, y_offset),
+            pose_text = f"Pitch: {features.pitch:.1f}deg, Yaw: {features.yaw:.1f}deg"
+            if features.pose_backend == "matrix":
+                pose_text += f", Roll: {features.roll:.1f}deg"
+            cv2.putText(frame, pose_text, (10, y_offset),
                        font, font_scale, gaze_color, thickness)
             y_offset += 25
             
-            # 시선 벗어남 프레임 수
+            # 시선 벗어남 지속 시간
             gaze_away_color = (255, 255, 255) if not is_gaze_away else (0, 165, 255)
-            cv2.putText(frame, f"Gaze Away Frames: {self.gaze_away_counter}/{self.GAZE_AWAY_CONSECUTIVE_FRAMES}", 
+            cv2.putText(frame, f"Gaze Away: {self.gaze_away_timer.duration:.1f}/{self.GAZE_AWAY_SECONDS:.0f}s", 
                        (10, y_offset), font, font_scale, gaze_away_color, thickness)
             y_offset += 25
             
-            # 눈 감음 프레임 수
-            cv2.putText(frame, f"Closed Frames: {self.eye_closed_counter}/{self.EAR_CONSECUTIVE_FRAMES}", 
+            # 눈 감음 지속 시간
+            cv2.putText(frame, f"Eyes Closed: {self.drowsiness.closure_duration:.1f}/{self.EYE_CLOSED_SECONDS:.0f}s", 
                        (10, y_offset), font, font_scale, (255, 255, 255), thickness)
             y_offset += 25
+
+            # 졸음 지표 (PERCLOS, 눈 깜빡임 빈도/평균 시간, 단계)
+            level = self.drowsiness.level
+            drowsy_color = (255, 255, 255) if level == DrowsinessLevel.AWAKE else (0, 165, 255)
+            cv2.putText(frame, f"PERCLOS: {self.drowsiness.perclos:.0%}  Blinks: {self.drowsiness.blink_rate:.0f}/min "
+                       f"({self.drowsiness.mean_blink_duration:.2f}s)  [{DrowsinessLevel.NAMES[level]}]",
+                       (10, y_offset), font, font_scale * 0.7, drowsy_color, 1)
+            y_offset += 20
         else:
             # 얼굴이 감지되지 않음
             cv2.putText(frame, "Face: NOT DETECTED", (10, y_offset),
                        font, font_scale, (0, 0, 255), thickness)
             y_offset += 25
             
-            # 얼굴 부재 프레임 수
-            cv2.putText(frame, f"No Face Frames: {self.no_face_counter}/{self.NO_FACE_CONSECUTIVE_FRAMES}", 
+            # 얼굴 부재 지속 시간
+            cv2.putText(frame, f"No Face: {self.no_face_timer.duration:.1f}/{self.NO_FACE_SECONDS:.0f}s", 
                        (10, y_offset), font, font_scale, (255, 255, 255), thickness)
             y_offset += 25
         
         # 휴대폰 감지 상태 표시
-        if hasattr(self, 'object_detector') and self.object_detector:
+        if self.phone_detector.available:
             phone_status = "DETECTED" if is_phone_detected else "NOT DETECTED"
             phone_status_color = (0, 0, 255) if is_phone_detected else (128, 128, 128)
             cv2.putText(frame, f"Phone: {phone_status}", (10, y_offset),
@@ -452,10 +622,10 @@ class VisionWorker(QThread):
                     if category.category_name == "cell phone" and category.score >= self.PHONE_SCORE_THRESHOLD:
                         # 바운딩 박스 좌표 추출
                         bbox = detection.bounding_box
-                        x = int(bbox.origin_x)
-                        y = int(bbox.origin_y)
-                        w = int(bbox.width)
-                        h = int(bbox.height)
+                        x = int(bbox.origin_x * bbox_scale)
+                        y = int(bbox.origin_y * bbox_scale)
+                        w = int(bbox.width * bbox_scale)
+                        h = int(bbox.height * bbox_scale)
                         
                         # 바운딩 박스 그리기 (빨간색)
                         box_color = (0, 0, 255) if is_phone_detected else (0, 165, 255)
@@ -465,7 +635,19 @@ class VisionWorker(QThread):
                         label = f"Phone: {category.score:.2f}"
                         cv2.putText(frame, label, (x, y - 10), font, 0.5, box_color, 2)
                         break
-        
+
+        # 얼굴 ROI 크롭 영역 (다음 추론에 쓸 영역, 회색) + 추론 입력 해상도
+        roi = self.roi_tracker.rect if self.roi_enabled else None
+        if roi is not None:
+            x0, y0, x1, y1 = (int(v * bbox_scale) for v in roi)
+            cv2.rectangle(frame, (x0, y0), (x1, y1), (160, 160, 160), 1)
+        input_width = self.resolution_ladder.width
+        cv2.putText(frame, f"Input: {'ROI' if roi is not None else 'full'} <= {input_width or 'native'}px",
+                   (10, frame_height - 10), font, font_scale * 0.7, (160, 160, 160), 1)
+        if self.calibration_enabled and not self.calibrator.calibrated:
+            cv2.putText(frame, f"Calibrating: {self.calibrator.progress:.0%} (EAR th {self.EAR_THRESHOLD:.3f})",
+                       (10, frame_height - 28), font, font_scale * 0.7, (0, 200, 255), 1)
+
         # 상태 표시 (항상 표시)
         if is_sleeping:
             cv2.putText(frame, "SLEEPING!", (10, y_offset),
@@ -486,213 +668,164 @@ class VisionWorker(QThread):
         
         return frame
 
-    def stop(self):
-        """작업 종료"""
-        self.running = False
-        self.wait()
+    def get_pipeline_stats(self):
+        """
+        파이프라인 성능 통계 반환
+        - stages: 단계별 지연 (capture, queue_wait, convert, landmarker, object_detector, features, decision, capture_to_decision)
+          LIVE_STREAM 모드의 landmarker는 제출~콜백 지연, landmarker_submit은 제출 호출 비용
+        - counters: frames_captured, frames_processed, dropped_frames, landmarker_skipped
+        - running_mode: FaceLandmarker 실행 모드
+        - target_fps / effective_fps: 스케줄러 목표 추론 FPS와 실제 측정 FPS
+        - motion_skip_ratio / landmarker_saved_per_hour: 움직임 게이트가 생략한 추론 비율과 시간당 절약 호출 수
+        - motion_eye_triggers: 전체 프레임은 그대로인데 두 눈 주변 변화로 추론한 횟수 (눈 깜빡임 등)
+        - calibration: 사용자별 임계값 보정 상태 (enabled, calibrated, progress)
+        - pose_backend: 얼굴 방향 계산 방식 (heuristic | matrix)
+        - detectors: 감지기별 활성 여부, 실행 간격/비용 예산, 실행 횟수와 비용 p50/p95
+        - input_width / roi: 현재 추론 입력 최대 너비 단계와 얼굴 ROI 크롭 영역 (None이면 전체 프레임)
+          (counters의 roi_inferences: 크롭 추론 횟수, roi_retries: VIDEO 추적 재시작을 위한 같은 크롭 재시도,
+           roi_fallbacks: 크롭에서 얼굴을 놓쳐 전체 프레임으로 재검출한 횟수)
+        - buffer_allocations: 프레임 버퍼 풀의 새 할당 횟수 (정상 상태에서는 증가하지 않음)
+        """
+        self.stats.set_counter("frames_captured", self.frame_buffer.frames_written)
+        self.stats.set_counter("dropped_frames", self.frame_buffer.dropped_frames)
+        snapshot = self.stats.snapshot()
+        snapshot["running_mode"] = self.running_mode
+        snapshot["target_fps"] = round(self.scheduler.target_fps, 1)
+        snapshot["effective_fps"] = round(self.scheduler.effective_fps, 1)
+        snapshot["motion_skip_ratio"] = round(self.motion_gate.skip_ratio, 3)
+        snapshot["landmarker_saved_per_hour"] = round(self.motion_gate.skipped_per_hour)
+        snapshot["motion_eye_triggers"] = self.motion_gate.focus_changes
+        snapshot["calibration"] = {
+            "enabled": self.calibration_enabled,
+            "calibrated": self.calibrator.calibrated,
+            "progress": round(self.calibrator.progress, 2),
+        }
+        snapshot["pose_backend"] = self.pose_backend
+        snapshot["detectors"] = self.detectors.snapshot()
+        snapshot["input_width"] = self.resolution_ladder.width
+        snapshot["roi"] = self.roi_tracker.rect if self.roi_enabled else None
+        snapshot["buffer_allocations"] = (
+            self.capture_pool.allocations + self._rgb_pool.allocations + self._debug_pool.allocations
+            + self._scaled_pool.allocations
+        )
+        return snapshot
+
+    def _on_camera_status(self, status, message):
+        """CameraSupervisor 상태 콜백 (캡처 스레드) -> UI 시그널"""
+        self.camera_status = status
+        self.camera_status_signal.emit(status, message)
+
+    def _capture_loop(self, source):
+        """
+        캡처 전용 스레드: 프레임 소스에서 계속 읽어 최신 프레임 버퍼에 기록
+        추론이 느려도 드라이버 버퍼에 프레임이 쌓이지 않도록 항상 비워준다.
+        웹캠은 CameraSupervisor를 거쳐 읽으므로 읽기 실패 시 대기/재연결하며 바쁜 대기를 하지 않는다.
+        녹화본(동영상/이미지 폴더)은 끝에 도달하면 워커를 종료한다.
+        """
+        reader = self._camera_supervisor or source
+        frame_shape = None  # 첫 프레임 이후 같은 크기 버퍼에 디코딩
+        while self.running:
+            t0 = time.perf_counter()
+            out = self.capture_pool.acquire(frame_shape) if frame_shape is not None else None
+            ret, frame, capture_ts = reader.read(out)
+            if not ret:
+                if not source.is_live:
+                    print(f"[OK] 프레임 소스 재생 완료: {source.description}")
+                    self.running = False
+                    self.frame_buffer.close()
+                    break
+                continue
+            frame_shape = frame.shape
+            self.stats.record("capture", time.perf_counter() - t0)
+            self.frame_buffer.put(frame, capture_ts)
 
     def run(self):
         self.running = True
-        cap = cv2.VideoCapture(0)
-        if not cap.isOpened():
-            print("[ERROR] 웹캠을 열 수 없습니다. 웹캠이 연결되어 있는지 확인하세요.")
+        # 모델 로딩이 끝나지 않았으면 대기 (종료 요청에 반응하도록 짧게 나눠서)
+        if not self._models_ready.is_set():
+            print("[VISION] 모델 로딩 완료 대기 중...")
+            self.start_loading()
+            while self.running and not self._models_ready.wait(0.1):
+                pass
+        if not self.is_ready:
+            if self.running:
+                print("[ERROR] 모델을 사용할 수 없어 Vision Worker를 시작하지 않습니다.")
+            self.running = False
+            return
+        source = open_frame_source(
+            self.source_spec,
+            realtime=True,
+            width=Config.CAMERA_WIDTH,
+            height=Config.CAMERA_HEIGHT,
+            fourcc=Config.CAMERA_FOURCC,
+            buffer_size=Config.CAMERA_BUFFER_SIZE,
+        )
+        if source.is_live:
+            # 웹캠: 처음 열기에 실패해도 종료하지 않고 백오프로 재시도 (나중에 연결해도 복구)
+            self._camera_supervisor = CameraSupervisor(
+                source,
+                on_status=self._on_camera_status,
+                failure_threshold=Config.CAMERA_FAILURE_THRESHOLD,
+                max_backoff=Config.CAMERA_MAX_BACKOFF,
+            )
+            self._on_camera_status(CameraStatus.CONNECTING, source.description)
+            if not self._camera_supervisor.open():
+                print("💡 웹캠이 연결되면 자동으로 다시 시도합니다.")
+        elif not source.open():
+            print(f"[ERROR] 프레임 소스를 열 수 없습니다: {source.description}")
             self.running = False
             return
         
-        print("[OK] 웹캠 연결 성공 - Vision Worker 시작")
+        print(f"[OK] 프레임 소스 준비 ({source.description}) - Vision Worker 시작")
+
+        # 캡처 스레드 시작 (추론 루프와 분리)
+        self.frame_buffer.reset()
+        self.stats.reset()
+        self.scheduler.reset()
+        self.motion_gate.reset()
+        self._last_detection_result = None
+        self._last_detection_roi = None
+        self.roi_tracker.reset()
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop, args=(source,), name="VisionCapture", daemon=True
+        )
+        self._capture_thread.start()
+        self.phone_detector.start()
+
+        last_seq = 0
+        last_stats_log = time.monotonic()
+        consecutive_errors = 0
         
         try:
             while self.running:
                 try:
-                    ret, frame = cap.read()
-                    if not ret:
-                        print("[WARNING] 프레임을 읽을 수 없습니다")
+                    # 스케줄러 주기까지 대기 (종료 요청에 빠르게 반응하도록 최대 0.1초씩)
+                    delay = self.scheduler.time_until_next(time.perf_counter())
+                    if delay > 0:
+                        time.sleep(min(delay, 0.1))
                         continue
-                    
-                    # MediaPipe Face Landmarker 처리
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    mp_image = MPImage(image_format=ImageFormat.SRGB, data=frame_rgb)
-                    detection_result = self.face_landmarker.detect(mp_image)
-                    
-                    # 변수 초기화
-                    is_sleeping = False
-                    is_absent = False
-                    is_gaze_away = False
-                    is_phone_detected = False
-                    avg_ear = 0.0  # 기본값
-                    pitch, yaw = 0.0, 0.0  # 얼굴 방향 (각도, 도 단위)
-                    object_result = None  # Object Detection 결과
-                    
-                    # MediaPipe Object Detection 처리 (휴대폰 감지)
-                    if self.object_detector:
-                        try:
-                            object_result = self.object_detector.detect(mp_image)
-                            
-                            # 휴대폰 감지 확인 (발견하는 순간 바로 이벤트 발생)
-                            phone_detected = False
-                            if object_result.detections:
-                                for detection in object_result.detections:
-                                    # 카테고리가 "cell phone"이고 신뢰도가 임계값 이상인지 확인
-                                    for category in detection.categories:
-                                        if category.category_name == "cell phone" and category.score >= self.PHONE_SCORE_THRESHOLD:
-                                            phone_detected = True
-                                            break
-                                    if phone_detected:
-                                        break
-                            
-                            # 발견하는 순간 바로 이벤트 발생
-                            is_phone_detected = phone_detected
-                        except Exception as e:
-                            print(f"[WARNING] Object Detection 오류: {e}")
-                            object_result = None
-                    
-                    if detection_result.face_landmarks:
-                        # 얼굴이 감지됨 - 얼굴 부재 카운터 리셋
-                        self.no_face_counter = 0
-                        face_landmarks = detection_result.face_landmarks[0]  # 첫 번째 얼굴
-                        
-                        # 눈 감음 감지 (EAR 계산)
-                        left_ear = self.calculate_ear(face_landmarks, self.LEFT_EYE_EAR)
-                        right_ear = self.calculate_ear(face_landmarks, self.RIGHT_EYE_EAR)
-                        avg_ear = (left_ear + right_ear) / 2.0
-                        
-                        # 눈이 감겼는지 확인
-                        if avg_ear < self.EAR_THRESHOLD:
-                            # 눈이 감음 - 카운터 증가
-                            self.eye_closed_counter += 1
-                        else:
-                            # 눈이 열림 - 카운터 리셋
-                            self.eye_closed_counter = 0
-                        
-                        # 연속으로 눈을 감고 있으면 졸음 감지
-                        if self.eye_closed_counter >= self.EAR_CONSECUTIVE_FRAMES:
-                            is_sleeping = True
-                        
-                        # 얼굴 방향 계산 (디버그용) - 각도(도) 단위로 반환
-                        pitch_degrees, yaw_degrees = self.calculate_face_orientation(
-                            face_landmarks, frame.shape[1], frame.shape[0]
-                        )
-                        pitch, yaw = pitch_degrees, yaw_degrees
-                        
-                        # 시선 벗어남 감지 (볼 가시성 기준)
-                        cheeks_visible = self.has_cheeks_visible(face_landmarks)
-                        
-                        if not cheeks_visible:
-                            # 볼 중 하나라도 안 보이면 시선이 벗어난 것으로 판단
-                            self.gaze_away_counter += 1
-                        else:
-                            # 양쪽 볼이 모두 보이면 정상 범위 - 카운터 리셋
-                            self.gaze_away_counter = 0
-                        
-                        # 연속으로 볼이 안 보이면 GAZE_AWAY 감지
-                        if self.gaze_away_counter >= self.GAZE_AWAY_CONSECUTIVE_FRAMES:
-                            is_gaze_away = True
-                        
-                        # [복귀 감지 로직] 얼굴이 감지되었고, 이전에 자리비움 상태였다면 복귀 처리
-                        if self.is_in_absent_mode:
-                            absent_duration = time.time() - self.absent_start_time
-                            print(f"[VISION] User Returned! Absent duration: {absent_duration:.1f}s")
-                            
-                            # 복귀 패킷 전송 (쿨다운 없이 즉시 전송)
-                            packet = Packet(
-                                event=VisionEvents.USER_RETURNED,
-                                data={
-                                    "confidence": 1.0, 
-                                    "duration": int(absent_duration), # 초 단위
-                                },
-                                meta=PacketMeta(category=PacketCategory.VISION)
-                            )
-                            self.alert_signal.emit(packet)
-                            
-                            # 모드 리셋
-                            self.is_in_absent_mode = False
-
-                    else:
-                        # 얼굴이 감지되지 않음 - 얼굴 부재 카운터 증가
-                        self.no_face_counter += 1
-                        # 얼굴이 없으면 눈 감음 카운터와 시선 벗어남 카운터도 리셋
-                        self.eye_closed_counter = 0
-                        self.gaze_away_counter = 0
-                        
-                        # 얼굴이 일정 시간 동안 감지되지 않으면 부재 감지
-                        if self.no_face_counter >= self.NO_FACE_CONSECUTIVE_FRAMES:
-                            is_absent = True
-                    
-                    # 졸음 감지 시 Packet 발송
-                    if is_sleeping:
-                        if self.should_alert(VisionEvents.SLEEPING):
-                            packet = Packet(
-                                event=VisionEvents.SLEEPING,
-                                data={"confidence": 0.9, "ear": avg_ear},
-                                meta=PacketMeta(category=PacketCategory.VISION)
-                            )
-                            self.alert_signal.emit(packet)
-                    
-                    # 얼굴 부재 감지 시 Packet 발송
-                    if is_absent:
-                        # 자리비움 모드 진입 (최초 1회만 기록)
-                        if not self.is_in_absent_mode:
-                            self.is_in_absent_mode = True
-                            self.absent_start_time = time.time()
-                            print(f"[VISION] User Absent Mode Started")
-
-                        # 알림 전송 (쿨다운 적용 - 지속적인 알림 방지, 
-                        # 사용자가 '처음 잔소리, 계속 자리 비움시 잔소리는 그만'이라고 했으므로
-                        # should_alert의 쿨다운을 매우 길게 잡거나(예: 60초), 
-                        # Agent 측에서 ABSENT 처리 후 기억에 있으면 무시하도록 할 수 있음.
-                        # 여기서는 일단 20초마다 리마인드 패킷은 보내되, Agent가 무시하도록 유도)
-                        if self.should_alert(VisionEvents.ABSENT, cooldown_seconds=20):
-                            packet = Packet(
-                                event=VisionEvents.ABSENT,
-                                data={"confidence": 0.9, "duration": self.no_face_counter},
-                                meta=PacketMeta(category=PacketCategory.VISION)
-                            )
-                            self.alert_signal.emit(packet)
-                    
-                    # 시선 벗어남 감지 시 Packet 발송 (볼이 안 보임)
-                    if is_gaze_away:
-                        if self.should_alert(VisionEvents.GAZE_AWAY):
-                            packet = Packet(
-                                event=VisionEvents.GAZE_AWAY,
-                                data={
-                                    "confidence": 0.9, 
-                                    "reason": "cheek_not_visible",
-                                    "duration": self.gaze_away_counter
-                                },
-                                meta=PacketMeta(category=PacketCategory.VISION)
-                            )
-                            self.alert_signal.emit(packet)
-                    
-                    # 휴대폰 감지 시 Packet 발송 (발견하는 순간 바로 발송, 중복 방지용 쿨다운 적용)
-                    if is_phone_detected:
-                        if self.should_alert(VisionEvents.PHONE_DETECTED):
-                            packet = Packet(
-                                event=VisionEvents.PHONE_DETECTED,
-                                data={
-                                    "confidence": 0.9,
-                                    "detected": True
-                                },
-                                meta=PacketMeta(category=PacketCategory.VISION)
-                            )
-                            self.alert_signal.emit(packet)
-                    
-                    # 디버그 창 표시 (얼굴이 있든 없든 항상 표시)
-                    if self.show_debug_window:
-                        # 얼굴 랜드마크 추출
-                        face_landmarks_for_draw = None
-                        if detection_result.face_landmarks:
-                            face_landmarks_for_draw = detection_result.face_landmarks[0]
-                        
-                        debug_frame = self.draw_debug_info(
-                            frame.copy(), 
-                            face_landmarks_for_draw,
-                            avg_ear, pitch, yaw, is_sleeping, is_absent, is_gaze_away,
-                            is_phone_detected, object_result
+
+                    # 항상 가장 최신 프레임만 가져옴 (처리 중 들어온 이전 프레임은 버려짐)
+                    item = self.frame_buffer.get(last_seq, timeout=0.5)
+                    if item is None:
+                        continue
+                    last_seq, frame, capture_ts = item
+                    self.stats.record("queue_wait", time.perf_counter() - capture_ts)
+
+                    self.scheduler.mark_run(time.perf_counter())
+                    self.process_frame(frame, capture_ts)
+                    consecutive_errors = 0
+
+                    # 주기적으로 파이프라인 통계 출력
+                    if time.monotonic() - last_stats_log >= self.STATS_LOG_INTERVAL:
+                        last_stats_log = time.monotonic()
+                        self.get_pipeline_stats()
+                        print(
+                            f"[VISION] Pipeline ({self.running_mode}, "
+                            f"{self.scheduler.effective_fps:.1f}/{self.scheduler.target_fps:.1f} FPS, "
+                            f"motion skip {self.motion_gate.skip_ratio:.0%}): "
+                            f"{self.stats.format_summary()}"
                         )
-                        # OpenCV 창 대신 시그널 전송
-                        self.debug_frame_signal.emit(debug_frame)
-                    
-                    # time.sleep(0.05) # 0.1초 대기 (10 FPS)
                 
                 except Exception as e:
                     # 프레임 처리 중 예외 발생 시 로그 출력하고 계속 진행
@@ -700,6 +833,9 @@ class VisionWorker(QThread):
                     import traceback
                     traceback.print_exc()
                     # 예외 발생해도 루프는 계속 진행 (다음 프레임 처리)
+                    # 같은 오류가 반복될 때 CPU를 점유하지 않도록 연속 오류 횟수에 따라 대기 (최대 1초)
+                    consecutive_errors += 1
+                    time.sleep(min(0.05 * 2 ** (consecutive_errors - 1), 1.0))
                     continue
         
         except Exception as e:
@@ -710,12 +846,121 @@ class VisionWorker(QThread):
         finally:
             # 정리 작업은 항상 실행
             self.running = False
-            cap.release()
+            self.phone_detector.stop()
+            self.frame_buffer.close()
+            if self._camera_supervisor is not None:
+                self._camera_supervisor.stop()  # 재연결 대기 중인 캡처 스레드 깨우기
+            if self._capture_thread is not None:
+                self._capture_thread.join(timeout=2.0)
+                self._capture_thread = None
+            source.release()
+            self._camera_supervisor = None
             
             # 여기서 OpenCV 창 닫는 코드는 삭제 (UI에서 관리)
             print("[OK] Vision Worker 종료")
-    
-    def stop(self):
-        """스레드 종료"""
-        self.running = False
-        self.wait() # 스레드 종료 대기
\ No newline at end of file
+
+    def process_frame(self, frame, capture_ts, received_at=None):
+        """
+        프레임 1장 추론 및 상태 판단
+        :param frame: BGR 프레임 (OpenCV 포맷)
+        :param capture_ts: 캡처 시각 (초) - 상태 지속 시간 계산의 기준 시계
+        :param received_at: 프레임 수신 시각 (time.perf_counter 기준, 지연 측정용)
+                            생략하면 capture_ts 사용 - 오프라인 재생처럼 capture_ts가 미디어 시간일 때 지정
+        """
+        if received_at is None:
+            received_at = capture_ts
+        if not self._first_inference_marked:
+            self._first_inference_marked = True
+            startup_timer.mark("first_inference")
+        # 움직임 게이트: 마지막 추론 이후 화면 변화가 없으면 이전 랜드마크 결과 재사용
+        # 눈 감음이 진행 중이면 눈을 뜨는 순간을 놓치지 않도록 매 프레임 추론
+        run_landmarker = True
+        if self.motion_gate_enabled:
+            t0 = time.perf_counter()
+            run_landmarker = self.motion_gate.should_process(
+                frame, capture_ts,
+                force=self._last_detection_result is None or self.drowsiness.closure_active,
+            )
+            self.stats.record("motion_gate", time.perf_counter() - t0)
+
+        if run_landmarker:
+            # MediaPipe Face Landmarker 처리 (얼굴 ROI + 해상도 단계 적용)
+            detection_result, detection_roi = self._infer_landmarks(frame, capture_ts)
+            if detection_result is None:
+                # LIVE_STREAM 모드에서 첫 결과가 아직 도착하지 않음
+                return
+            self._last_detection_result = detection_result
+            self._last_detection_roi = detection_roi
+        else:
+            detection_result = self._last_detection_result
+            detection_roi = self._last_detection_roi
+            self.stats.incr("landmarker_skipped")
+        
+        features = None  # 프레임별 얼굴 특징 (감지 + 디버그 표시 공유)
+        
+        t_decision = time.perf_counter()
+        if detection_result.face_landmarks:
+            # 랜드마크 -> 특징 일괄 계산 (EAR, pitch/yaw, 볼 z-depth/거리 비율)
+            # 크롭에서 추론한 좌표는 전체 프레임 기준으로 되돌린 뒤 계산 (임계값은 전체 프레임 기준)
+            # matrix 백엔드: 각도는 변환 행렬에서 계산 (크롭 추론이면 크롭 중심 시선 기준 회전)
+            matrices = detection_result.facial_transformation_matrixes
+            features = self.feature_extractor.extract(
+                detection_result.face_landmarks[0],  # 첫 번째 얼굴
+                to_frame=lambda points: FaceRoiTracker.to_frame(points, detection_roi, frame.shape),
+                transformation_matrix=matrices[0] if matrices else None,
+            )
+            self.stats.record("features", time.perf_counter() - t_decision)
+        if run_landmarker and self.calibration_enabled and not self.calibrator.calibrated:
+            # 보정 중: 새로 추론한 프레임만 분포에 반영 (움직임 게이트로 재사용한 결과는 중복이므로 제외)
+            if features is not None:
+                thresholds = self.calibrator.update(features, capture_ts, self._default_thresholds)
+                if thresholds is not None:
+                    self._apply_thresholds(thresholds, f"보정 완료, 샘플 {self.calibrator.samples}개")
+            else:
+                self.calibrator.pause()
+        if run_landmarker and self.roi_enabled:
+            # 다음 프레임 크롭 영역 갱신 (얼굴을 놓쳤으면 전체 프레임 검출로 복귀)
+            self.roi_tracker.update(features.points if features is not None else None, frame.shape)
+        if run_landmarker and self.motion_gate_enabled and self.motion_gate_eye_region:
+            # 움직임 게이트 관심 영역: 이번에 추론한 프레임의 두 눈 주변
+            self.motion_gate.set_focus(
+                frame, eye_region(features.points, frame.shape) if features is not None else None
+            )
+
+        # 감지기 실행 (감지기별 주기/예산은 레지스트리가 관리) -> 상태 전이 Packet 발송
+        observation = FrameObservation(timestamp=capture_ts, features=features, fresh=run_landmarker)
+        for packet in self.detectors.run(observation):
+            self.alert_signal.emit(packet)
+        
+        # 추론 주기 조절: 조건이 쌓이는 중(아직 알림 전)인 감지기가 있으면 최대 속도
+        self.scheduler.update(self.detectors.building, capture_ts)
+
+        # 캡처 시점부터 판단 완료까지의 지연 (큐 대기 + 추론 + 판단)
+        now = time.perf_counter()
+        self.stats.record("decision", now - t_decision)
+        self.stats.record("capture_to_decision", now - received_at)
+        self.stats.incr("frames_processed")
+
+        # 디버그 창 표시 (창이 보일 때만, debug_stream_fps로 제한)
+        if self.show_debug_window and now - self._last_debug_emit >= 1.0 / self.debug_stream_fps:
+            self._last_debug_emit = now
+            # 축소 프레임에 그리기 (축소가 필요 없으면 원본 복사본) - 재사용 버퍼에 출력
+            frame_height, frame_width = frame.shape[:2]
+            scale = min(1.0, self.debug_stream_width / frame_width)
+            if scale < 1.0:
+                debug_size = (int(frame_width * scale), int(frame_height * scale))
+                debug_frame = self._debug_pool.acquire((debug_size[1], debug_size[0], frame.shape[2]))
+                cv2.resize(frame, debug_size, dst=debug_frame, interpolation=cv2.INTER_AREA)
+            else:
+                debug_frame = self._debug_pool.acquire(frame.shape)
+                np.copyto(debug_frame, frame)
+            _, _, object_result = self.phone_detector.get_state()
+            debug_frame = self.draw_debug_info(
+                debug_frame, 
+                features,
+                self.detectors.is_active("sleep"), self.detectors.is_active("absence"),
+                self.detectors.is_active("gaze"), self.detectors.is_active("phone"), object_result,
+                bbox_scale=scale
+            )
+            # 최신 슬롯에 기록 (GUI가 못 가져간 이전 프레임은 덮어써서 버림)
+            self.debug_frames.put(debug_frame, now)
@@ -0,0 +1,254 @@
+# client/services/vision_process.py
+"""
+프로세스 분리 Vision Worker
+
+VisionSensor(캡처 + MediaPipe 추론)를 별도 프로세스에서 실행하고, 메인 프로세스에는
+감지 결과(Packet JSON), 카메라 상태, 파이프라인 통계만 Pipe로 전달한다 (프레임은 보내지 않음).
+MediaPipe의 파이썬 측 작업이 UI 페인팅, LiveKit 이벤트 루프, 오디오 콜백과 GIL을 다투지 않게 된다.
+
+VisionProcessWorker는 VisionWorker와 같은 인터페이스를 제공한다:
+    alert_signal(Packet), camera_status_signal(str, str), models_ready_signal(bool), debug_frames,
+    set_debug_enabled, get_pipeline_stats, recalibrate, is_ready, wait_until_ready, start/stop/isRunning
+모델은 자식 프로세스 안에서 로딩되므로 wait_until_ready는 start() 이후에 의미가 있다.
+디버그 창이 보일 때만 축소된 디버그 이미지를 JPEG로 보내 debug_frames에 채운다.
+
+[메시지 형식] (튜플, 첫 원소가 종류)
+    자식 -> 부모: ("alert", packet_json) | ("camera", status, message) | ("stats", dict)
+                  | ("ready", ok) | ("debug", jpeg_bytes, timestamp) | ("exit",)
+    부모 -> 자식: ("stop",) | ("debug", enabled) | ("recalibrate",)
+"""
+
+import multiprocessing
+import threading
+import time
+
+import cv2
+import numpy as np
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from shared.protocol import Packet
+from client.services.frame_buffer import LatestFrameBuffer
+
+STATS_PUBLISH_INTERVAL = 1.0  # 자식 -> 부모 통계 전송 주기 (초)
+DEBUG_JPEG_QUALITY = 80
+STOP_TIMEOUT = 5.0  # 종료 요청 후 자식 프로세스가 끝나기를 기다리는 최대 시간 (초)
+
+
+def _vision_process_main(conn, worker_options, show_debug_window):
+    """자식 프로세스 진입점: VisionSensor를 이 프로세스의 메인 스레드에서 실행"""
+    # 자식 프로세스에서만 import (spawn 시 부모의 무거운 상태를 물려받지 않음)
+    from client.services.vision import VisionSensor
+
+    send_lock = threading.Lock()
+    stop_requested = threading.Event()
+    finished = threading.Event()
+
+    def send(message):
+        with send_lock:
+            try:
+                conn.send(message)
+            except (BrokenPipeError, EOFError, OSError):
+                # 부모가 사라짐 -> 종료
+                stop_requested.set()
+
+    # 시그널을 모두 연결한 뒤 모델 로딩 시작 (연결 전에 로딩이 끝나 ("ready", ok)를 놓치지 않도록)
+    preload = worker_options.pop("preload", True)
+    try:
+        worker = VisionSensor(show_debug_window=show_debug_window, preload=False, **worker_options)
+    except Exception as e:
+        print(f"[ERROR] Vision 프로세스 초기화 실패: {e}")
+        send(("exit",))
+        conn.close()
+        return
+
+    # 센서 시그널은 발생한 스레드에서 바로 호출됨 (이벤트 루프 불필요)
+    worker.alert_signal.connect(lambda packet: send(("alert", packet.to_json())))
+    worker.camera_status_signal.connect(lambda status, message: send(("camera", status, message)))
+    worker.models_ready_signal.connect(lambda ok: send(("ready", bool(ok))))
+    if preload:
+        worker.start_loading()
+
+    def publisher():
+        """명령 수신 + 통계/디버그 이미지 전송 (추론 루프와 분리)"""
+        last_stats = 0.0
+        last_debug_seq = 0
+        while not finished.is_set():
+            try:
+                if conn.poll(0.05):
+                    message = conn.recv()
+                    if message[0] == "stop":
+                        stop_requested.set()
+                    elif message[0] == "debug":
+                        worker.set_debug_enabled(message[1])
+                    elif message[0] == "recalibrate":
+                        worker.recalibrate()
+            except (EOFError, OSError):
+                stop_requested.set()
+            if stop_requested.is_set():
+                worker.running = False  # run() 시작 전에 요청이 와도 반영되도록 반복 설정
+                continue
+
+            now = time.monotonic()
+            if now - last_stats >= STATS_PUBLISH_INTERVAL:
+                last_stats = now
+                send(("stats", worker.get_pipeline_stats()))
+
+            if worker.show_debug_window:
+                item = worker.debug_frames.get(last_debug_seq, timeout=0)
+                if item is not None:
+                    last_debug_seq, frame, timestamp = item
+                    ok, jpeg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, DEBUG_JPEG_QUALITY])
+                    if ok:
+                        send(("debug", jpeg.tobytes(), timestamp))
+
+    publisher_thread = threading.Thread(target=publisher, name="VisionPublisher", daemon=True)
+    publisher_thread.start()
+    try:
+        if not stop_requested.is_set():
+            worker.run()
+    finally:
+        finished.set()
+        publisher_thread.join(timeout=1.0)
+        send(("stats", worker.get_pipeline_stats()))
+        send(("exit",))
+        conn.close()
+
+
+class VisionProcessWorker(QThread):
+    """VisionWorker를 자식 프로세스에서 실행하고 결과를 시그널로 중계 (VisionWorker 대체 가능)"""
+    alert_signal = pyqtSignal(object)  # Packet 객체를 보냄
+    camera_status_signal = pyqtSignal(str, str)  # (CameraStatus 값, 메시지)
+    models_ready_signal = pyqtSignal(bool)  # 자식 프로세스의 모델 로딩 완료 (성공 여부)
+
+    def __init__(self, show_debug_window=False, **worker_options):
+        """
+        :param worker_options: 자식 프로세스의 VisionSensor 생성 인자 (running_mode, source 등, pickle 가능해야 함)
+        """
+        super().__init__()
+        self.running = False
+        self.show_debug_window = show_debug_window
+        self.worker_options = worker_options
+        self.debug_frames = LatestFrameBuffer()  # 자식이 보낸 디버그 이미지 (DebugWindow가 폴링)
+        self._conn = None
+        self._send_lock = threading.Lock()
+        self._stop_requested = False
+        self._latest_stats = {}
+        self._models_ready = threading.Event()  # 자식이 ("ready", ok)를 보냈거나 준비 전에 종료됨
+        self._models_ok = False
+
+    @property
+    def is_ready(self):
+        """자식 프로세스의 모델 로딩과 워밍업이 끝나 추론 가능한 상태인지"""
+        return self._models_ok
+
+    def wait_until_ready(self, timeout=None):
+        """자식 프로세스의 모델 로딩 완료까지 대기 - 추론 가능하면 True (start() 이후 호출)"""
+        self._models_ready.wait(timeout)
+        return self.is_ready
+
+    def _set_ready(self, ok):
+        self._models_ok = bool(ok)
+        self._models_ready.set()
+        self.models_ready_signal.emit(self._models_ok)
+
+    def _send(self, message):
+        with self._send_lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.send(message)
+            except (BrokenPipeError, EOFError, OSError):
+                pass
+
+    def set_debug_enabled(self, enabled):
+        """디버그 이미지 송출 on/off (자식 프로세스에 전달)"""
+        self.show_debug_window = bool(enabled)
+        self._send(("debug", self.show_debug_window))
+
+    def recalibrate(self):
+        """사용자별 임계값 보정 다시 시작 (자식 프로세스에 전달)"""
+        self._send(("recalibrate",))
+
+    def get_pipeline_stats(self):
+        """자식 프로세스가 마지막으로 보낸 파이프라인 통계"""
+        stats = dict(self._latest_stats)
+        stats["isolated"] = True
+        return stats
+
+    def _handle(self, message):
+        kind = message[0]
+        if kind == "alert":
+            self.alert_signal.emit(Packet.from_json(message[1]))
+        elif kind == "camera":
+            self.camera_status_signal.emit(message[1], message[2])
+        elif kind == "stats":
+            self._latest_stats = message[1]
+        elif kind == "ready":
+            self._set_ready(message[1])
+        elif kind == "debug":
+            frame = cv2.imdecode(np.frombuffer(message[1], dtype=np.uint8), cv2.IMREAD_COLOR)
+            if frame is not None:
+                self.debug_frames.put(frame, message[2])
+        return kind != "exit"
+
+    def run(self):
+        self.running = True
+        self._models_ok = False
+        self._models_ready.clear()
+        # spawn: 모든 OS에서 동일하게 동작하고, 부모의 Qt/오디오 스레드 상태를 복제하지 않음
+        ctx = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = ctx.Pipe()
+        process = ctx.Process(
+            target=_vision_process_main,
+            args=(child_conn, self.worker_options, self.show_debug_window),
+            name="VisionProcess",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        with self._send_lock:
+            self._conn = parent_conn
+        # 프로세스 시작 전에 바뀐 디버그 표시 상태 / 종료 요청 반영
+        self._send(("debug", self.show_debug_window))
+        if self._stop_requested:
+            self._send(("stop",))
+        print(f"[OK] Vision 프로세스 시작 (pid={process.pid})")
+
+        stop_deadline = None
+        try:
+            while True:
+                if self._stop_requested and stop_deadline is None:
+                    stop_deadline = time.monotonic() + STOP_TIMEOUT
+                if stop_deadline is not None and time.monotonic() > stop_deadline:
+                    print("[WARNING] Vision 프로세스가 응답하지 않아 강제 종료합니다")
+                    break
+                if not parent_conn.poll(0.1):
+                    if not process.is_alive():
+                        break
+                    continue
+                try:
+                    message = parent_conn.recv()
+                except (EOFError, OSError):
+                    break
+                if not self._handle(message):
+                    break
+        finally:
+            if not self._models_ready.is_set():
+                # 모델 준비 전에 자식이 끝남 (초기화 실패 등) - 대기 중인 쪽이 막히지 않도록 실패로 알림
+                self._set_ready(False)
+            self.running = False
+            self._stop_requested = False
+            with self._send_lock:
+                self._conn = None
+            parent_conn.close()
+            process.join(timeout=2.0)
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=1.0)
+            print("[OK] Vision 프로세스 종료")
+
+    def stop(self):
+        """자식 프로세스 종료 요청 후 대기"""
+        self._stop_requested = True
+        self._send(("stop",))
+        self.wait()
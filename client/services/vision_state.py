@@ -0,0 +1,45 @@
+# client/services/vision_state.py
+"""
+Vision 상태 추적 유틸리티
+
+프레임 수가 아닌 프레임 타임스탬프(초) 기준으로 조건 지속 시간을 추적한다.
+카메라 FPS나 추론 주기가 바뀌어도 SLEEPING/ABSENT/GAZE_AWAY 판단 시점이 동일하게 유지된다.
+"""
+
+
+class ConditionTimer:
+    """조건이 연속으로 유지된 시간(초) 추적"""
+
+    def __init__(self, threshold_seconds):
+        self.threshold_seconds = threshold_seconds
+        self.since = None  # 조건이 시작된 프레임 타임스탬프 (조건 비활성 시 None)
+        self.duration = 0.0  # 조건이 연속으로 유지된 시간 (초)
+
+    @property
+    def active(self):
+        """조건이 현재 유지 중인지 여부"""
+        return self.since is not None
+
+    @property
+    def triggered(self):
+        """조건이 임계 시간 이상 유지되었는지 여부"""
+        return self.since is not None and self.duration >= self.threshold_seconds
+
+    def update(self, active, timestamp):
+        """
+        프레임 결과 반영
+        :param active: 이번 프레임에서 조건 충족 여부
+        :param timestamp: 프레임 타임스탬프 (초, 단조 증가)
+        :return: 현재 연속 유지 시간 (초)
+        """
+        if not active:
+            self.reset()
+            return 0.0
+        if self.since is None:
+            self.since = timestamp
+        self.duration = max(0.0, timestamp - self.since)
+        return self.duration
+
+    def reset(self):
+        self.since = None
+        self.duration = 0.0
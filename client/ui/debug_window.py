@@ -1,33 +1,39 @@
 """
 디버그 윈도우 모듈
-VisionWorker로부터 받은 OpenCV 이미지를 표시합니다.
+VisionWorker가 최신 프레임 슬롯에 기록한 OpenCV 이미지를 표시합니다.
 """
 
-import cv2
-import numpy as np
 from PyQt6.QtWidgets import QMainWindow, QLabel, QVBoxLayout, QWidget, QSizePolicy
 from PyQt6.QtGui import QImage, QPixmap
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSize
 
 class DebugWindow(QMainWindow):
     """
     웹캠 영상을 표시하는 전용 디버그 윈도우.
     VisionWorker로부터 받은 이미지를 표시만 담당.
+    창이 보일 때만 영상을 받도록 visibility_changed 시그널로 표시 상태를 알림.
+
+    프레임은 시그널 큐로 받지 않고, 창이 보이는 동안 자체 타이머로 최신 프레임 슬롯을 폴링한다.
+    GUI가 밀려도 이전 프레임은 슬롯에서 덮어써져 버려지므로 쌓이지 않는다.
     """
+    visibility_changed = pyqtSignal(bool)  # True: 표시됨, False: 숨겨짐
+
+    REFRESH_INTERVAL_MS = 33  # 최신 프레임 폴링 주기 (약 30Hz)
+
     def __init__(self):
         super().__init__()
 
         self.setWindowTitle("ProcrastiHator - Vision Debug")
         self.setGeometry(100, 100, 800, 600)
-        
+
         # 중앙 위젯 설정
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
-        
+
         # 레이아웃
         layout = QVBoxLayout(central_widget)
         layout.setContentsMargins(0, 0, 0, 0)
-        
+
         # 비디오 표시용 라벨
         self.video_label = QLabel()
         self.video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -35,37 +41,99 @@ class DebugWindow(QMainWindow):
         # 기본 텍스트
         self.video_label.setText("Waiting for video stream...")
         self.video_label.setStyleSheet("background-color: #222; color: #aaa; font-size: 20px;")
-        
+
         layout.addWidget(self.video_label)
 
+        # 최신 프레임 슬롯 (LatestFrameBuffer) 및 폴링 타이머
+        self._frame_source = None
+        self._last_seq = 0
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self._poll_frame)
+
+        # 스케일 결과 크기 캐시 (창 크기 또는 프레임 크기가 바뀔 때만 다시 계산)
+        self._frame_size = None
+        self._target_size = None
+
+    def set_frame_source(self, frame_source):
+        """VisionWorker의 디버그 프레임 슬롯(LatestFrameBuffer) 연결"""
+        self._frame_source = frame_source
+        self._last_seq = 0
+
+    def _poll_frame(self):
+        """타이머 콜백: 새 프레임이 있을 때만 표시 (대기하지 않음)"""
+        if self._frame_source is None:
+            return
+        item = self._frame_source.get(self._last_seq, timeout=0)
+        if item is None:
+            return
+        self._last_seq, frame, _ = item
+        self.update_image(frame)
+
+    def set_camera_status(self, status, message):
+        """
+        VisionWorker.camera_status_signal 슬롯: 카메라를 쓸 수 없으면 마지막 프레임 대신 안내 문구 표시
+        :param status: CameraStatus 값 ("connecting" | "available" | "unavailable")
+        """
+        if status == "available":
+            if self.video_label.pixmap() is None or self.video_label.pixmap().isNull():
+                self.video_label.setText("Waiting for video stream...")
+            return
+        self.video_label.clear()
+        if status == "unavailable":
+            self.video_label.setText(f"Camera unavailable\n{message}\n(retrying...)")
+        else:
+            self.video_label.setText("Connecting to camera...")
+
+    def _scaled_size(self, width, height):
+        """라벨 크기에 맞춘 (종횡비 유지) 표시 크기 - 크기 변경 시에만 재계산"""
+        if self._frame_size != (width, height) or self._target_size is None:
+            self._frame_size = (width, height)
+            self._target_size = QSize(width, height).scaled(
+                self.video_label.size(), Qt.AspectRatioMode.KeepAspectRatio
+            )
+        return self._target_size
+
     def update_image(self, frame_cv):
         """
-        VisionWorker로부터 받은 OpenCV 이미지(numpy array)를 화면에 표시
+        OpenCV 이미지(BGR numpy array)를 화면에 표시
+        색 변환 없이 BGR888 포맷으로 바로 감싸서 사용
         """
         if frame_cv is None:
             return
-        
+
         try:
-            # OpenCV 이미지를 QImage로 변환
-            # OpenCV는 BGR, PyQt는 RGB 사용하므로 변환 필요
-            rgb_image = cv2.cvtColor(frame_cv, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_image.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-            
-            # 라벨 크기에 맞춰 스케일링
-            scaled_pixmap = QPixmap.fromImage(qt_image).scaled(
-                self.video_label.size(), 
-                Qt.AspectRatioMode.KeepAspectRatio, 
-                Qt.TransformationMode.SmoothTransformation
-            )
-            
-            self.video_label.setPixmap(scaled_pixmap)
+            h, w = frame_cv.shape[:2]
+            # numpy 버퍼를 그대로 감싼 QImage (복사 없음, 아래 fromImage 전까지 frame_cv가 살아 있어야 함)
+            qt_image = QImage(frame_cv.data, w, h, frame_cv.strides[0], QImage.Format.Format_BGR888)
+
+            target_size = self._scaled_size(w, h)
+            if target_size.width() != w or target_size.height() != h:
+                qt_image = qt_image.scaled(
+                    target_size,
+                    Qt.AspectRatioMode.IgnoreAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+
+            self.video_label.setPixmap(QPixmap.fromImage(qt_image))
         except Exception as e:
             print(f"Debug Image Update Error: {e}")
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._target_size = None  # 다음 프레임에서 표시 크기 재계산
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._refresh_timer.start()
+        self.visibility_changed.emit(True)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._refresh_timer.stop()
+        self.visibility_changed.emit(False)
+
     def closeEvent(self, event):
         """창을 닫을 때 숨기기만 하고 완전히 끄지는 않음 (Main에서 관리)"""
         event.ignore()
         self.hide()
-
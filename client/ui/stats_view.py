@@ -157,6 +157,15 @@ class StatsSummaryWidget(_GreenBorderPanel):
             details_layout.addWidget(value_widget, row, 1)
             row += 1
 
+        # Time spent in distracting windows (screen dwell timeline)
+        lbl_name = QLabel("SCREEN PLAY TIME")
+        lbl_name.setStyleSheet("font-family: 'JetBrains Mono'; font-size: 14px; color: #00FF41;")
+        self.lbl_distracted_time = QLabel("00:00:00")
+        self.lbl_distracted_time.setStyleSheet("font-family: 'JetBrains Mono'; font-size: 16px; font-weight: bold; color: #00FF41;")
+        self.lbl_distracted_time.setAlignment(Qt.AlignmentFlag.AlignRight)
+        details_layout.addWidget(lbl_name, row, 0)
+        details_layout.addWidget(self.lbl_distracted_time, row, 1)
+
         layout.addWidget(details_container)
         layout.addStretch(1)
 
@@ -203,6 +212,9 @@ class StatsSummaryWidget(_GreenBorderPanel):
             count = counts.get(event_key, 0)
             widget.setText(f"{count}")
 
+        dwell = summary.get("dwell") or {}
+        self.lbl_distracted_time.setText(_format_duration_hhmmss(dwell.get("distracted_seconds", 0.0)))
+
 
 class StatsFeedbackWidget(_GreenBorderPanel):
     """
@@ -19,7 +19,7 @@ from PyQt6.QtCore import QCoreApplication
 # shared 폴더 import를 위한 경로 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from shared.protocol import Packet
-from client.services.screen import ScreenWorker
+from client.services.qt_workers import ScreenWorker
 
 def on_alert(packet: Packet):
     """이벤트 수신 핸들러"""
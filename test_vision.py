@@ -6,7 +6,7 @@ import sys
 import os
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QTimer
-from client.services.vision import VisionWorker
+from client.services.qt_workers import VisionWorker
 from shared.protocol import Packet
 
 def on_alert(packet: Packet):
@@ -23,9 +23,9 @@ def main():
     print("Vision Detection Service 테스트")
     print("=" * 50)
     print("웹캠을 확인하고 다음 동작을 테스트하세요:")
-    print("  1. 눈을 50초 이상 감고 있으면 SLEEPING 이벤트 발생")
-    print("  2. 얼굴을 화면 밖으로 50초 이상 이동하면 ABSENT 이벤트 발생")
-    print("  3. 시선을 다른 곳으로 50초 이상 돌리면 GAZE_AWAY 이벤트 발생")
+    print("  1. 눈을 10초 이상 감고 있으면 SLEEPING 이벤트 발생")
+    print("  2. 얼굴을 화면 밖으로 10초 이상 이동하면 ABSENT 이벤트 발생")
+    print("  3. 시선을 다른 곳으로 3초 이상 돌리면 GAZE_AWAY 이벤트 발생")
     print("  4. 휴대폰을 카메라 앞에 보이면 즉시 PHONE_DETECTED 이벤트 발생")
     print("  5. 디버그 창에서 'q' 키를 누르면 종료")
     print("  6. Ctrl+C로 종료")
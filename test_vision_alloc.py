@@ -0,0 +1,122 @@
+"""
+VisionSensor 프레임당 메모리 할당 테스트 (tracemalloc)
+웹캠 없이 실행됩니다. 녹화 영상 경로를 주면 그 영상을, 없으면 합성 프레임을 사용합니다.
+
+    python test_vision_alloc.py [recording.mp4]
+
+정상 상태(워밍업 이후)에서 프레임 1장을 처리하는 동안
+- 파이썬 힙 최대 증가량(peak)이 프레임 크기보다 훨씬 작고 (프레임 크기 버퍼를 새로 만들지 않음)
+- 프레임 버퍼 풀의 새 할당이 없으며
+- 누적 메모리가 늘지 않는지 확인합니다.
+MediaPipe 내부(C++) 할당은 tracemalloc에 잡히지 않으므로 측정 대상이 아닙니다.
+"""
+import sys
+import tracemalloc
+
+import cv2
+import numpy as np
+
+from client.services.frame_source import open_frame_source
+from client.services.vision import VisionSensor
+
+WARMUP_FRAMES = 30
+MEASURE_FRAMES = 120
+MAX_PEAK_RATIO = 0.1  # 프레임당 최대 증가량 허용치 (BGR 프레임 크기 대비)
+MAX_GROWTH_BYTES = 256 * 1024  # 측정 구간 전체 누적 증가 허용치
+
+
+def synthetic_frames(count, width=1280, height=720):
+    """움직이는 사각형이 있는 720p 합성 프레임"""
+    base = np.full((height, width, 3), 90, dtype=np.uint8)
+    for i in range(count):
+        frame = base.copy()
+        x = 100 + (i * 15) % (width - 300)
+        cv2.rectangle(frame, (x, 200), (x + 200, 500), (200, 180, 160), -1)
+        yield frame, i / 30.0
+
+
+def recorded_frames(path, count):
+    source = open_frame_source(path, realtime=False)
+    if not source.open():
+        raise RuntimeError(f"영상을 열 수 없습니다: {path}")
+    frames = []
+    for _ in range(count):
+        ok, frame, ts = source.read()
+        if not ok:
+            break
+        frames.append((frame, ts))
+    source.release()
+    return frames
+
+
+def main():
+    print("=" * 50)
+    print("VisionSensor 프레임당 메모리 할당 테스트")
+    print("=" * 50)
+
+    total = WARMUP_FRAMES + MEASURE_FRAMES
+    if len(sys.argv) > 1:
+        frames = recorded_frames(sys.argv[1], total)
+    else:
+        frames = list(synthetic_frames(total))
+    if len(frames) < total:
+        print(f"❌ 프레임이 부족합니다 ({len(frames)}/{total})")
+        return 1
+
+    # 움직임 게이트는 끄고 매 프레임 추론 + 디버그 이미지까지 그리는 최악 경로 측정
+    worker = VisionSensor(motion_gate=False)
+    if not worker.wait_until_ready():
+        print("❌ Vision 모델을 불러오지 못했습니다")
+        return 1
+    worker.set_debug_enabled(True)
+    worker.debug_stream_fps = 1000.0
+
+    # 캡처 스레드처럼 풀 버퍼에 프레임을 디코딩한 뒤 처리
+    def run_frame(frame, ts):
+        buf = worker.capture_pool.acquire(frame.shape)
+        np.copyto(buf, frame)
+        worker.process_frame(buf, ts)
+
+    for frame, ts in frames[:WARMUP_FRAMES]:
+        run_frame(frame, ts)
+
+    tracemalloc.start()
+    allocations_before = worker.get_pipeline_stats()["buffer_allocations"]
+    baseline = tracemalloc.get_traced_memory()[0]
+    peaks = []
+    for frame, ts in frames[WARMUP_FRAMES:]:
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        run_frame(frame, ts)
+        peaks.append(tracemalloc.get_traced_memory()[1] - start)
+    growth = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    new_allocations = worker.get_pipeline_stats()["buffer_allocations"] - allocations_before
+
+    frame_bytes = frames[0][0].nbytes
+    peaks.sort()
+    p50 = peaks[len(peaks) // 2]
+    worst = peaks[-1]
+    print(f"프레임 크기         : {frame_bytes / 1024:.0f} KB ({frames[0][0].shape[1]}x{frames[0][0].shape[0]})")
+    print(f"프레임당 peak 증가  : p50 {p50 / 1024:.1f} KB, max {worst / 1024:.1f} KB")
+    print(f"누적 증가           : {growth / 1024:.1f} KB ({MEASURE_FRAMES} frames)")
+    print(f"버퍼 풀 새 할당     : {new_allocations}")
+
+    failures = []
+    if worst > frame_bytes * MAX_PEAK_RATIO:
+        failures.append(f"프레임당 peak {worst} bytes > {frame_bytes * MAX_PEAK_RATIO:.0f} bytes")
+    if growth > MAX_GROWTH_BYTES:
+        failures.append(f"누적 증가 {growth} bytes > {MAX_GROWTH_BYTES} bytes")
+    if new_allocations:
+        failures.append(f"정상 상태에서 버퍼 풀 할당 {new_allocations}회")
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+    print("✅ 정상 상태 프레임 처리 중 프레임 크기 할당 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
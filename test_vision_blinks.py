@@ -0,0 +1,128 @@
+"""
+움직임 게이트 + 눈 깜빡임 집계 재생 테스트
+웹캠과 MediaPipe 모델 로딩 없이 실행됩니다.
+
+머리가 움직이지 않는 합성 얼굴 영상(30FPS)에 일정 간격으로 눈 깜빡임을 넣고
+VisionSensor.process_frame으로 재생합니다. 랜드마크 모델 대신 프레임의 눈 영역 밝기로
+눈을 뜬/감은 랜드마크를 만드는 결정적 랜드마커를 사용하므로, 게이트가 프레임을 건너뛰면
+그 프레임의 눈 상태는 졸음 지표에 들어가지 않습니다.
+
+    python test_vision_blinks.py
+
+- 게이트 꺼짐 (매 프레임 추론): 기준 깜빡임 수
+- 게이트 켜짐 (기본 설정, 두 눈 주변 비교): 기준과 같은 깜빡임 수 + 추론 생략은 유지
+- 게이트 켜짐, 두 눈 주변 비교 끔 (이전 동작): 깜빡임이 대부분 사라지는 것을 참고로 출력
+"""
+import sys
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from client.services.face_features import NUM_LANDMARKS, LEFT_EYE_EAR, RIGHT_EYE_EAR
+from client.services.vision import VisionSensor
+
+FPS = 30.0
+DURATION_SECONDS = 40.0
+BLINK_INTERVAL_SECONDS = 3.0
+BLINK_SECONDS = 0.2
+WIDTH, HEIGHT = 640, 480
+EYES = [(250, 200, 30, 10), (360, 200, 30, 10)]  # (x, y, w, h) 픽셀 - LEFT_EYE_EAR, RIGHT_EYE_EAR 순서
+SKIN = (160, 180, 200)
+PUPIL = (40, 40, 40)
+
+
+def blink_schedule():
+    """깜빡임 구간 [(시작, 끝)] - 첫 깜빡임은 게이트가 기준 프레임을 잡은 뒤"""
+    starts = np.arange(1.0, DURATION_SECONDS - 1.0, BLINK_INTERVAL_SECONDS)
+    return [(start, start + BLINK_SECONDS) for start in starts]
+
+
+def synthetic_frames():
+    """정지한 얼굴 + 눈 깜빡임 (센서 노이즈 포함)"""
+    rng = np.random.default_rng(0)
+    base = np.full((HEIGHT, WIDTH, 3), 120, dtype=np.uint8)
+    cv2.ellipse(base, (320, 240), (130, 170), 0, 0, 360, SKIN, -1)
+    blinks = blink_schedule()
+    for i in range(int(DURATION_SECONDS * FPS)):
+        ts = i / FPS
+        closed = any(start <= ts < end for start, end in blinks)
+        frame = base.copy()
+        for x, y, w, h in EYES:
+            cv2.rectangle(frame, (x, y), (x + w, y + h), SKIN if closed else PUPIL, -1)
+        noise = rng.integers(-3, 4, size=frame.shape, dtype=np.int16)
+        yield np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8), ts
+
+
+class EyeReadingLandmarker:
+    """프레임의 눈 영역 밝기로 눈을 뜬/감은 랜드마크를 만드는 결정적 랜드마커 (호출 횟수 기록)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, frame, capture_ts):
+        self.calls += 1
+        points = [SimpleNamespace(x=0.5, y=0.5, z=0.0) for _ in range(NUM_LANDMARKS)]
+        for (x, y, w, h), indices in zip(EYES, (LEFT_EYE_EAR, RIGHT_EYE_EAR)):
+            is_open = frame[y:y + h, x:x + w].mean() < 100
+            half = h / 2 if is_open else 0.5
+            cy = y + h / 2
+            # [바깥/안쪽 끝, 위1, 위2, 안쪽/바깥 끝, 아래2, 아래1]
+            for index, (px, py) in zip(indices, [
+                (x, cy), (x + w / 3, cy - half), (x + 2 * w / 3, cy - half),
+                (x + w, cy), (x + 2 * w / 3, cy + half), (x + w / 3, cy + half),
+            ]):
+                points[index] = SimpleNamespace(x=px / WIDTH, y=py / HEIGHT, z=0.0)
+        result = SimpleNamespace(face_landmarks=[points], facial_transformation_matrixes=None)
+        return result, None
+
+
+def replay(motion_gate, eye_region=True):
+    sensor = VisionSensor(motion_gate=motion_gate, preload=False, roi=False, calibration=False)
+    sensor.motion_gate_eye_region = eye_region
+    landmarker = EyeReadingLandmarker()
+    sensor._infer_landmarks = landmarker
+    for frame, ts in synthetic_frames():
+        sensor.process_frame(frame, ts)
+    monitor = sensor.drowsiness
+    blinks = round(monitor.blink_rate * min(monitor.window_seconds, monitor.observed_seconds) / 60.0)
+    return blinks, landmarker.calls, sensor.motion_gate.focus_changes
+
+
+def main():
+    print("=" * 50)
+    print("움직임 게이트 + 눈 깜빡임 집계 재생 테스트")
+    print("=" * 50)
+    frames = int(DURATION_SECONDS * FPS)
+    expected = len(blink_schedule())
+
+    results = {
+        "gate off": replay(motion_gate=False),
+        "gate on": replay(motion_gate=True),
+        "gate on, eye region off": replay(motion_gate=True, eye_region=False),
+    }
+    print(f"프레임 {frames}장, 넣은 깜빡임 {expected}회")
+    for name, (blinks, calls, eye_triggers) in results.items():
+        print(f"  {name:24s}: 깜빡임 {blinks:2d}회, 랜드마크 추론 {calls:4d}회 ({calls / frames:.0%}), "
+              f"눈 주변 변화로 추론 {eye_triggers}회")
+
+    failures = []
+    baseline = results["gate off"][0]
+    gated_blinks, gated_calls, _ = results["gate on"]
+    if baseline != expected:
+        failures.append(f"게이트 꺼짐 깜빡임 {baseline}회 != {expected}회 (테스트 영상 확인 필요)")
+    if gated_blinks != baseline:
+        failures.append(f"게이트 켜짐 깜빡임 {gated_blinks}회 != 기준 {baseline}회")
+    if gated_calls >= frames * 0.5:
+        failures.append(f"게이트 켜짐인데 추론을 거의 생략하지 않음 ({gated_calls}/{frames})")
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+    print("✅ 움직임 게이트가 켜져 있어도 눈 깜빡임이 모두 집계됨")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
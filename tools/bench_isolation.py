@@ -0,0 +1,230 @@
+"""
+Vision 프로세스 분리 효과 벤치마크
+
+같은 녹화 영상을 실시간 속도로 재생하며 VisionWorker(같은 프로세스 QThread)와
+VisionProcessWorker(별도 프로세스)를 차례로 실행하고, 메인 프로세스에서 다음을 측정한다.
+
+- UI 프레임 간격: 60Hz QTimer가 매 틱마다 오프스크린 QImage에 그리기 (p50/p95/max, 지연 프레임 수)
+- 오디오 콜백: 10ms 블록을 만드는 파이썬 스레드 (sounddevice 콜백 모사)
+  예정 시각보다 버퍼 여유(2블록 - 1블록)를 넘겨 늦으면 underrun으로 센다.
+  --real-audio를 주면 sounddevice OutputStream의 output_underflow 플래그를 센다 (오디오 장치 필요).
+
+[사용법]
+    python tools/bench_isolation.py recording.mp4
+    python tools/bench_isolation.py recording.mp4 --duration 20 --mode VIDEO --real-audio
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+# 프로젝트 루트 import (client/shared 패키지 사용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtGui import QImage, QPainter, QColor
+from PyQt6.QtWidgets import QApplication
+
+from client.services.qt_workers import VisionWorker
+from client.services.vision_process import VisionProcessWorker
+
+UI_INTERVAL_MS = 16
+AUDIO_BLOCK_SECONDS = 0.010
+AUDIO_BUFFER_BLOCKS = 2
+SAMPLE_RATE = 48000
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class UiPacer:
+    """60Hz 타이머로 오프스크린 이미지를 그리며 틱 간격 기록"""
+
+    def __init__(self):
+        self.image = QImage(800, 600, QImage.Format.Format_RGB32)
+        self.timer = QTimer()
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.setInterval(UI_INTERVAL_MS)
+        self.timer.timeout.connect(self._tick)
+        self.intervals = []
+        self._last = None
+        self._count = 0
+
+    def _tick(self):
+        now = time.perf_counter()
+        if self._last is not None:
+            self.intervals.append(now - self._last)
+        self._last = now
+        # 가벼운 페인팅 작업 (GIL을 잡는 파이썬 호출 포함)
+        self._count += 1
+        painter = QPainter(self.image)
+        painter.fillRect(self.image.rect(), QColor(30, 30, 30))
+        for i in range(20):
+            painter.fillRect((self._count * 7 + i * 35) % 760, i * 28, 40, 20, QColor(200, 120, 40))
+        painter.end()
+
+    def start(self):
+        self.intervals = []
+        self._last = None
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+
+class SimulatedAudio:
+    """sounddevice 콜백 모사: 블록 주기마다 깨어나 numpy로 블록 생성, 버퍼 여유를 넘긴 지연은 underrun"""
+
+    def __init__(self):
+        self.lateness = []
+        self.underruns = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._phase = 0.0
+
+    def _loop(self):
+        block = int(SAMPLE_RATE * AUDIO_BLOCK_SECONDS)
+        t = np.arange(block, dtype=np.float32) / SAMPLE_RATE
+        next_due = time.perf_counter() + AUDIO_BLOCK_SECONDS
+        while not self._stop.is_set():
+            delay = next_due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            started = time.perf_counter()
+            np.sin(2 * np.pi * 440.0 * (t + self._phase)).astype(np.float32)
+            self._phase += AUDIO_BLOCK_SECONDS
+            late = time.perf_counter() - next_due
+            self.lateness.append(max(0.0, late))
+            if late > AUDIO_BLOCK_SECONDS * (AUDIO_BUFFER_BLOCKS - 1):
+                self.underruns += 1
+                next_due = started  # 재생이 끊긴 뒤 다시 시작
+            next_due += AUDIO_BLOCK_SECONDS
+
+    def start(self):
+        self._stop.clear()
+        self.lateness = []
+        self.underruns = 0
+        self._thread = threading.Thread(target=self._loop, name="SimAudio", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class RealAudio:
+    """sounddevice OutputStream 콜백의 output_underflow 횟수"""
+
+    def __init__(self):
+        import sounddevice as sd
+        self._sd = sd
+        self.lateness = []
+        self.underruns = 0
+        self._stream = None
+
+    def _callback(self, outdata, frames, time_info, status):
+        if status.output_underflow:
+            self.underruns += 1
+        outdata.fill(0)
+
+    def start(self):
+        self.lateness = []
+        self.underruns = 0
+        self._stream = self._sd.OutputStream(
+            samplerate=SAMPLE_RATE, channels=1, blocksize=int(SAMPLE_RATE * AUDIO_BLOCK_SECONDS),
+            latency="low", callback=self._callback,
+        )
+        self._stream.start()
+
+    def stop(self):
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+
+def run_mode(app, worker, duration, audio):
+    """워커 1개를 duration초 동안 (또는 영상이 끝날 때까지) 실행하며 측정"""
+    alerts = []
+    worker.alert_signal.connect(lambda packet: alerts.append(packet.event))
+    pacer = UiPacer()
+
+    worker.start()
+    # 모델 로딩/프로세스 시작이 측정에 섞이지 않도록 첫 통계가 나올 때까지 대기
+    deadline = time.monotonic() + 30.0
+    while time.monotonic() < deadline and worker.isRunning():
+        app.processEvents()
+        if worker.get_pipeline_stats().get("counters", {}).get("frames_processed"):
+            break
+        time.sleep(0.01)
+
+    pacer.start()
+    audio.start()
+    end = time.monotonic() + duration
+    while time.monotonic() < end and worker.isRunning():
+        app.processEvents()
+        time.sleep(0.001)
+    audio.stop()
+    pacer.stop()
+    stats = worker.get_pipeline_stats()
+    worker.stop()
+    app.processEvents()
+
+    intervals_ms = [v * 1000.0 for v in pacer.intervals]
+    lateness_ms = [v * 1000.0 for v in audio.lateness]
+    return {
+        "ui_ticks": len(intervals_ms),
+        "ui_p50_ms": percentile(intervals_ms, 0.50),
+        "ui_p95_ms": percentile(intervals_ms, 0.95),
+        "ui_max_ms": max(intervals_ms) if intervals_ms else 0.0,
+        "ui_late": sum(1 for v in intervals_ms if v > UI_INTERVAL_MS * 2),
+        "audio_late_p95_ms": percentile(lateness_ms, 0.95),
+        "audio_late_max_ms": max(lateness_ms) if lateness_ms else 0.0,
+        "audio_underruns": audio.underruns,
+        "frames_processed": stats.get("counters", {}).get("frames_processed", 0),
+        "alerts": len(alerts),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vision process isolation benchmark")
+    parser.add_argument("source", help="실시간 속도로 재생할 동영상 파일 또는 이미지 폴더")
+    parser.add_argument("--duration", type=float, default=10.0, help="모드별 측정 시간 (초)")
+    parser.add_argument("--mode", choices=list(VisionWorker.RUNNING_MODES), default=None,
+                        help="FaceLandmarker 실행 모드")
+    parser.add_argument("--fps", type=float, default=30.0, help="고정 추론 FPS")
+    parser.add_argument("--real-audio", action="store_true", help="sounddevice 출력 스트림으로 underrun 측정")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    audio = RealAudio() if args.real_audio else SimulatedAudio()
+    # 최악 조건: 움직임 게이트를 끄고 적응형 주기 대신 최대 FPS로 고정
+    options = dict(source=args.source, running_mode=args.mode, motion_gate=False,
+                   min_fps=args.fps, max_fps=args.fps)
+
+    results = {}
+    print("[BENCH] in-process (QThread)...")
+    results["in-process"] = run_mode(app, VisionWorker(**options), args.duration, audio)
+    print("[BENCH] isolated (separate process)...")
+    results["isolated"] = run_mode(app, VisionProcessWorker(**options), args.duration, audio)
+
+    print()
+    print(f"{'mode':<12}{'frames':>8}{'ui p50':>9}{'ui p95':>9}{'ui max':>9}{'ui late':>9}"
+          f"{'au p95':>9}{'au max':>9}{'underrun':>10}")
+    for name, r in results.items():
+        print(f"{name:<12}{r['frames_processed']:>8}{r['ui_p50_ms']:>9.1f}{r['ui_p95_ms']:>9.1f}"
+              f"{r['ui_max_ms']:>9.1f}{r['ui_late']:>9}{r['audio_late_p95_ms']:>9.2f}"
+              f"{r['audio_late_max_ms']:>9.2f}{r['audio_underruns']:>10}")
+    print("(ms; ui late = 틱 간격 > 2x 목표, au = 오디오 블록 지연)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Screen 센서 처리량 벤치마크 (FakeScreenBackend)
+
+창 제목 타임라인을 빠른 속도로 재생하며 ScreenSensor 디스패처 경로를 측정한다.
+Windows/X11 없이 실행되므로 CI에서도 돌릴 수 있다.
+
+- 재생한 창 변경 수 대비 알림 / 디스패처 깨어남 / 묶여 처리된 알림 / WINDOW_CHANGE 패킷 수
+- 제목 변화 묶기: 같은 창 안의 변화(--churn)로 보내지 않은 수 (suppressed / superseded)
+- 처리량 (WINDOW_CHANGE/초), 창 확인 1회 지연 시간 (p50/p95), 프로세스 캐시 적중률과 lookup 지연 시간
+
+[사용법]
+    python tools/bench_screen.py                         # 합성 타임라인 5000개, 최대 속도 (알림 묶임)
+    python tools/bench_screen.py --lockstep              # 항목마다 창 확인까지 기다림 (창 확인 경로 최대 처리량)
+    python tools/bench_screen.py --count 2000 --interval 0.002 --speed 1
+    python tools/bench_screen.py --churn 5 --settle 0 --lockstep   # 탭마다 배지 변화 5번 -> suppressed
+    python tools/bench_screen.py --timeline titles.json  # [[초, 제목], [초, 제목, pid], ...]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+
+# 프로젝트 루트 import (client/shared 패키지 사용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from client.services.screen import ScreenSensor
+from client.services.screen_backends import FakeScreenBackend
+
+TAB_TITLES = [
+    "main.py - ProcrastiHator - Visual Studio Code",
+    "YouTube - Google Chrome",
+    "Pull requests · GitHub - Google Chrome",
+    "Netflix - Google Chrome",
+    "Terminal",
+    "Slack | general",
+]
+
+
+def synthetic_timeline(count, interval, churn=0):
+    """
+    탭 전환 모사: 제목을 돌아가며 바꾸고 (같은 제목 연속 없음) PID는 현재/부모 프로세스를 번갈아 사용
+    churn: 탭 전환마다 이어지는 같은 창 안의 제목 변화 수 ("(n) " 안 읽은 개수 배지)
+    """
+    pids = [os.getpid(), os.getppid()]
+    timeline = []
+    for i in range(count):
+        tab = i // (churn + 1)
+        badge = i % (churn + 1)
+        title = f"{TAB_TITLES[tab % len(TAB_TITLES)]} #{tab}"
+        if badge:
+            title = f"({badge}) {title}"
+        timeline.append((i * interval, title, pids[(tab // 3) % len(pids)]))
+    return timeline
+
+
+def run(backend, settle=None, verbose=False):
+    sensor = ScreenSensor(backend=backend)
+    if settle is not None and sensor.title_coalescer is not None:
+        sensor.title_coalescer.settle_delay = settle
+    packets = []
+    sensor.alert_signal.connect(packets.append)
+
+    start = time.perf_counter()
+    # 창 변경마다 찍히는 로그가 측정을 왜곡하지 않도록 기본은 버림
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(sys.stdout if verbose else devnull):
+        sensor.start()
+        sensor.wait()
+    elapsed = time.perf_counter() - start
+
+    stats = sensor.get_stats()
+    stats["replayed"] = backend.replayed
+    stats["packets"] = len(packets)
+    stats["elapsed_s"] = elapsed
+    stats["throughput_per_s"] = len(packets) / elapsed if elapsed > 0 else 0.0
+    return stats
+
+
+def print_report(stats):
+    counters, cache = stats["counters"], stats["process_cache"]
+    check = stats["window_check"] or {}
+    lookup = cache["lookup"] or {}
+    print("=" * 60)
+    print(f"Screen 센서 벤치마크 ({stats['backend']}/{stats['mode']}, {stats['elapsed_s']:.2f}초)")
+    print("=" * 60)
+    print(f"  재생한 창 변경      : {stats['replayed']}")
+    print(f"  알림 / 묶여 처리됨  : {counters['events']} / {counters['coalesced_events']}")
+    print(f"  디스패처 깨어남     : {counters['wakeups']} (폴링 {counters['polls']})")
+    print(f"  WINDOW_CHANGE 패킷  : {stats['packets']} ({stats['throughput_per_s']:.0f}/초)")
+    print(f"  묶여서 안 보냄      : 같은 창 {counters['suppressed']}, settle 전 밀려남 {counters['superseded']}")
+    print(f"  창 확인 지연        : p50 {check.get('p50_ms', 0.0):.3f}ms, p95 {check.get('p95_ms', 0.0):.3f}ms")
+    print(f"  프로세스 캐시       : 적중률 {cache['hit_rate']:.1%}, "
+          f"lookup p50 {lookup.get('p50_ms', 0.0):.3f}ms, p95 {lookup.get('p95_ms', 0.0):.3f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ScreenSensor throughput benchmark (fake backend)")
+    parser.add_argument("--timeline", default=None, help="JSON timeline file ([[seconds, title, pid?], ...])")
+    parser.add_argument("--count", type=int, default=5000, help="Synthetic timeline length")
+    parser.add_argument("--interval", type=float, default=0.001, help="Synthetic seconds between title changes")
+    parser.add_argument("--churn", type=int, default=0,
+                        help="Synthetic same-window title changes after each tab switch (unread badge)")
+    parser.add_argument("--settle", type=float, default=None,
+                        help="Title coalescing settle delay in seconds (default: Config.SCREEN_TITLE_SETTLE_SECONDS)")
+    parser.add_argument("--speed", type=float, default=0.0, help="Playback speed (0 = as fast as possible)")
+    parser.add_argument("--lockstep", action="store_true",
+                        help="Replay the next title only after the sensor has read the current one")
+    parser.add_argument("--verbose", action="store_true", help="Keep sensor logs")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    if args.timeline:
+        backend = FakeScreenBackend.from_file(args.timeline, speed=args.speed, lockstep=args.lockstep)
+    else:
+        backend = FakeScreenBackend(synthetic_timeline(args.count, args.interval, args.churn), speed=args.speed,
+                                    lockstep=args.lockstep)
+
+    stats = run(backend, settle=args.settle, verbose=args.verbose)
+    print_report(stats)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(stats, f, indent=2, ensure_ascii=False)
+        print(f"\n결과 저장: {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+"""
+VisionSensor 오프라인 재생 벤치마크 (Qt 없이 실행)
+
+녹화된 동영상(또는 이미지 폴더)을 웹캠 없이 최대 속도로 VisionSensor.process_frame에 통과시키고
+처리 FPS, 단계별 p50/p95 지연(decode, convert, landmarker, object_detector, features, decision),
+발생한 이벤트 타임라인(미디어 시간 기준)을 출력한다.
+
+[사용법]
+    python tools/bench_vision.py recording.mp4
+    python tools/bench_vision.py recording.mp4 --mode IMAGE --max-frames 300
+    python tools/bench_vision.py frames_dir/ --image-fps 15 --adaptive --json result.json
+    python tools/bench_vision.py recording.mp4 --tradeoff
+    python tools/bench_vision.py recording.mp4 --pose-compare
+
+--adaptive: 적응형 스케줄러를 미디어 시간 기준으로 적용 (실제 앱처럼 일부 프레임을 건너뜀)
+            생략하면 모든 프레임을 처리 (처리량 측정)
+--tradeoff: 얼굴 ROI 크롭 on/off x 추론 입력 너비 단계별로 같은 클립을 재생하고,
+            전체 프레임 원본 해상도 결과를 기준으로 정확도(얼굴 검출 일치율, 랜드마크 오차 NME,
+            EAR/yaw 오차)와 프레임당 추론 시간(변환 + 랜드마크, 재시도 포함)을 비교
+--pose-compare: 같은 클립을 pose 백엔드(heuristic / matrix)별로 재생하고 비용(랜드마크 + 특징 계산 p50)과
+                안정성(연속 프레임 간 yaw/pitch 변화량 - 정지한 얼굴에서 작을수록 떨림이 적음)을 비교
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+# 프로젝트 루트 import (client/shared 패키지 사용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from client.services.frame_source import open_frame_source
+from client.services.vision import VisionSensor
+from client.services.face_features import FaceFeatureExtractor, EAR_INDICES
+from client.config import Config
+
+REPORT_STAGES = ["decode", "motion_gate", "convert", "landmarker", "object_detector", "features", "decision", "capture_to_decision"]
+
+
+def run_benchmark(source_spec, mode=None, max_frames=None, adaptive=False, image_fps=10.0, motion_gate=None,
+                  roi=None, input_widths=None, record_landmarks=False, pose_backend=None):
+    """
+    클립 1개 재생 후 결과 dict 반환
+    - 상태 판단과 알림 쿨다운은 미디어 시간 기준이므로 재생 속도와 무관하게 이벤트 타임라인이 재현된다.
+    - 휴대폰 감지는 별도 스레드 대신 미디어 시간 기준 PHONE_DETECT_INTERVAL 주기로 동기 실행한다.
+    - record_landmarks: 처리한 프레임마다 전체 프레임 기준 랜드마크 사본(얼굴이 없으면 None)을 "landmarks"에,
+      얼굴 방향 (yaw, pitch, roll)을 "poses"에 담음
+    """
+    source = open_frame_source(source_spec, realtime=False, image_fps=image_fps)
+    if not source.open():
+        raise RuntimeError(f"프레임 소스를 열 수 없습니다: {source.description}")
+
+    # 사용자 보정 프로필은 쓰지 않음 (기본 임계값으로 재현 가능한 결과)
+    worker = VisionSensor(running_mode=mode, motion_gate=motion_gate, roi=roi, input_widths=input_widths,
+                          calibration=False, pose_backend=pose_backend)
+    if not worker.wait_until_ready():
+        raise RuntimeError("Vision 모델을 불러오지 못했습니다")
+    stats = worker.stats
+    phone = worker.phone_detector
+
+    landmarks = []
+    poses = []
+    frame_landmarks = [None]
+    frame_pose = [None]
+    if record_landmarks:
+        # 특징 계산 직전(전체 프레임 좌표로 복원된 뒤)의 랜드마크를 가로챔
+        extract = worker.feature_extractor.extract
+
+        def recording_extract(*args, **kwargs):
+            features = extract(*args, **kwargs)
+            if features is not None:
+                frame_landmarks[0] = features.points.copy()
+                frame_pose[0] = (features.yaw, features.pitch, features.roll)
+            return features
+
+        worker.feature_extractor.extract = recording_extract
+
+    events = []
+    current_ts = [0.0]
+
+    def on_alert(packet):
+        events.append({"t": round(current_ts[0], 2), "event": packet.event, "data": packet.data})
+
+    worker.alert_signal.connect(on_alert)
+
+    frames_read = 0
+    frames_skipped = 0
+    last_phone_check = None
+    frame_shape = None
+    media_end = 0.0
+    started = time.perf_counter()
+    try:
+        while max_frames is None or frames_read < max_frames:
+            t0 = time.perf_counter()
+            ok, frame, ts = source.read(
+                worker.capture_pool.acquire(frame_shape) if frame_shape is not None else None
+            )
+            if not ok:
+                break
+            frame_shape = frame.shape
+            stats.record("decode", time.perf_counter() - t0)
+            frames_read += 1
+            media_end = ts
+            current_ts[0] = ts
+
+            if adaptive:
+                if worker.scheduler.time_until_next(ts) > 0:
+                    frames_skipped += 1
+                    continue
+                worker.scheduler.mark_run(ts)
+
+            if phone.available and (last_phone_check is None
+                                    or ts - last_phone_check >= worker.PHONE_DETECT_INTERVAL):
+                last_phone_check = ts
+                phone.detect_frame(frame, ts)
+
+            frame_landmarks[0] = None
+            frame_pose[0] = None
+            worker.process_frame(frame, ts, received_at=time.perf_counter())
+            if record_landmarks:
+                landmarks.append(frame_landmarks[0])
+                poses.append(frame_pose[0])
+    finally:
+        elapsed = time.perf_counter() - started
+        source.release()
+
+    processed = stats.snapshot()["counters"].get("frames_processed", 0)
+    # 프레임당 추론 시간 (RGB 변환 + 랜드마크, ROI 재시도 포함)
+    inference_total = sum(stats.stage_summary(stage)["avg_ms"] * stats.stage_summary(stage)["count"]
+                          for stage in ("convert", "landmarker"))
+    result = {
+        "source": source.description,
+        "running_mode": worker.running_mode,
+        "pose_backend": worker.pose_backend,
+        "adaptive": adaptive,
+        "roi": worker.roi_enabled,
+        "input_widths": list(worker.resolution_ladder.widths),
+        "final_input_width": worker.resolution_ladder.width,
+        "frame_size": [frame_shape[1], frame_shape[0]] if frame_shape is not None else None,
+        "inference_ms_per_frame": round(inference_total / processed, 2) if processed else 0.0,
+        "frames_read": frames_read,
+        "frames_processed": processed,
+        "frames_skipped": frames_skipped,
+        "motion_gate": worker.motion_gate_enabled,
+        "motion_skip_ratio": round(worker.motion_gate.skip_ratio, 3),
+        "landmarker_saved_per_hour": round(worker.motion_gate.skipped_per_hour),
+        "wall_seconds": round(elapsed, 3),
+        "media_seconds": round(media_end, 3),
+        "processing_fps": round(processed / elapsed, 1) if elapsed > 0 else 0.0,
+        "read_fps": round(frames_read / elapsed, 1) if elapsed > 0 else 0.0,
+        "stages": {stage: stats.stage_summary(stage) for stage in REPORT_STAGES
+                   if stats.stage_summary(stage)["count"]},
+        "counters": stats.snapshot()["counters"],
+        "buffer_allocations": worker.get_pipeline_stats()["buffer_allocations"],
+        "detectors": worker.detectors.snapshot(),
+        "events": events,
+    }
+    if record_landmarks:
+        result["landmarks"] = landmarks
+        result["poses"] = poses
+    return result
+
+
+def compare_landmarks(reference, candidate, frame_size):
+    """
+    기준 실행 대비 정확도
+    - face_agreement: 얼굴 검출 여부가 기준과 같은 프레임 비율
+    - nme_pct: 둘 다 검출한 프레임의 평균 랜드마크 오차 / 기준 눈 사이 거리 (%)
+    - ear_mae / yaw_mae_deg: 같은 프레임의 EAR, yaw 절대 오차 평균
+    """
+    scale = np.array(frame_size, dtype=np.float32)
+    agree = 0
+    nme, ear_err, yaw_err = [], [], []
+    for ref, cand in zip(reference, candidate):
+        agree += (ref is None) == (cand is None)
+        if ref is None or cand is None:
+            continue
+        ref_px = ref[:, :2] * scale
+        cand_px = cand[:, :2] * scale
+        eye_outer = ref_px[EAR_INDICES[:, 0]]
+        inter_ocular = float(np.linalg.norm(eye_outer[0] - eye_outer[1]))
+        if inter_ocular <= 0:
+            continue
+        nme.append(float(np.linalg.norm(ref_px - cand_px, axis=1).mean()) / inter_ocular)
+        ref_features = FaceFeatureExtractor.compute(ref)
+        cand_features = FaceFeatureExtractor.compute(cand)
+        ear_err.append(abs(ref_features.avg_ear - cand_features.avg_ear))
+        yaw_err.append(abs(ref_features.yaw - cand_features.yaw))
+    frames = min(len(reference), len(candidate))
+    return {
+        "face_agreement": round(agree / frames, 3) if frames else 0.0,
+        "nme_pct": round(float(np.mean(nme)) * 100, 2) if nme else None,
+        "ear_mae": round(float(np.mean(ear_err)), 4) if ear_err else None,
+        "yaw_mae_deg": round(float(np.mean(yaw_err)), 2) if yaw_err else None,
+    }
+
+
+def run_tradeoff(source_spec, mode=None, max_frames=None, image_fps=10.0, widths=None):
+    """
+    얼굴 ROI on/off x 입력 너비 단계별 정확도/지연 비교 (움직임 게이트 off, 모든 프레임 추론)
+    기준: ROI off + 원본 해상도
+    """
+    widths = widths if widths is not None else Config.VISION_INPUT_WIDTHS
+    configs = [("full", False, ())]
+    configs += [(f"full@{w}", False, (w,)) for w in widths]
+    configs += [("roi", True, ())]
+    configs += [(f"roi@{w}", True, (w,)) for w in widths]
+
+    rows = []
+    reference = None
+    for name, roi, input_widths in configs:
+        print(f"[BENCH] {name}...")
+        result = run_benchmark(source_spec, mode=mode, max_frames=max_frames, image_fps=image_fps,
+                               motion_gate=False, roi=roi, input_widths=input_widths, record_landmarks=True)
+        if reference is None:
+            reference = result
+        accuracy = compare_landmarks(reference["landmarks"], result["landmarks"], reference["frame_size"])
+        counters = result["counters"]
+        rows.append({
+            "config": name,
+            "inference_ms_per_frame": result["inference_ms_per_frame"],
+            "landmarker_p50_ms": result["stages"].get("landmarker", {}).get("p50_ms", 0.0),
+            "processing_fps": result["processing_fps"],
+            "roi_inferences": counters.get("roi_inferences", 0),
+            "roi_fallbacks": counters.get("roi_fallbacks", 0),
+            "roi_retries": counters.get("roi_retries", 0),
+            **accuracy,
+        })
+    return {"source": reference["source"], "running_mode": reference["running_mode"],
+            "frame_size": reference["frame_size"], "rows": rows}
+
+
+def print_tradeoff(report):
+    def fmt(value, spec):
+        return "-" if value is None else format(value, spec)
+
+    print()
+    print(f"Source       : {report['source']} ({report['frame_size'][0]}x{report['frame_size'][1]})")
+    print(f"Running mode : {report['running_mode']}  (accuracy vs. 'full' = no ROI, native resolution)")
+    print()
+    print(f"{'config':<12}{'infer ms':>10}{'lm p50':>9}{'fps':>8}{'face agr':>10}{'NME %':>8}"
+          f"{'EAR err':>9}{'yaw err':>9}{'roi/fb/retry':>16}")
+    for row in report["rows"]:
+        roi_counts = f"{row['roi_inferences']}/{row['roi_fallbacks']}/{row['roi_retries']}"
+        print(f"{row['config']:<12}{row['inference_ms_per_frame']:>10.2f}{row['landmarker_p50_ms']:>9.2f}"
+              f"{row['processing_fps']:>8.1f}{row['face_agreement']:>10.1%}{fmt(row['nme_pct'], '.2f'):>8}"
+              f"{fmt(row['ear_mae'], '.4f'):>9}{fmt(row['yaw_mae_deg'], '.2f'):>9}{roi_counts:>16}")
+    print("(infer ms = 변환 + 랜드마크 / 처리 프레임, NME = 평균 랜드마크 오차 / 눈 사이 거리)")
+
+
+def pose_stability(poses):
+    """
+    얼굴 방향 시계열 안정성
+    - jitter_p50 / jitter_p95: 연속으로 검출된 프레임 간 각도 변화량 절댓값의 p50/p95 (도)
+    - std: 각도 표준편차 (도)
+    """
+    angles = np.array([pose for pose in poses if pose is not None], dtype=np.float64).reshape(-1, 3)
+    consecutive = [(a, b) for a, b in zip(poses, poses[1:]) if a is not None and b is not None]
+    deltas = np.abs(np.diff(np.array(consecutive, dtype=np.float64), axis=1)[:, 0]) if consecutive else None
+    stability = {}
+    for i, name in enumerate(("yaw", "pitch", "roll")):
+        stability[name] = {
+            "jitter_p50": round(float(np.percentile(deltas[:, i], 50)), 3) if deltas is not None else None,
+            "jitter_p95": round(float(np.percentile(deltas[:, i], 95)), 3) if deltas is not None else None,
+            "std": round(float(angles[:, i].std()), 3) if len(angles) else None,
+        }
+    return stability
+
+
+def run_pose_compare(source_spec, mode=None, max_frames=None, image_fps=10.0, roi=None, input_widths=None):
+    """pose 백엔드별 비용/안정성 비교 (움직임 게이트 off, 모든 프레임 추론)"""
+    rows = []
+    for backend in VisionSensor.POSE_BACKENDS:
+        print(f"[BENCH] pose {backend}...")
+        result = run_benchmark(source_spec, mode=mode, max_frames=max_frames, image_fps=image_fps,
+                               motion_gate=False, roi=roi, input_widths=input_widths,
+                               record_landmarks=True, pose_backend=backend)
+        stages = result["stages"]
+        rows.append({
+            "backend": backend,
+            "landmarker_p50_ms": stages.get("landmarker", {}).get("p50_ms", 0.0),
+            "features_p50_ms": stages.get("features", {}).get("p50_ms", 0.0),
+            "processing_fps": result["processing_fps"],
+            "faces": sum(pose is not None for pose in result["poses"]),
+            "stability": pose_stability(result["poses"]),
+            "gaze_away_events": sum(event["event"] == "GAZE_AWAY" for event in result["events"]),
+        })
+    return {"source": result["source"], "running_mode": result["running_mode"],
+            "frames": result["frames_processed"], "rows": rows}
+
+
+def print_pose_compare(report):
+    def fmt(value):
+        return "-" if value is None else f"{value:.2f}"
+
+    print()
+    print(f"Source       : {report['source']} ({report['frames']} frames, {report['running_mode']})")
+    print()
+    print(f"{'backend':<11}{'lm p50':>8}{'feat p50':>10}{'fps':>8}{'faces':>7}"
+          f"{'yaw jit p50/p95':>18}{'pitch jit p50/p95':>20}{'roll jit':>10}{'yaw std':>9}{'gaze evt':>10}")
+    for row in report["rows"]:
+        s = row["stability"]
+        print(f"{row['backend']:<11}{row['landmarker_p50_ms']:>8.2f}{row['features_p50_ms']:>10.3f}"
+              f"{row['processing_fps']:>8.1f}{row['faces']:>7}"
+              f"{fmt(s['yaw']['jitter_p50']) + '/' + fmt(s['yaw']['jitter_p95']):>18}"
+              f"{fmt(s['pitch']['jitter_p50']) + '/' + fmt(s['pitch']['jitter_p95']):>20}"
+              f"{fmt(s['roll']['jitter_p50']):>10}{fmt(s['yaw']['std']):>9}{row['gaze_away_events']:>10}")
+    print("(jit = 연속 프레임 간 각도 변화량 |Δ| (도), heuristic은 roll을 계산하지 않음)")
+
+
+def print_report(result):
+    print()
+    print(f"Source       : {result['source']}")
+    print(f"Running mode : {result['running_mode']}{' (adaptive)' if result['adaptive'] else ''}"
+          f", pose {result['pose_backend']}")
+    print(f"Frames       : {result['frames_processed']} processed / {result['frames_read']} read"
+          f" ({result['frames_skipped']} skipped)")
+    print(f"Duration     : {result['wall_seconds']:.2f}s wall for {result['media_seconds']:.2f}s of media")
+    print(f"Throughput   : {result['processing_fps']:.1f} FPS processed, {result['read_fps']:.1f} FPS read")
+    if result["motion_gate"]:
+        print(f"Motion gate  : {result['motion_skip_ratio']:.1%} landmarker calls skipped"
+              f" (~{result['landmarker_saved_per_hour']} saved per hour of media)")
+    counters = result["counters"]
+    print(f"Input        : ROI {'on' if result['roi'] else 'off'}"
+          f" ({counters.get('roi_inferences', 0)} crop inferences, {counters.get('roi_fallbacks', 0)} fallbacks),"
+          f" width ladder {result['input_widths'] or 'off'} -> {result['final_input_width'] or 'native'}"
+          f", {result['inference_ms_per_frame']:.2f} ms/frame")
+    print()
+    print(f"{'stage':<22}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'avg ms':>10}")
+    for stage, summary in result["stages"].items():
+        print(f"{stage:<22}{summary['count']:>8}{summary['p50_ms']:>10.2f}"
+              f"{summary['p95_ms']:>10.2f}{summary['avg_ms']:>10.2f}")
+    print()
+    print(f"{'detector':<22}{'runs':>8}{'p50 ms':>10}{'p95 ms':>10}{'budget':>10}  status")
+    for name, detector in result["detectors"].items():
+        status = "on" if detector["enabled"] else f"off: {detector['disabled_reason']}"
+        print(f"{name:<22}{detector['runs']:>8}{detector['p50_ms']:>10.3f}"
+              f"{detector['p95_ms']:>10.3f}{detector['budget_ms']:>10.2f}  {status}")
+    print()
+    print(f"Events ({len(result['events'])}):")
+    for event in result["events"]:
+        print(f"  {event['t']:>8.2f}s  {event['event']:<16} {event['data']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VisionSensor offline replay benchmark")
+    parser.add_argument("source", help="동영상 파일 또는 이미지 폴더 경로")
+    parser.add_argument("--mode", choices=list(VisionSensor.RUNNING_MODES), default=None,
+                        help="FaceLandmarker 실행 모드 (기본값: Config.VISION_RUNNING_MODE)")
+    parser.add_argument("--max-frames", type=int, default=None, help="최대 처리 프레임 수")
+    parser.add_argument("--adaptive", action="store_true", help="적응형 추론 주기 적용 (미디어 시간 기준)")
+    parser.add_argument("--no-motion-gate", action="store_true", help="움직임 게이트 비활성화 (모든 프레임 추론)")
+    parser.add_argument("--no-roi", action="store_true", help="얼굴 ROI 크롭 비활성화 (항상 전체 프레임)")
+    parser.add_argument("--input-widths", default=None,
+                        help="추론 입력 너비 단계 (쉼표 구분, 빈 문자열이면 축소 안 함, 기본값: Config)")
+    parser.add_argument("--tradeoff", action="store_true", help="ROI/입력 해상도별 정확도-지연 비교")
+    parser.add_argument("--pose-backend", choices=list(VisionSensor.POSE_BACKENDS), default=None,
+                        help="얼굴 방향 계산 방식 (기본값: Config.VISION_POSE_BACKEND)")
+    parser.add_argument("--pose-compare", action="store_true", help="pose 백엔드별 비용/안정성 비교")
+    parser.add_argument("--image-fps", type=float, default=10.0, help="이미지 폴더 재생 시 가정할 fps")
+    parser.add_argument("--json", dest="json_path", default=None, help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+    input_widths = None
+    if args.input_widths is not None:
+        input_widths = [int(w) for w in args.input_widths.split(",") if w.strip()]
+
+    if args.tradeoff:
+        result = run_tradeoff(args.source, mode=args.mode, max_frames=args.max_frames,
+                              image_fps=args.image_fps, widths=input_widths)
+        print_tradeoff(result)
+    elif args.pose_compare:
+        result = run_pose_compare(args.source, mode=args.mode, max_frames=args.max_frames,
+                                  image_fps=args.image_fps, roi=False if args.no_roi else None,
+                                  input_widths=input_widths)
+        print_pose_compare(result)
+    else:
+        result = run_benchmark(args.source, mode=args.mode, max_frames=args.max_frames,
+                               adaptive=args.adaptive, image_fps=args.image_fps,
+                               motion_gate=False if args.no_motion_gate else None,
+                               roi=False if args.no_roi else None, input_widths=input_widths,
+                               pose_backend=args.pose_backend)
+        print_report(result)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n[OK] 결과 저장: {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()